@@ -0,0 +1,98 @@
+/**
+ * Tests the REAL StorytellerOrchestrator.runArchivistCheck constraint merge.
+ *
+ * The merge indexes existing constraints by key once per Archivist run. These
+ * tests pin the merge rules that index must preserve: newer constraints replace
+ * older ones, immutable seed constraints are never overwritten, and a key that
+ * appears twice in one Archivist response is merged rather than duplicated.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { AnyObj, makeOrchestrator } from "./helpers/fixtures";
+
+const c = (key: string, value: string, timestamp: string, immutable?: boolean): AnyObj =>
+  ({ key, value, sceneNumber: 1, timestamp, ...(immutable ? { immutable } : {}) });
+
+async function merge(existing: AnyObj[], incoming: AnyObj[]): Promise<AnyObj[]> {
+  const { orch, o } = makeOrchestrator();
+  const runId = "run-merge";
+  const state: AnyObj = {
+    runId,
+    keyConstraints: existing,
+    rawFactsLog: [{ fact: "x", source: "writer", sceneNumber: 1, timestamp: "t" }],
+    lastArchivistScene: 0,
+    currentScene: 0,
+  };
+  o.activeRuns = new Map([[runId, state]]);
+  o.publishEvent = jest.fn(async () => {});
+  o.agentFactory = {
+    getAgent: () => ({ execute: jest.fn(async () => ({ content: { constraints: incoming } })) }),
+  };
+  await (o.runArchivistCheck as (r: string, opts: AnyObj, n: number) => Promise<void>).call(
+    orch, runId, { projectId: "p" }, 1
+  );
+  return state.keyConstraints as AnyObj[];
+}
+
+describe("runArchivistCheck constraint merge", () => {
+  it("replaces older constraints, keeps immutable ones, and appends new keys", async () => {
+    const result = await merge(
+      [c("genre", "noir", "2026-01-01", true), c("hair", "red", "2026-01-01")],
+      [c("genre", "comedy", "2026-02-01"), c("hair", "black", "2026-02-01"), c("city", "Oslo", "2026-02-01")]
+    );
+    expect(result.map(r => `${r.key}=${r.value}`)).toEqual(["genre=noir", "hair=black", "city=Oslo"]);
+  });
+
+  it("stores merged constraints without the Archivist's per-constraint reasoning", async () => {
+    const result = await merge([], [{ ...c("city", "Oslo", "2026-02-01"), reasoning: "stated in scene 1" }]);
+    expect(result).toEqual([{ key: "city", value: "Oslo", sceneNumber: 1, timestamp: "2026-02-01" }]);
+  });
+
+  it("keeps the constraint's source", async () => {
+    const result = await merge([], [{ ...c("city", "Oslo", "2026-02-01"), source: "archivist", reasoning: "stated in scene 1" }]);
+    expect(result).toEqual([{ key: "city", value: "Oslo", source: "archivist", sceneNumber: 1, timestamp: "2026-02-01" }]);
+  });
+
+  it("replaces the constraint array instead of mutating it in place", async () => {
+    const existing = [c("hair", "red", "2026-01-01")];
+    const result = await merge(existing, [c("hair", "black", "2026-02-01")]);
+    expect(result).not.toBe(existing);
+    expect(existing[0].value).toBe("red");
+  });
+
+  it("stamps constraints without a timestamp with one pass time, so they replace older ones", async () => {
+    const result = await merge(
+      [c("hair", "red", "2026-01-01")],
+      [{ key: "hair", value: "black", sceneNumber: 2 }, { key: "city", value: "Oslo", sceneNumber: 2 }]
+    );
+    expect(result.map(r => `${r.key}=${r.value}`)).toEqual(["hair=black", "city=Oslo"]);
+    expect(typeof result[0].timestamp).toBe("string");
+    expect(result[1].timestamp).toBe(result[0].timestamp);
+  });
+
+  it("merges a key repeated within one response instead of duplicating it", async () => {
+    const result = await merge(
+      [],
+      [c("city", "Oslo", "2026-02-01"), c("city", "Bergen", "2026-03-01"), c("city", "Rome", "2026-01-01")]
+    );
+    expect(result).toHaveLength(1);
+    expect(result[0].value).toBe("Bergen");
+  });
+
+  it("skips the Archivist call when there are no new facts", async () => {
+    const { orch, o } = makeOrchestrator();
+    const execute = jest.fn();
+    const publishEvent = jest.fn(async () => {});
+    const state: AnyObj = { runId: "r", keyConstraints: [], rawFactsLog: [], lastArchivistScene: 0, currentScene: 0 };
+    o.activeRuns = new Map([["r", state]]);
+    o.publishEvent = publishEvent;
+    o.agentFactory = { getAgent: () => ({ execute }) };
+    await (o.runArchivistCheck as (r: string, opts: AnyObj, n: number) => Promise<void>).call(
+      orch, "r", { projectId: "p" }, 3
+    );
+    expect(execute).not.toHaveBeenCalled();
+    expect(state.lastArchivistScene).toBe(0);
+    expect(publishEvent).toHaveBeenCalledTimes(1);
+    expect(publishEvent).toHaveBeenCalledWith("r", "archivist_complete", expect.objectContaining({ skipped: true }));
+  });
+});
@@ -60,7 +60,12 @@ function makeState(runId: string, sceneCount: number): AnyObj {
  * Build an orchestrator with the scene-level work stubbed out, and capture the
  * scenes for which the Archivist runs. Returns { archivistScenes }.
  */
-function runLoop(sceneCount: number): Promise<number[]> {
+function runLoop(
+  sceneCount: number,
+  log: string[] = [],
+  holdArchivistUntilCheckpoint = false,
+  pauseAfterScene?: number
+): Promise<number[]> {
   const orch = new StorytellerOrchestrator();
   const runId = "run-1";
   const state = makeState(runId, sceneCount);
@@ -68,12 +73,19 @@ function runLoop(sceneCount: number): Promise<number[]> {
   o.activeRuns = new Map([[runId, state]]);
 
   const archivistScenes: number[] = [];
+  const checkpointed = new Set<number>();
+  const waiting = new Map<number, () => void>();
+  const checkpoint = (sceneNum: number) => checkpointed.has(sceneNum)
+    ? Promise.resolve()
+    : new Promise<void>((resolve) => waiting.set(sceneNum, resolve));
 
   // Stub per-scene work so the loop runs without real agents/LLM.
   o.draftScene = jest.fn(async (_r: string, _o: AnyObj, sceneNum: number) => {
+    log.push(`draft ${sceneNum}`);
     (state.drafts as Map<number, AnyObj>).set(sceneNum, { wordCount: 500, content: "x" });
   });
   o.draftSceneWithBeats = jest.fn(async (_r: string, _o: AnyObj, sceneNum: number) => {
+    log.push(`draft ${sceneNum}`);
     (state.drafts as Map<number, AnyObj>).set(sceneNum, { wordCount: 500, content: "x" });
   });
   o.expandScene = jest.fn(async () => {});
@@ -85,7 +97,19 @@ function runLoop(sceneCount: number): Promise<number[]> {
   o.publishEvent = jest.fn(async () => {});
   // Record archivist coverage instead of doing real consolidation.
   o.runArchivistCheck = jest.fn(async (_r: string, _o: AnyObj, upToScene: number) => {
+    log.push(`archivist ${upToScene} start`);
+    if (holdArchivistUntilCheckpoint) {
+      await checkpoint(upToScene);
+      await new Promise((resolve) => setImmediate(resolve));
+    }
     archivistScenes.push(upToScene);
+    log.push(`archivist ${upToScene} done`);
+  });
+  o.checkpointScene = jest.fn(async (_r: string, sceneNum: number) => {
+    log.push(`checkpoint ${sceneNum}`);
+    checkpointed.add(sceneNum);
+    if (sceneNum === pauseAfterScene) state.isPaused = true;
+    waiting.get(sceneNum)?.();
   });
 
   return (o.runDraftingLoop as (r: string, opts: AnyObj) => Promise<void>)(runId, {
@@ -118,3 +142,38 @@ describe("StorytellerOrchestrator Archivist scheduling", () => {
     expect(scenes).toEqual([2]);
   });
 });
+
+describe("StorytellerOrchestrator background Archivist (ARCHIVIST_BACKGROUND=true)", () => {
+  const original = process.env.ARCHIVIST_BACKGROUND;
+  beforeEach(() => { process.env.ARCHIVIST_BACKGROUND = "true"; });
+  afterEach(() => {
+    if (original === undefined) delete process.env.ARCHIVIST_BACKGROUND;
+    else process.env.ARCHIVIST_BACKGROUND = original;
+  });
+
+  it("overlaps the pass with the scene tail but finishes it before the next draft", async () => {
+    const log: string[] = [];
+    // The pass cannot finish until its scene is checkpointed, so an inline
+    // (awaited) Archivist would deadlock here.
+    const scenes = await runLoop(4, log, true);
+    expect(scenes).toEqual([3, 4]);
+    // Scene 3 is checkpointed while its Archivist pass is still running...
+    expect(log.indexOf("checkpoint 3")).toBeLessThan(log.indexOf("archivist 3 done"));
+    // ...and scene 4 only starts drafting once the pass has landed.
+    expect(log.indexOf("archivist 3 done")).toBeLessThan(log.indexOf("draft 4"));
+  });
+
+  it("lands a running pass before the loop returns for a pause", async () => {
+    const log: string[] = [];
+    const scenes = await runLoop(4, log, true, 3);
+    log.push("returned");
+    expect(scenes).toEqual([3]);
+    expect(log.slice(-2)).toEqual(["archivist 3 done", "returned"]);
+    expect(log).not.toContain("draft 4");
+  });
+
+  it("waits for a background pass on the last scene instead of re-flushing it (6 scenes)", async () => {
+    const scenes = await runLoop(6);
+    expect(scenes).toEqual([3, 6]);
+  });
+});
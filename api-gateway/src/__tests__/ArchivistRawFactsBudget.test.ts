@@ -0,0 +1,47 @@
+/**
+ * Tests the REAL ArchivistAgent raw-facts block: facts up to the current scene
+ * are listed in log order, and once the character budget is exceeded the
+ * oldest ones are replaced by a single elision marker (reported to Langfuse).
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { AnyObj, makeArchivist } from "./helpers/fixtures";
+
+function setup() {
+  const addEvent = jest.fn();
+  const archivist = makeArchivist(addEvent) as unknown as AnyObj;
+  const prompt = (rawFactsLog: AnyObj[], currentScene: number): string =>
+    (archivist.buildUserPrompt as (c: AnyObj, o: AnyObj) => string).call(
+      archivist,
+      { runId: "run-1", state: { currentScene, rawFactsLog, keyConstraints: [] } },
+      {}
+    );
+  return { addEvent, prompt };
+}
+
+const fact = (fact: string, sceneNumber: number): AnyObj => ({ fact, sceneNumber, source: "writer", timestamp: "t" });
+
+describe("ArchivistAgent raw facts block", () => {
+  it("lists facts up to the current scene in log order", () => {
+    const { addEvent, prompt } = setup();
+    const out = prompt([fact("Mara left", 1), fact("Vex lied", 2), fact("Later", 4)], 2);
+    expect(out).toContain("- Mara left (Scene 1, from writer)\n- Vex lied (Scene 2, from writer)");
+    expect(out).not.toContain("Later");
+    expect(addEvent).not.toHaveBeenCalled();
+  });
+
+  it("keeps the newest facts within the budget and elides the oldest", () => {
+    const { addEvent, prompt } = setup();
+    const log = Array.from({ length: 1000 }, (_, i) => fact(`fact ${i} ${"x".repeat(60)}`, 1));
+    const out = prompt(log, 1);
+    const block = out.slice(out.indexOf("Raw facts collected:\n") + 21, out.indexOf("\n\nExisting constraints:"));
+    const lines = block.split("\n");
+
+    expect(block.length).toBeLessThan(33_000);
+    expect(lines[0]).toMatch(/^- \.\.\. \d+ older facts elided/);
+    expect(lines[lines.length - 1]).toContain("fact 999 ");
+    const elided = Number(lines[0].match(/\d+/)![0]);
+    expect(elided + lines.length - 1).toBe(1000);
+    expect(addEvent).toHaveBeenCalledWith("run-1", "archivist_facts_elided", { elided, upToScene: 1 });
+  });
+});
@@ -0,0 +1,23 @@
+/**
+ * ArchivistOutputSchema normalizes free-form character statuses from the LLM
+ * to the status enum through a single alias lookup.
+ */
+import { ArchivistOutputSchema } from "../schemas/AgentSchemas";
+
+describe("ArchivistOutputSchema character status normalization", () => {
+  it("maps aliases case-insensitively and defaults unknown values", () => {
+    const parsed = ArchivistOutputSchema.parse({
+      worldStateDiff: {
+        characterUpdates: [
+          { name: "A", status: " Deceased " },
+          { name: "B", status: "HEALTHY" },
+          { name: "C", status: "mutated" },
+          { name: "D", status: "asleep" },
+          { name: "E", status: null },
+        ],
+      },
+    });
+    expect(parsed.worldStateDiff?.characterUpdates?.map((u) => u.status))
+      .toEqual(["dead", "alive", "transformed", "unknown", undefined]);
+  });
+});
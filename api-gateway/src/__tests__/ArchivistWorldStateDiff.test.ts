@@ -0,0 +1,57 @@
+/**
+ * ArchivistAgent.applyWorldStateDiff applies character updates by name to the
+ * tracked character states (looked up through a one-pass name index) and
+ * ignores updates for characters that are not tracked. New locations are added
+ * once per name.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { WorldState } from "../models/AgentModels";
+import { makeArchivist } from "./helpers/fixtures";
+
+function worldState(): WorldState {
+  return {
+    runId: "r", lastUpdatedScene: 0, lastUpdatedAt: "",
+    characters: [
+      { name: "Mara", status: "alive", attributes: {}, relationships: [], lastSeenScene: 1 },
+      { name: "Vex", status: "alive", attributes: {}, relationships: [], lastSeenScene: 1 },
+    ],
+    locations: [], organizations: [], timeline: [],
+  } as unknown as WorldState;
+}
+
+describe("ArchivistAgent.applyWorldStateDiff character updates", () => {
+  it("updates tracked characters by name and skips unknown names", () => {
+    const next = makeArchivist().applyWorldStateDiff(worldState(), {
+      characterUpdates: [
+        { name: "Vex", status: "transformed", currentLocation: "Docks" },
+        { name: "Nobody", status: "dead" },
+      ],
+    }, 4);
+    const vex = next.characters.find((c) => c.name === "Vex");
+    expect(vex?.status).toBe("transformed");
+    expect(vex?.currentLocation).toBe("Docks");
+    expect(vex?.lastSeenScene).toBe(4);
+    expect(next.characters.find((c) => c.name === "Mara")?.lastSeenScene).toBe(1);
+    expect(next.characters).toHaveLength(2);
+  });
+
+  it("stamps every timeline event of one diff with the diff's update time", () => {
+    const next = makeArchivist().applyWorldStateDiff(worldState(), {
+      timelineEvents: [{ event: "Mara leaves", significance: "major" }, { event: "Vex lies" }],
+    }, 5);
+    expect(next.timeline).toHaveLength(2);
+    expect(next.timeline.every((e) => e.timestamp === next.lastUpdatedAt)).toBe(true);
+    expect(next.timeline[1].significance).toBe("minor");
+  });
+
+  it("adds new locations once, skipping names already tracked or repeated in the diff", () => {
+    const state = worldState();
+    state.locations.push({ name: "Docks", type: "port", status: "accessible", lastMentionedScene: 1 } as WorldState["locations"][number]);
+    const next = makeArchivist().applyWorldStateDiff(state, {
+      newLocations: [{ name: "Docks", type: "ruin" }, { name: "Tower", type: "keep" }, { name: "Tower", type: "spire" }],
+    }, 3);
+    expect(next.locations.map((l) => `${l.name}:${l.type}`)).toEqual(["Docks:port", "Tower:keep"]);
+    expect(next.locations[1].lastMentionedScene).toBe(3);
+  });
+});
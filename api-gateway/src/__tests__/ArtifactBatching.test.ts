@@ -0,0 +1,111 @@
+/**
+ * Tests the REAL StorytellerOrchestrator.saveArtifact with ARTIFACTS_BATCHED_SAVE:
+ * artifacts are buffered per run and written in one upsert per batch, a
+ * rewrite before the flush replaces the earlier content, and a full batch is
+ * written without waiting for the timer. Scene checkpoints join the batch.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { AnyObj, makeOrchestrator } from "./helpers/fixtures";
+
+type Save = (runId: string, projectId: string, artifactType: string, content: unknown) => Promise<void>;
+
+function setup() {
+  const { orch, o } = makeOrchestrator();
+  const supabase = {
+    saveRunArtifact: jest.fn(async (_artifact: unknown) => {}),
+    saveRunArtifacts: jest.fn(async (_artifacts: unknown[]) => {}),
+  };
+  o.supabase = supabase;
+  return {
+    o,
+    supabase,
+    save: (o.saveArtifact as Save).bind(orch),
+    flush: (runId: string) => (o.flushArtifacts as (r: string) => Promise<void>).call(orch, runId),
+  };
+}
+
+describe("saveArtifact with ARTIFACTS_BATCHED_SAVE", () => {
+  afterEach(() => {
+    delete process.env.ARTIFACTS_BATCHED_SAVE;
+  });
+
+  it("writes buffered artifacts in one upsert, keeping the latest content per type", async () => {
+    process.env.ARTIFACTS_BATCHED_SAVE = "true";
+    const { supabase, save, flush } = setup();
+
+    await save("run-1", "p", "draft_scene_1", { v: 1 });
+    await save("run-1", "p", "critique_scene_1", { score: 7 });
+    await save("run-1", "p", "draft_scene_1", { v: 2 });
+    expect(supabase.saveRunArtifacts).not.toHaveBeenCalled();
+
+    await flush("run-1");
+    expect(supabase.saveRunArtifact).not.toHaveBeenCalled();
+    expect(supabase.saveRunArtifacts).toHaveBeenCalledTimes(1);
+    expect(supabase.saveRunArtifacts).toHaveBeenCalledWith([
+      { runId: "run-1", projectId: "p", artifactType: "draft_scene_1", content: { v: 2 } },
+      { runId: "run-1", projectId: "p", artifactType: "critique_scene_1", content: { score: 7 } },
+    ]);
+  });
+
+  it("flushes a full batch immediately and logs a failed write instead of throwing", async () => {
+    process.env.ARTIFACTS_BATCHED_SAVE = "true";
+    const { o, supabase, save, flush } = setup();
+    supabase.saveRunArtifacts.mockRejectedValueOnce(new Error("supabase down"));
+    const errorSpy = jest.spyOn(console, "error").mockImplementation(() => {});
+
+    for (let i = 1; i <= 32; i++) {
+      await save("run-2", "p", `draft_scene_${i}`, { i });
+    }
+    // The 32nd artifact filled the batch, so nothing is left waiting on the timer.
+    expect((o.artifactBuffers as Map<string, unknown>).has("run-2")).toBe(false);
+
+    await expect(flush("run-2")).resolves.toBeUndefined();
+    expect(supabase.saveRunArtifacts).toHaveBeenCalledTimes(1);
+    expect(supabase.saveRunArtifacts.mock.calls[0][0]).toHaveLength(32);
+    expect(errorSpy).toHaveBeenCalled();
+    errorSpy.mockRestore();
+  });
+
+  it("writes scene checkpoints in the same batch, keyed by their phase", async () => {
+    process.env.ARTIFACTS_BATCHED_SAVE = "true";
+    const { o, supabase, save, flush } = setup();
+    const state: AnyObj = {
+      runId: "run-4", projectId: "p", drafts: new Map(), critiques: new Map(), revisionCount: new Map(),
+      valueShifts: new Map(), spiceRegions: new Map(), rawFactsLog: [], messages: [], rollingSynopsis: [],
+    };
+    o.activeRuns = new Map([["run-4", state]]);
+    const checkpoint = (n: number) => (o.checkpointScene as (r: string, n: number) => Promise<void>).call(o, "run-4", n);
+
+    await save("run-4", "p", "final_scene_1", { v: 1 });
+    await checkpoint(1);
+    await checkpoint(2);
+    expect(supabase.saveRunArtifact).not.toHaveBeenCalled();
+
+    await flush("run-4");
+    const batch = supabase.saveRunArtifacts.mock.calls[0][0] as AnyObj[];
+    expect(batch.map((a) => `${a.artifactType}@${a.phase ?? "-"}`)).toEqual([
+      "final_scene_1@-",
+      "run_state_checkpoint@checkpoint_scene_1",
+      "run_state_checkpoint@checkpoint_scene_2",
+    ]);
+  });
+
+  it("buffers a snapshot, not the live object", async () => {
+    process.env.ARTIFACTS_BATCHED_SAVE = "true";
+    const { supabase, save, flush } = setup();
+    const outline = { scenes: [{ title: "Docks" }] };
+
+    await save("run-5", "p", "outline", outline);
+    outline.scenes.push({ title: "Later" });
+    await flush("run-5");
+    expect((supabase.saveRunArtifacts.mock.calls[0][0] as AnyObj[])[0].content).toEqual({ scenes: [{ title: "Docks" }] });
+  });
+
+  it("saves each artifact inline when the flag is off", async () => {
+    const { supabase, save } = setup();
+    await save("run-3", "p", "outline", { scenes: [] });
+    expect(supabase.saveRunArtifact).toHaveBeenCalledTimes(1);
+    expect(supabase.saveRunArtifacts).not.toHaveBeenCalled();
+  });
+});
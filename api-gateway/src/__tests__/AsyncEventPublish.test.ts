@@ -0,0 +1,85 @@
+/**
+ * Tests the REAL StorytellerOrchestrator.publishEvent with EVENTS_ASYNC_PUBLISH:
+ * callers return before the Redis publish settles, events of a run still reach
+ * Redis in call order, and a failed publish is logged rather than thrown.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { GenerationPhase } from "../models/LLMModels";
+import { AnyObj, makeOrchestrator, makeWriter } from "./helpers/fixtures";
+
+type Publish = (runId: string, eventType: string, data: AnyObj) => Promise<void>;
+
+describe("publishEvent with EVENTS_ASYNC_PUBLISH", () => {
+  afterEach(() => {
+    delete process.env.EVENTS_ASYNC_PUBLISH;
+  });
+
+  it("returns immediately but publishes each run's events in order", async () => {
+    process.env.EVENTS_ASYNC_PUBLISH = "true";
+    const { orch, o } = makeOrchestrator();
+    const published: string[] = [];
+    const gates: Array<() => void> = [];
+    o.redisStreams = {
+      publishEvent: jest.fn((_runId: string, eventType: string) =>
+        new Promise<void>((resolve) => gates.push(() => { published.push(eventType); resolve(); }))),
+    };
+    const publish = (o.publishEvent as Publish).bind(orch);
+
+    await publish("run-1", "phase_start", {});
+    await publish("run-1", "phase_complete", {});
+    expect(published).toEqual([]);
+
+    // Only the head of the queue is in flight; release it, then the next.
+    gates.shift()!();
+    await new Promise((r) => setImmediate(r));
+    gates.shift()!();
+    await (o.drainBackgroundTasks as (ms: number) => Promise<void>).call(orch, 1000);
+    expect(published).toEqual(["phase_start", "phase_complete"]);
+  });
+
+  it("logs a failed publish and keeps later events flowing", async () => {
+    process.env.EVENTS_ASYNC_PUBLISH = "true";
+    const { orch, o } = makeOrchestrator();
+    const publishSpy = jest.fn()
+      .mockRejectedValueOnce(new Error("redis down"))
+      .mockResolvedValueOnce("1-0");
+    o.redisStreams = { publishEvent: publishSpy };
+    const publish = (o.publishEvent as Publish).bind(orch);
+
+    await expect(publish("run-2", "a", {})).resolves.toBeUndefined();
+    await publish("run-2", "b", {});
+    await (o.drainBackgroundTasks as (ms: number) => Promise<void>).call(orch, 1000);
+    expect(publishSpy).toHaveBeenCalledTimes(2);
+    expect((o.eventQueues as Map<string, unknown>).size).toBe(0);
+  });
+
+  it("queues agent events wired through onPublishEvent behind the run's earlier events", async () => {
+    process.env.EVENTS_ASYNC_PUBLISH = "true";
+    const { orch, o } = makeOrchestrator();
+    const published: string[] = [];
+    let releaseFirst: (() => void) | undefined;
+    o.redisStreams = {
+      // Hold the first publish open; later ones complete immediately.
+      publishEvent: jest.fn((_runId: string, eventType: string) => new Promise<void>((resolve) => {
+        const done = () => { published.push(eventType); resolve(); };
+        if (releaseFirst === undefined) releaseFirst = done;
+        else done();
+      })),
+    };
+    const publish = (o.publishEvent as Publish).bind(orch);
+    const writer = makeWriter();
+    writer.onPublishEvent = publish;
+    const writerStream = (writer as unknown as AnyObj).redisStreams as { publishEvent: jest.Mock };
+
+    await publish("run-3", "phase_start", {});
+    await (writer as unknown as { emitMessage(r: string, c: string, p: GenerationPhase): Promise<void> })
+      .emitMessage("run-3", "prose", GenerationPhase.DRAFTING);
+    expect(published).toEqual([]);
+
+    releaseFirst!();
+    await (o.drainBackgroundTasks as (ms: number) => Promise<void>).call(orch, 1000);
+    expect(published).toEqual(["phase_start", "agent_message"]);
+    expect(writerStream.publishEvent).not.toHaveBeenCalled();
+  });
+});
@@ -85,6 +85,19 @@ describe("BaseAgent.buildAdvancedPlanBlock", () => {
     expect(out).toContain("cold blues");
     expect(out).toContain("dripping water");
   });
+
+  it("serializes the run-wide motifs once across scenes", () => {
+    const p = probe();
+    const plan = { motifs: { mirror: "self-deception" }, emotionalBeats: { "1": "calm", "2": "dread" } };
+    const build = p.buildAdvancedPlanBlock as (pl: unknown, n: number) => string;
+    build(plan, 1);
+    const spy = jest.spyOn(JSON, "stringify");
+    const out = build(plan, 2);
+    expect(out).toContain("self-deception");
+    expect(out).toContain("dread");
+    expect(spy.mock.calls.some(([v]) => v === plan.motifs)).toBe(false);
+    spy.mockRestore();
+  });
 });
 
 describe("BaseAgent.buildNarratorVoiceBlock", () => {
@@ -119,6 +132,23 @@ describe("BaseAgent.buildSynopsisBlock", () => {
     const p = probe();
     expect((p.buildSynopsisBlock as (e: unknown, n: number) => string)([], 1)).toMatch(/no prior scenes/i);
   });
+  it("still orders entries that were appended out of scene order", () => {
+    const build = probe().buildSynopsisBlock as (e: unknown, n: number) => string;
+    const entries = [
+      { sceneNumber: 2, summary: "B" },
+      { sceneNumber: 1, summary: "A" },
+      { sceneNumber: 3, summary: "C" },
+    ];
+    expect(build(entries, 4)).toBe("Scene 1: A\nScene 2: B\nScene 3: C");
+  });
+  it("re-renders when the synopsis grows or the scene changes", () => {
+    const build = probe().buildSynopsisBlock as (e: unknown, n: number) => string;
+    const entries = [{ sceneNumber: 1, summary: "Mara leaves home." }];
+    expect(build(entries, 2)).toBe("Scene 1: Mara leaves home.");
+    expect(build(entries, 1)).toMatch(/no prior scenes/i);
+    entries.push({ sceneNumber: 2, summary: "Mara meets Vex." });
+    expect(build(entries, 3)).toBe("Scene 1: Mara leaves home.\nScene 2: Mara meets Vex.");
+  });
 });
 
 describe("BaseAgent.buildSceneContractBlock", () => {
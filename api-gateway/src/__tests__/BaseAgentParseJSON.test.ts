@@ -91,6 +91,19 @@ describe('BaseAgent.extractJSON (pure helper)', () => {
     expect(JSON.parse(extracted as string)).toEqual({ name: 'test', value: 1 });
   });
 
+  it('parses a whole-response primitive', () => {
+    expect(extractJSON('42')).toBe('42');
+    expect(extractJSON(' "done" ')).toBe('"done"');
+  });
+
+  it('finds JSON after unclosed or non-JSON brackets in prose', () => {
+    expect(JSON.parse(extractJSON('Draft [v2] { pending: {"name": "test"}') as string)).toEqual({ name: 'test' });
+  });
+
+  it('prefers the object over a citation bracket in prose', () => {
+    expect(JSON.parse(extractJSON('Per the rubric [1], here is my score: {"score": 8}') as string)).toEqual({ score: 8 });
+  });
+
   it('returns null when nothing parseable is present', () => {
     expect(extractJSON('this is not json at all')).toBeNull();
   });
@@ -0,0 +1,39 @@
+/**
+ * Tests the REAL ConsistencyGuardrail keyword check. The scene text is scanned
+ * once per check; these cases pin the per-constraint rules that must still hold.
+ */
+import { ConsistencyGuardrail } from "../guardrails/ConsistencyGuardrail";
+import { KeyConstraint } from "../models/AgentModels";
+
+const k = (key: string, value: string): KeyConstraint =>
+  ({ key, value, sceneNumber: 2, timestamp: "2026-01-01" }) as KeyConstraint;
+
+async function violations(content: string, constraints: KeyConstraint[]): Promise<string[]> {
+  const guardrail = new ConsistencyGuardrail();
+  return (await guardrail.check(content, constraints)).violations;
+}
+
+describe("ConsistencyGuardrail keyword constraints", () => {
+  it("flags hair only when another color is described", async () => {
+    const hair = [k("mara_hair", "long red hair")];
+    expect(await violations("Her red hair caught the light.", hair)).toEqual([]);
+    expect(await violations("Her red hair and black hair wig.", hair)).toHaveLength(1);
+    expect(await violations("Her blonde hair caught the light.", hair)).toEqual([
+      "Contradicts constraint: mara_hair = long red hair (Scene 2)",
+    ]);
+  });
+
+  it("checks eyes, life status and current location against one scan of the text", async () => {
+    const result = await violations("Vex, green eyes narrowed, was alive and waiting at Harbor.", [
+      k("vex_eye_color", "blue"),
+      k("vex_status", "dead"),
+      k("vex_current_location", "hiding in Oslo"),
+      k("vex_home_location", "born in Oslo"),
+    ]);
+    expect(result).toEqual([
+      "Contradicts constraint: vex_eye_color = blue (Scene 2)",
+      "Contradicts constraint: vex_status = dead (Scene 2)",
+      "Potential location contradiction: vex_current_location = hiding in Oslo (Scene 2)",
+    ]);
+  });
+});
@@ -0,0 +1,53 @@
+/**
+ * Tests the REAL StorytellerOrchestrator.persistSceneDraft: the Qdrant memory
+ * write, the run artifact and the normalized draft row are issued together
+ * (the Supabase draft row still waits for its Qdrant point id), and a failed
+ * write is logged without failing the scene.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { AnyObj, makeOrchestrator } from "./helpers/fixtures";
+
+type Persist = (runId: string, options: AnyObj, draft: AnyObj, caller: string) => Promise<void>;
+
+const draft = { sceneNum: 2, title: "Docks", content: "Mara waits.", wordCount: 2, createdAt: "t" };
+
+describe("persistSceneDraft", () => {
+  it("issues the artifact and draft-row writes without waiting on Qdrant", async () => {
+    const { orch, o } = makeOrchestrator();
+    let releaseQdrant!: (id: string) => void;
+    o.qdrantMemory = { storeScene: jest.fn(() => new Promise<string>((resolve) => { releaseQdrant = resolve; })) };
+    const supabase = {
+      saveDraft: jest.fn(async () => {}),
+      upsertDraft: jest.fn(async () => {}),
+      saveRunArtifact: jest.fn(async () => {}),
+    };
+    o.supabase = supabase;
+
+    const done = (o.persistSceneDraft as Persist).call(orch, "run-1", { projectId: "p" }, draft, "draftScene");
+    await new Promise((r) => setImmediate(r));
+    expect(supabase.saveRunArtifact).toHaveBeenCalledTimes(1);
+    expect(supabase.upsertDraft).toHaveBeenCalledWith(expect.objectContaining({ sceneNumber: 2, content: "Mara waits." }));
+    expect(supabase.saveDraft).not.toHaveBeenCalled();
+
+    releaseQdrant("point-2");
+    await done;
+    expect(supabase.saveDraft).toHaveBeenCalledWith("p", draft, "point-2", "run-1");
+  });
+
+  it("logs failed writes and still resolves", async () => {
+    const { orch, o } = makeOrchestrator();
+    o.qdrantMemory = { storeScene: jest.fn(async () => { throw new Error("qdrant down"); }) };
+    o.supabase = {
+      saveDraft: jest.fn(async () => {}),
+      upsertDraft: jest.fn(async () => { throw new Error("supabase down"); }),
+      saveRunArtifact: jest.fn(async () => {}),
+    };
+    const errorSpy = jest.spyOn(console, "error").mockImplementation(() => {});
+
+    await expect(
+      (o.persistSceneDraft as Persist).call(orch, "run-2", { projectId: "p" }, draft, "draftScene")
+    ).resolves.toBeUndefined();
+    errorSpy.mockRestore();
+  });
+});
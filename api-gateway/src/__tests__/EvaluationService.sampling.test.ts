@@ -133,3 +133,106 @@ describe("EvaluationService — sampler (issue #168)", () => {
     expect(result!.score).toBeCloseTo(0.75);
   });
 });
+
+describe("EvaluationService — batched relevance", () => {
+  afterEach(() => {
+    delete process.env.OPENAI_API_KEY;
+    delete process.env.EVALUATION_SAMPLES;
+  });
+
+  it("judges the whole cast in sampleCount calls and takes a per-character median", async () => {
+    const responses = [
+      '{"results":[{"item":1,"score":0.4,"reasoning":"a1"},{"item":2,"score":0.9,"reasoning":"b1"}]}',
+      '{"results":[{"item":"Item 1","score":0.6,"reasoning":"a2"},{"item":"item 2","score":0.7,"reasoning":"b2"}]}',
+      '{"results":[{"item":1,"score":0.8,"reasoning":"a3"}]}',
+    ];
+    const svc = buildService(responses);
+    const result = await svc.evaluateRelevanceBatch({
+      runId: "test-run-batch",
+      seedIdea: "A heist on the moon.",
+      characters: [
+        { characterName: "Ada", profilerOutput: "{}" },
+        { characterName: "Bo", profilerOutput: "{}" },
+        { characterName: "Cy", profilerOutput: "{}" },
+      ],
+    });
+
+    const spy = (svc as any).llmProviderService.createCompletion as jest.Mock;
+    expect(spy).toHaveBeenCalledTimes(3);
+    const prompt: string = spy.mock.calls[0][0].messages[1].content;
+    expect(prompt.split("A heist on the moon.").length).toBe(2);
+    expect(prompt).toContain("## Item 2: Bo\n{}");
+    expect(result[0]).toMatchObject({ score: 0.6, reasoning: "a2" });
+    expect(result[1]?.score).toBeCloseTo(0.8);
+    expect(result[2]).toBeNull();
+    const metricsSpy = (svc as any).metricsService.recordEvaluation as jest.Mock;
+    expect(metricsSpy).toHaveBeenCalledWith(
+      "relevance", "profiler", "test-run-batch", 0, expect.any(Number), false
+    );
+  });
+
+  it("keeps characters that share a name apart", async () => {
+    const svc = buildService(['{"results":[{"item":1,"score":0.2},{"item":2,"score":0.9}]}'], 1);
+    const result = await svc.evaluateRelevanceBatch({
+      runId: "test-run-batch-dup",
+      seedIdea: "Twins.",
+      characters: [
+        { characterName: "Sam", profilerOutput: "{\"role\":\"hero\"}" },
+        { characterName: "Sam", profilerOutput: "{\"role\":\"villain\"}" },
+      ],
+    });
+
+    expect(result.map((r) => r?.score)).toEqual([0.2, 0.9]);
+  });
+});
+
+describe("EvaluationService — batched faithfulness", () => {
+  afterEach(() => {
+    delete process.env.OPENAI_API_KEY;
+    delete process.env.EVALUATION_SAMPLES;
+  });
+
+  it("judges several scenes in sampleCount calls and takes a per-scene median", async () => {
+    const responses = [
+      '{"results":[{"item":1,"score":0.4,"reasoning":"s1a"},{"item":2,"score":0.9,"reasoning":"s2a"}]}',
+      '{"results":[{"item":1,"score":0.6,"reasoning":"s1b"},{"item":2,"score":0.7,"reasoning":"s2b"}]}',
+      '{"results":[{"item":1,"score":0.8,"reasoning":"s1c"}]}',
+    ];
+    const svc = buildService(responses);
+    const result = await svc.evaluateFaithfulnessBatch({
+      runId: "test-run-faith-batch",
+      scenes: [
+        { sceneNumber: 1, writerOutput: "Mara waits.", architectPlan: "Plan one" },
+        { sceneNumber: 2, writerOutput: "Vex lies.", architectPlan: "Plan two" },
+        { sceneNumber: 3, writerOutput: "Nobody.", architectPlan: "Plan three" },
+      ],
+    });
+
+    const spy = (svc as any).llmProviderService.createCompletion as jest.Mock;
+    expect(spy).toHaveBeenCalledTimes(3);
+    const prompt: string = spy.mock.calls[0][0].messages[1].content;
+    expect(prompt).toContain("## Item 2: Scene 2\n\n### Architect's Plan\nPlan two\n\n### Writer's Output\nVex lies.");
+    expect(result[0]).toMatchObject({ score: 0.6, reasoning: "s1b" });
+    expect(result[1]?.score).toBeCloseTo(0.8);
+    expect(result[2]).toBeNull();
+    const metricsSpy = (svc as any).metricsService.recordEvaluation as jest.Mock;
+    expect(metricsSpy).toHaveBeenCalledWith(
+      "faithfulness", "writer", "test-run-faith-batch", 0, expect.any(Number), false
+    );
+  });
+
+  it("logs each scene's median with its scene number", async () => {
+    const log = jest.spyOn(console, "log").mockImplementation(() => {});
+    const svc = buildService(['{"results":[{"item":1,"score":0.5},{"item":2,"score":0.7}]}'], 1);
+    await svc.evaluateFaithfulnessBatch({
+      runId: "run-log",
+      scenes: [
+        { sceneNumber: 4, writerOutput: "a", architectPlan: "p" },
+        { sceneNumber: 5, writerOutput: "b", architectPlan: "q" },
+      ],
+    });
+
+    expect(log).toHaveBeenCalledWith("[EvaluationService] Faithfulness (median of 1) for run run-log, scene 5: 0.7");
+    log.mockRestore();
+  });
+});
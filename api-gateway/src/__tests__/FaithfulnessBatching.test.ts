@@ -0,0 +1,49 @@
+/**
+ * Tests the REAL StorytellerOrchestrator faithfulness queue used with
+ * EVALUATION_BATCH_FAITHFULNESS: scene checks are collected per run, a full
+ * batch is judged in one call, a redrafted scene replaces its earlier entry,
+ * and flushing sends whatever is left.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { AnyObj, makeOrchestrator } from "./helpers/fixtures";
+
+function setup() {
+  const { orch, o } = makeOrchestrator();
+  const evaluateFaithfulnessBatch = jest.fn(async (_input: { runId: string; scenes: AnyObj[] }) => []);
+  o.evaluationService = { evaluateFaithfulnessBatch };
+  const queue = (runId: string, sceneNumber: number, writerOutput = `scene ${sceneNumber}`) =>
+    (o.queueFaithfulnessEvaluation as (r: string, s: AnyObj) => void).call(orch, runId, { sceneNumber, writerOutput, architectPlan: "{}" });
+  const flush = (runId: string) => (o.flushFaithfulnessEvaluations as (r: string) => void).call(orch, runId);
+  const settle = () => Promise.all(o.backgroundTasks as Set<Promise<unknown>>);
+  return { evaluateFaithfulnessBatch, queue, flush, settle };
+}
+
+describe("faithfulness batching", () => {
+  it("judges a full batch in one call and the remainder on flush", async () => {
+    const { evaluateFaithfulnessBatch, queue, flush, settle } = setup();
+    for (let n = 1; n <= 5; n++) queue("run-1", n);
+    await settle();
+    expect(evaluateFaithfulnessBatch).toHaveBeenCalledTimes(1);
+    expect(evaluateFaithfulnessBatch.mock.calls[0][0].scenes.map((s) => s.sceneNumber)).toEqual([1, 2, 3, 4]);
+
+    flush("run-1");
+    await settle();
+    expect(evaluateFaithfulnessBatch).toHaveBeenCalledTimes(2);
+    expect(evaluateFaithfulnessBatch.mock.calls[1][0]).toMatchObject({ runId: "run-1", scenes: [{ sceneNumber: 5 }] });
+
+    flush("run-1");
+    expect(evaluateFaithfulnessBatch).toHaveBeenCalledTimes(2);
+  });
+
+  it("keeps only the latest draft of a scene queued twice", async () => {
+    const { evaluateFaithfulnessBatch, queue, flush, settle } = setup();
+    queue("run-2", 1, "first draft");
+    queue("run-2", 1, "second draft");
+    flush("run-2");
+    await settle();
+    expect(evaluateFaithfulnessBatch.mock.calls[0][0].scenes).toEqual([
+      { sceneNumber: 1, writerOutput: "second draft", architectPlan: "{}" },
+    ]);
+  });
+});
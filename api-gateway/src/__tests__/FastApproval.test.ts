@@ -0,0 +1,74 @@
+/**
+ * FAST_APPROVAL_ENABLED: a revision of a draft the Critic scored >= 8 (with no
+ * hard failure) is accepted without a second critique. The revised text is
+ * unscored, so it is polished instead of taking the high-score polish skip.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { AnyObj, makeOrchestrator } from "./helpers/fixtures";
+
+function setup(critique: AnyObj) {
+  const { o } = makeOrchestrator();
+  const runId = "run-1";
+  const state: AnyObj = {
+    runId, projectId: "proj-1", phase: "drafting", currentScene: 0, totalScenes: 1,
+    outline: { scenes: [{ wordCount: 200, title: "Scene 1" }] }, characters: [], drafts: new Map(), critiques: new Map(),
+    revisionCount: new Map(), messages: [], maxRevisions: 2, keyConstraints: [],
+    rawFactsLog: [], lastArchivistScene: 0, isPaused: false, isCompleted: false,
+    rollingSynopsis: [], valueShifts: new Map(),
+    startedAt: "", updatedAt: "",
+  };
+  o.activeRuns = new Map([[runId, state]]);
+  o.draftScene = jest.fn(async (_r: string, _o: AnyObj, n: number) => {
+    (state.drafts as Map<number, AnyObj>).set(n, { wordCount: 500, content: "x" });
+  });
+  o.draftSceneWithBeats = jest.fn(async () => {});
+  o.expandScene = jest.fn(async () => {});
+  const critiqueScene = jest.fn(async () => critique);
+  o.critiqueScene = critiqueScene;
+  o.reviseScene = jest.fn(async () => {});
+  const polishScene = jest.fn(async () => {});
+  o.polishScene = polishScene;
+  o.runArchivistCheck = jest.fn(async () => {});
+  o.appendSceneSynopsis = jest.fn(async () => {});
+  const publishEvent = jest.fn(async (_r: string, _t: string, _d: AnyObj) => {});
+  o.publishEvent = publishEvent;
+  const emitSceneFinal = jest.fn(async () => {});
+  o.emitSceneFinal = emitSceneFinal;
+  const run = () => (o.runDraftingLoop as (r: string, opts: AnyObj) => Promise<void>)(runId, { projectId: "proj-1" });
+  return { run, critiqueScene, polishScene, publishEvent, emitSceneFinal };
+}
+
+async function withFastApproval(fn: () => Promise<void>): Promise<void> {
+  process.env.FAST_APPROVAL_ENABLED = "true";
+  try {
+    await fn();
+  } finally {
+    delete process.env.FAST_APPROVAL_ENABLED;
+  }
+}
+
+describe("runDraftingLoop fast approval", () => {
+  it("accepts the revision of an 8-scoring draft without re-critique and still polishes it", async () => {
+    const { run, critiqueScene, polishScene, publishEvent, emitSceneFinal } = setup({ score: 8, revision_needed: true, issues: ["one flat line"] });
+    await withFastApproval(run);
+    expect(critiqueScene).toHaveBeenCalledTimes(1);
+    expect(publishEvent).toHaveBeenCalledWith("run-1", "scene_approved", { sceneNum: 1, reason: "fast_approval", score: 8 });
+    expect(polishScene).toHaveBeenCalledTimes(1);
+    expect(emitSceneFinal).not.toHaveBeenCalled();
+  });
+
+  it("re-critiques when the draft scored under 8 or hit a hard failure", async () => {
+    for (const critique of [{ score: 7.5, revision_needed: true }, { score: 8, revision_needed: true, wordCountCompliance: false }]) {
+      const { run, critiqueScene } = setup(critique);
+      await withFastApproval(run);
+      expect(critiqueScene.mock.calls.length).toBeGreaterThan(1);
+    }
+  });
+
+  it("is off by default", async () => {
+    const { run, critiqueScene } = setup({ score: 8, revision_needed: true });
+    await run();
+    expect(critiqueScene.mock.calls.length).toBeGreaterThan(1);
+  });
+});
@@ -12,6 +12,7 @@ jest.mock("../services/LangfuseService", () => ({
 }));
 
 import { StorytellerOrchestrator } from "../services/StorytellerOrchestrator";
+import { GenerationPhase } from "../models/LLMModels";
 
 type AnyObj = Record<string, unknown>;
 
@@ -33,4 +34,28 @@ describe("runNarratorDesignPhase persists narratorVoice", () => {
 
     expect(state.narratorVoice).toEqual(voice);
   });
+
+  it("pins the Profiler's phase even if the live phase changes mid-call", async () => {
+    const o = new StorytellerOrchestrator() as unknown as AnyObj;
+    const runId = "run-1";
+    const state: AnyObj = { runId, projectId: "proj-1", narrative: {}, characters: [], updatedAt: "" };
+    o.activeRuns = new Map([[runId, state]]);
+    let seenPhase: unknown;
+    o.agentFactory = {
+      getAgent: () => ({
+        execute: async (ctx: AnyObj) => {
+          state.phase = "worldbuilding"; // a concurrent phase moving on
+          seenPhase = (ctx.state as AnyObj).phase;
+          return { content: {} };
+        },
+      }),
+    };
+    o.publishPhaseStart = jest.fn(async () => {});
+    o.publishPhaseComplete = jest.fn(async () => {});
+    o.saveArtifact = jest.fn(async () => {});
+
+    await (o.runNarratorDesignPhase as (r: string, opts: AnyObj) => Promise<void>)(runId, { projectId: "proj-1" });
+
+    expect(seenPhase).toBe(GenerationPhase.NARRATOR_DESIGN);
+  });
 });
@@ -28,7 +28,7 @@ jest.mock("@google/generative-ai", () => ({
 
 jest.mock("uuid", () => ({ v4: jest.fn().mockReturnValue("test-uuid") }));
 
-import { QdrantMemoryService } from "../services/QdrantMemoryService";
+import { QdrantMemoryService, EmbeddingProvider } from "../services/QdrantMemoryService";
 
 describe("QdrantMemoryService.localEmbedding (deterministic local embeddings)", () => {
   it("returns a vector of the requested dimension", () => {
@@ -89,3 +89,52 @@ describe("QdrantMemoryService.extractEmbedding (OpenAI response guard)", () => {
     ).toThrow(/empty|no embedding/i);
   });
 });
+
+describe("QdrantMemoryService.scenePointId (deterministic scene IDs)", () => {
+  it("maps the same project scene to the same UUID-shaped point ID", () => {
+    const id = QdrantMemoryService.scenePointId("project-1", 3);
+    expect(id).toBe(QdrantMemoryService.scenePointId("project-1", 3));
+    expect(id).toMatch(/^[0-9a-f]{8}-[0-9a-f]{4}-5[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$/);
+  });
+
+  it("distinguishes scenes and projects", () => {
+    const id = QdrantMemoryService.scenePointId("project-1", 3);
+    expect(QdrantMemoryService.scenePointId("project-1", 4)).not.toBe(id);
+    expect(QdrantMemoryService.scenePointId("project-2", 3)).not.toBe(id);
+  });
+});
+
+describe("QdrantMemoryService search query embeddings", () => {
+  function makeService(generateEmbedding: jest.Mock) {
+    const svc = new QdrantMemoryService();
+    const o = svc as unknown as Record<string, unknown>;
+    o.embeddingProvider = EmbeddingProvider.OPENAI;
+    o.client = { search: jest.fn(async () => []) };
+    o.metricsService = { recordQdrantOperation: jest.fn() };
+    o.generateEmbedding = generateEmbedding;
+    return svc;
+  }
+
+  it("embeds a query once for the three concurrent context searches", async () => {
+    const generateEmbedding = jest.fn(async () => [0.1, 0.2]);
+    const svc = makeService(generateEmbedding);
+    await Promise.all([
+      svc.searchCharacters("p", "The Vault Mara"),
+      svc.searchWorldbuilding("p", "The Vault Mara"),
+      svc.searchScenes("p", "The Vault Mara"),
+    ]);
+    expect(generateEmbedding).toHaveBeenCalledTimes(1);
+    await svc.searchScenes("p", "The Docks");
+    expect(generateEmbedding).toHaveBeenCalledTimes(2);
+  });
+
+  it("does not keep a failed query embedding", async () => {
+    const generateEmbedding = jest.fn()
+      .mockRejectedValueOnce(new Error("rate limited"))
+      .mockResolvedValue([0.1, 0.2]);
+    const svc = makeService(generateEmbedding);
+    await expect(svc.searchScenes("p", "q")).rejects.toThrow("rate limited");
+    await expect(svc.searchScenes("p", "q")).resolves.toEqual([]);
+    expect(generateEmbedding).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,32 @@
+/**
+ * Tests the REAL StorytellerOrchestrator.extractRawFacts categorization: facts
+ * are only taken for canonical character names, deduplicated per subject +
+ * action, and categorized char/world/plot by the action verb.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { AgentType } from "../models/AgentModels";
+import { AnyObj, makeOrchestrator } from "./helpers/fixtures";
+
+describe("extractRawFacts categorization", () => {
+  it("categorizes canonical-name facts by action and skips unknown subjects", async () => {
+    const { orch, o } = makeOrchestrator();
+    const runId = "run-facts";
+    const state: AnyObj = { characters: [{ name: "Elena Voss" }], rawFactsLog: [] };
+    o.activeRuns = new Map([[runId, state]]);
+    const publishEvent = jest.fn(async () => {});
+    o.publishEvent = publishEvent;
+
+    const content = "Elena smiled. Elena walked away. Elena discovered the key. Elena said no. Marcus died. Elena smiled.";
+    await (o.extractRawFacts as (r: string, n: number, c: string, s: AgentType) => Promise<void>).call(
+      orch, runId, 2, content, AgentType.WRITER
+    );
+
+    const developments = (publishEvent.mock.calls[0] as unknown[])[2] as { developments: AnyObj[] };
+    const byChange = Object.fromEntries(developments.developments.map((d) => [d.change, d.category]));
+    expect(byChange).toEqual({ smiled: "char", walked: "world", discovered: "plot", said: "plot" });
+    expect((state.rawFactsLog as AnyObj[]).length).toBe(4);
+    // One extraction pass shares one timestamp.
+    expect(new Set((state.rawFactsLog as AnyObj[]).map((f) => f.timestamp)).size).toBe(1);
+  });
+});
@@ -93,3 +93,84 @@ describe("runGeneration phase skip", () => {
     expect(ran).toEqual(["runDraftingLoop"]);
   });
 });
+
+describe("runGeneration with PARALLEL_PLANNING_ENABLED", () => {
+  afterEach(() => {
+    delete process.env.PARALLEL_PLANNING_ENABLED;
+  });
+
+  it("runs the planning chain without waiting for narrator design", async () => {
+    process.env.PARALLEL_PLANNING_ENABLED = "true";
+    const { o, ran } = makeOrch();
+    let releaseNarrator!: () => void;
+    o.runNarratorDesignPhase = jest.fn(() => new Promise<void>((resolve) => {
+      releaseNarrator = () => { ran.push("runNarratorDesignPhase"); resolve(); };
+    }));
+    o.runAdvancedPlanningPhase = jest.fn(async () => {
+      ran.push("runAdvancedPlanningPhase");
+      releaseNarrator();
+    });
+    const runId = "run-4";
+    o.activeRuns = new Map([[runId, state(runId)]]);
+    await (o.runGeneration as (r: string, opt: AnyObj) => Promise<void>)(runId, { projectId: "p" });
+    expect(ran).toEqual([
+      "runGenesisPhase",
+      "runCharactersPhase",
+      "runWorldbuildingPhase",
+      "runOutliningPhase",
+      "runAdvancedPlanningPhase",
+      "runNarratorDesignPhase",
+      "runDraftingLoop",
+    ]);
+  });
+
+  it("still skips the phases before start_from_phase", async () => {
+    process.env.PARALLEL_PLANNING_ENABLED = "true";
+    const { o, ran } = makeOrch();
+    const runId = "run-5";
+    o.activeRuns = new Map([[runId, state(runId)]]);
+    await (o.runGeneration as (r: string, opt: AnyObj) => Promise<void>)(runId, {
+      projectId: "p",
+      startFromPhase: GenerationPhase.OUTLINING,
+      previousRunId: "run-old",
+    });
+    expect(ran).toEqual(["runOutliningPhase", "runAdvancedPlanningPhase", "runDraftingLoop"]);
+  });
+
+  it("marks the run in flight only while a planning phase runs", async () => {
+    process.env.PARALLEL_PLANNING_ENABLED = "true";
+    const { o } = makeOrch();
+    const runId = "run-6";
+    const runState = state(runId);
+    o.activeRuns = new Map([[runId, runState]]);
+    const seen: Record<string, unknown> = {};
+    for (const m of PHASE_METHODS.slice(2)) {
+      o[m] = jest.fn(async () => { seen[m] = runState.inFlight; });
+    }
+    await (o.runGeneration as (r: string, opt: AnyObj) => Promise<void>)(runId, { projectId: "p" });
+    expect(seen).toEqual({
+      runNarratorDesignPhase: true,
+      runWorldbuildingPhase: true,
+      runOutliningPhase: true,
+      runAdvancedPlanningPhase: true,
+      runDraftingLoop: false,
+    });
+  });
+
+  it("pins narrator design's phase on its agent context, not the shared state", async () => {
+    process.env.PARALLEL_PLANNING_ENABLED = "true";
+    const o = new StorytellerOrchestrator() as unknown as AnyObj;
+    const runId = "run-7";
+    const runState = { ...state(runId), phase: GenerationPhase.OUTLINING };
+    o.activeRuns = new Map([[runId, runState]]);
+    o.publishEvent = jest.fn(async () => {});
+    o.mirrorStatus = jest.fn(async () => {});
+    o.saveArtifact = jest.fn(async () => {});
+    o.langfuse = { addEvent: jest.fn() };
+    const execute = jest.fn(async (_context: AnyObj) => ({ content: { voice: "wry" } }));
+    o.agentFactory = { getAgent: () => ({ execute }) };
+    await (o.runNarratorDesignPhase as (r: string, opt: AnyObj) => Promise<void>)(runId, { projectId: "p" });
+    expect((execute.mock.calls[0][0].state as AnyObj).phase).toBe(GenerationPhase.NARRATOR_DESIGN);
+    expect(runState.phase).toBe(GenerationPhase.OUTLINING);
+  });
+});
@@ -121,4 +121,95 @@ describe("runDraftingLoop scene-level regeneration", () => {
     await (o.runDraftingLoop as (r: string, opt: AnyObj) => Promise<void>)(runId, { projectId: "p" });
     expect(drafted).toEqual([1, 2, 3]);
   });
+
+  it("requests every kept scene's prior prose before drafting the first regenerated scene", async () => {
+    const canned = {
+      final_scene_1: { sceneNum: 1, content: "kept final 1", wordCount: 1500 },
+      final_scene_3: { sceneNum: 3, content: "kept final 3", wordCount: 1500 },
+    };
+    const { o, getCalls } = makeOrch(canned);
+    const callsAtDraft: string[][] = [];
+    const draft = o.draftScene as (...args: unknown[]) => Promise<void>;
+    o.draftScene = o.draftSceneWithBeats = jest.fn(async (...args: unknown[]) => {
+      callsAtDraft.push([...getCalls]);
+      await draft(...args);
+    });
+    const runId = "run-4";
+    o.activeRuns = new Map([[runId, state(runId)]]);
+
+    await (o.runDraftingLoop as (r: string, opt: AnyObj) => Promise<void>)(runId, {
+      projectId: "p",
+      previousRunId: "run-old",
+      scenesToRegenerate: [2],
+    });
+
+    expect(callsAtDraft).toEqual([["final_scene_1", "final_scene_3"]]);
+    const drafts = (o.activeRuns as Map<string, AnyObj>).get(runId)!.drafts as Map<number, AnyObj>;
+    expect((drafts.get(3) as AnyObj).content).toBe("kept final 3");
+  });
+
+  it("reads kept scenes only a few scenes ahead and stops reading once the run stops", async () => {
+    const canned: Record<string, unknown> = {};
+    for (const n of [2, 3, 4, 5, 6]) canned[`final_scene_${n}`] = { sceneNum: n, content: `kept final ${n}`, wordCount: 1500 };
+    const { o, getCalls } = makeOrch(canned);
+    const callsAtDraft: string[][] = [];
+    let stopped = false;
+    const draft = o.draftScene as (...args: unknown[]) => Promise<void>;
+    o.draftScene = o.draftSceneWithBeats = jest.fn(async (...args: unknown[]) => {
+      callsAtDraft.push([...getCalls]);
+      await draft(...args);
+      stopped = true;
+    });
+    o.shouldStop = jest.fn(() => stopped);
+    const runId = "run-6";
+    const runState = state(runId);
+    runState.outline = { scenes: Array.from({ length: 6 }, () => ({ wordCount: 800 })) };
+    o.activeRuns = new Map([[runId, runState]]);
+
+    await (o.runDraftingLoop as (r: string, opt: AnyObj) => Promise<void>)(runId, {
+      projectId: "p",
+      previousRunId: "run-old",
+      scenesToRegenerate: [1],
+    });
+
+    expect(callsAtDraft).toEqual([["final_scene_2", "final_scene_3"]]);
+    expect(getCalls).toEqual(["final_scene_2", "final_scene_3"]);
+  });
+
+  it("with PARALLEL_KEPT_SCENE_SUMMARIES, summarizes kept scenes up front but appends them in scene order", async () => {
+    process.env.PARALLEL_KEPT_SCENE_SUMMARIES = "true";
+    try {
+      const canned = {
+        final_scene_1: { sceneNum: 1, content: "kept final 1", wordCount: 1500 },
+        final_scene_3: { sceneNum: 3, content: "kept final 3", wordCount: 1500 },
+      };
+      const { o } = makeOrch(canned);
+      const summarized: number[] = [];
+      o.agentFactory = {
+        getAgent: () => ({
+          summarizeScene: async (_r: string, _o: AnyObj, n: number) => { summarized.push(n); return `summary ${n}`; },
+        }),
+      };
+      const summarizedAtDraft: number[][] = [];
+      const draft = o.draftScene as (...args: unknown[]) => Promise<void>;
+      o.draftScene = o.draftSceneWithBeats = jest.fn(async (...args: unknown[]) => {
+        summarizedAtDraft.push([...summarized]);
+        await draft(...args);
+      });
+      const runId = "run-5";
+      o.activeRuns = new Map([[runId, state(runId)]]);
+
+      await (o.runDraftingLoop as (r: string, opt: AnyObj) => Promise<void>)(runId, {
+        projectId: "p",
+        previousRunId: "run-old",
+        scenesToRegenerate: [2],
+      });
+
+      expect(summarizedAtDraft).toEqual([[1, 3]]);
+      const synopsis = (o.activeRuns as Map<string, AnyObj>).get(runId)!.rollingSynopsis as AnyObj[];
+      expect(synopsis.map((e) => e.sceneNumber)).toEqual([1, 2, 3]);
+    } finally {
+      delete process.env.PARALLEL_KEPT_SCENE_SUMMARIES;
+    }
+  });
 });
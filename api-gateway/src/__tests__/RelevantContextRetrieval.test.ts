@@ -0,0 +1,46 @@
+/**
+ * Tests the REAL StorytellerOrchestrator.getRelevantContext: the three Qdrant
+ * searches start together, and a failed search only drops its own section.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { AnyObj, makeOrchestrator } from "./helpers/fixtures";
+
+function build(qdrantMemory: AnyObj): (outline: AnyObj) => Promise<string> {
+  const { orch, o } = makeOrchestrator();
+  o.qdrantMemory = qdrantMemory;
+  return (outline) =>
+    (o.getRelevantContext as (p: string, s: AnyObj) => Promise<string>).call(orch, "proj-1", outline);
+}
+
+describe("getRelevantContext", () => {
+  it("issues all three searches before any of them resolves", async () => {
+    let releaseCharacters: (v: unknown[]) => void = () => {};
+    const qdrantMemory = {
+      searchCharacters: jest.fn(() => new Promise<unknown[]>((r) => { releaseCharacters = r; })),
+      searchWorldbuilding: jest.fn(async () => []),
+      searchScenes: jest.fn(async () => []),
+    };
+    const pending = build(qdrantMemory)({ title: "The Vault" });
+    await Promise.resolve();
+    expect(qdrantMemory.searchWorldbuilding).toHaveBeenCalled();
+    expect(qdrantMemory.searchScenes).toHaveBeenCalled();
+    releaseCharacters([{ score: 0.9, payload: { name: "Ada", character: { role: "thief" } } }]);
+    expect(await pending).toContain("- Ada: thief");
+  });
+
+  it("keeps the sections whose searches succeeded", async () => {
+    const warn = jest.spyOn(console, "warn").mockImplementation(() => {});
+    const out = await build({
+      searchCharacters: jest.fn(async () => { throw new Error("qdrant down"); }),
+      searchWorldbuilding: jest.fn(async () => [
+        { score: 0.8, payload: { elementType: "location", element: { name: "Vault", description: "deep" } } },
+      ]),
+      searchScenes: jest.fn(async () => []),
+    })({ title: "The Vault" });
+    expect(out).toContain("RELEVANT WORLDBUILDING:\n- location: Vault - deep");
+    expect(out).not.toContain("RELEVANT CHARACTERS");
+    expect(warn).toHaveBeenCalled();
+    warn.mockRestore();
+  });
+});
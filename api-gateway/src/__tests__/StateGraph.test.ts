@@ -0,0 +1,18 @@
+import { GenerationPhase } from "../models/LLMModels";
+import { GENERATION_GRAPH, getStateNode, getStateNodeByPhase, getStateNodeIndex } from "../models/StateGraph";
+
+describe("StateGraph lookups (real shipped definitions)", () => {
+  it("indexed lookups agree with a linear scan of GENERATION_GRAPH", () => {
+    GENERATION_GRAPH.forEach((node) => {
+      expect(getStateNode(node.id)).toBe(GENERATION_GRAPH.find((n) => n.id === node.id));
+      expect(getStateNodeIndex(node.id)).toBe(GENERATION_GRAPH.findIndex((n) => n.id === node.id));
+      expect(getStateNodeByPhase(node.phase)).toBe(GENERATION_GRAPH.find((n) => n.phase === node.phase));
+    });
+  });
+
+  it("returns undefined / -1 for unknown ids", () => {
+    expect(getStateNode("nope")).toBeUndefined();
+    expect(getStateNodeIndex("nope")).toBe(-1);
+    expect(getStateNodeByPhase("nope" as GenerationPhase)).toBeUndefined();
+  });
+});
@@ -0,0 +1,26 @@
+/**
+ * state.messages is capped at MAX_STATE_MESSAGES while a run is live, and the
+ * same cap applies when a snapshot is restored, so runs checkpointed before
+ * the cap existed do not come back with an unbounded message log.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { AnyObj, makeOrchestrator } from "./helpers/fixtures";
+
+describe("StorytellerOrchestrator state.messages cap on restore", () => {
+  it("keeps only the newest messages from an oversized snapshot", () => {
+    const { o } = makeOrchestrator();
+    const messages = Array.from({ length: 250 }, (_, i) => ({ sender: "Writer", content: `m${i}` }));
+    const state = (o.deserializeState as (s: AnyObj) => AnyObj)({ runId: "r", messages });
+    const restored = state.messages as AnyObj[];
+    expect(restored).toHaveLength(200);
+    expect(restored[0].content).toBe("m50");
+    expect(restored[199].content).toBe("m249");
+  });
+
+  it("defaults to an empty log when the snapshot has none", () => {
+    const { o } = makeOrchestrator();
+    const state = (o.deserializeState as (s: AnyObj) => AnyObj)({ runId: "r" });
+    expect(state.messages).toEqual([]);
+  });
+});
@@ -0,0 +1,30 @@
+/**
+ * Tests the REAL SupabaseService.derivePhaseFromArtifactType mapping used to
+ * file every run artifact under its phase.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { SupabaseService } from "../services/SupabaseService";
+
+const derive = (artifactType: string): string =>
+  (SupabaseService.prototype as unknown as { derivePhaseFromArtifactType(t: string): string })
+    .derivePhaseFromArtifactType(artifactType);
+
+describe("SupabaseService.derivePhaseFromArtifactType", () => {
+  it("maps whole-run and per-scene artifact types to their phase", () => {
+    expect(derive("narrative")).toBe("genesis");
+    expect(derive("advanced_plan")).toBe("advanced_planning");
+    expect(derive("run_state_snapshot")).toBe("snapshot");
+    expect(derive("draft_scene_3")).toBe("drafting");
+    expect(derive("critique_scene_12")).toBe("drafting");
+    expect(derive("revision_scene_1")).toBe("drafting");
+    expect(derive("final_scene_7")).toBe("polish");
+  });
+
+  it("returns unknown for anything else", () => {
+    expect(derive("quality_scene_2")).toBe("unknown");
+    expect(derive("_scene_2")).toBe("unknown");
+    expect(derive("draft_scenes")).toBe("unknown");
+    expect(derive("run_config")).toBe("unknown");
+  });
+});
@@ -96,4 +96,74 @@ describe("runDraftingLoop synopsis + value-shift threading", () => {
     // Must be +3 (final critique of finalized text), NOT -9 (stale pre-revision critique).
     expect(vs.get(1)).toBe(3);
   });
+
+  it("summarizes the soft text while the spice pass is still running", async () => {
+    const orch = new StorytellerOrchestrator();
+    const o = orch as unknown as AnyObj;
+    const runId = "run-3";
+    const state = makeState(runId, 1);
+    o.activeRuns = new Map([[runId, state]]);
+
+    o.draftScene = jest.fn(async (_r: string, _o: AnyObj, n: number) => {
+      (state.drafts as Map<number, AnyObj>).set(n, { wordCount: 500, content: `scene ${n} text` });
+    });
+    o.draftSceneWithBeats = jest.fn(async () => {});
+    o.expandScene = jest.fn(async () => {});
+    o.critiqueScene = jest.fn(async () => ({ approved: true, score: 8, valueShiftDelivered: 1 }));
+    o.reviseScene = jest.fn(async () => {});
+    o.polishScene = jest.fn(async () => {});
+    o.runArchivistCheck = jest.fn(async () => {});
+    o.publishEvent = jest.fn(async () => {});
+    o.emitSceneFinal = jest.fn(async () => {});
+    let releaseSpice!: () => void;
+    o.applySpicePass = jest.fn(() => new Promise<void>((resolve) => { releaseSpice = resolve; }));
+    const summarized: number[] = [];
+    o.agentFactory = { getAgent: () => ({ summarizeScene: async (_r: string, _o: AnyObj, n: number) => { summarized.push(n); return `summary of scene ${n}`; } }) };
+
+    const loop = (o.runDraftingLoop as (r: string, opts: AnyObj) => Promise<void>)(runId, { projectId: "proj-1" });
+    while (!releaseSpice) await new Promise((r) => setImmediate(r));
+    await new Promise((r) => setImmediate(r));
+    expect(summarized).toEqual([1]);
+    releaseSpice();
+    await loop;
+    expect((state.rollingSynopsis as unknown[])).toHaveLength(1);
+  });
+
+  it("summarizes the approved text while the polish call runs with PARALLEL_POLISH_SYNOPSIS", async () => {
+    const orch = new StorytellerOrchestrator();
+    const o = orch as unknown as AnyObj;
+    const runId = "run-4";
+    const state = makeState(runId, 1);
+    o.activeRuns = new Map([[runId, state]]);
+
+    o.draftScene = jest.fn(async (_r: string, _o: AnyObj, n: number) => {
+      (state.drafts as Map<number, AnyObj>).set(n, { wordCount: 500, content: `scene ${n} text` });
+    });
+    o.draftSceneWithBeats = jest.fn(async () => {});
+    o.expandScene = jest.fn(async () => {});
+    o.critiqueScene = jest.fn(async () => ({ approved: true, score: 7, valueShiftDelivered: 1 }));
+    o.reviseScene = jest.fn(async () => {});
+    let releasePolish!: () => void;
+    o.polishScene = jest.fn(() => new Promise<void>((resolve) => { releasePolish = resolve; }));
+    o.runArchivistCheck = jest.fn(async () => {});
+    o.publishEvent = jest.fn(async () => {});
+    o.emitSceneFinal = jest.fn(async () => {});
+    o.applySpicePass = jest.fn(async () => {});
+    const summarized: string[] = [];
+    o.agentFactory = { getAgent: () => ({ summarizeScene: async (_r: string, _o: AnyObj, n: number, text: string) => { summarized.push(text); return `summary of scene ${n}`; } }) };
+
+    process.env.PARALLEL_POLISH_SYNOPSIS = "true";
+    try {
+      const loop = (o.runDraftingLoop as (r: string, opts: AnyObj) => Promise<void>)(runId, { projectId: "proj-1" });
+      while (!releasePolish) await new Promise((r) => setImmediate(r));
+      await new Promise((r) => setImmediate(r));
+      expect(summarized).toEqual(["scene 1 text"]);
+      releasePolish();
+      await loop;
+    } finally {
+      delete process.env.PARALLEL_POLISH_SYNOPSIS;
+    }
+    expect(summarized).toHaveLength(1);
+    expect(state.rollingSynopsis).toEqual([{ sceneNumber: 1, summary: "summary of scene 1" }]);
+  });
 });
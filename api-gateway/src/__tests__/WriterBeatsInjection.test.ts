@@ -96,3 +96,21 @@ describe("WriterAgent injects continuity + plan into beats/expansion paths", ()
     expect(prompt).toContain("Return ONLY the continuation text");
   });
 });
+
+describe("WriterAgent continuation tails", () => {
+  const words = Array.from({ length: 80 }, (_, i) => `w${i + 1}`);
+  const existingContent = `  ${words.slice(0, 40).join(" ")}\n\n${words.slice(40).join("  ")}\n`;
+  const tail = (n: number) => `"...${words.slice(-n).join(" ")}"`;
+
+  it("beats continuation quotes the scene's last 50 words", () => {
+    const prompt = buildPrompt(baseState({ beatsMode: true, partIndex: 2, partsTotal: 3, partTargetWords: 500, isFirstPart: false, existingContent }));
+    expect(prompt).toContain(`The scene so far ends with:\n${tail(50)}`);
+    expect(prompt).not.toContain("w30 w31");
+  });
+
+  it("expansion quotes the scene's last 15 words", () => {
+    const prompt = buildPrompt(baseState({ expansionMode: true, additionalWordsNeeded: 400, existingContent }));
+    expect(prompt).toContain(`The scene ends with:\n${tail(15)}`);
+    expect(prompt).not.toContain("w65 w66");
+  });
+});
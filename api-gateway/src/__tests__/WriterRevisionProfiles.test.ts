@@ -0,0 +1,75 @@
+/**
+ * The Writer's REVISION prompt re-sends character profiles on every round, so
+ * it carries only the characters present in the scene (falling back to the
+ * full cast when presence is unknown). Canonical names still list everyone.
+ */
+jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+
+import { GenerationPhase } from "../models/LLMModels";
+import { AnyObj, makeWriter } from "./helpers/fixtures";
+
+function revisionContext(present: string[]): AnyObj {
+  const drafts = new Map<number, AnyObj>([[1, { content: "Mara waited." }]]);
+  const critiques = new Map<number, AnyObj[]>([[1, [{ issues: ["flat"], revisionRequests: [] }]]]);
+  return {
+    runId: "r", projectId: "p",
+    state: {
+      currentScene: 1,
+      outline: { scenes: [{ title: "Dock" }] },
+      drafts, critiques,
+      keyConstraints: [],
+      characters: [
+        { name: "Mara", role: "lead", backstory: "MARA_BACKSTORY" },
+        { name: "Vex", role: "foe", backstory: "VEX_BACKSTORY" },
+      ],
+      currentSceneContract: { charactersPresent: present },
+    },
+  };
+}
+
+function revisionPrompt(present: string[]): string {
+  const w = makeWriter() as unknown as AnyObj;
+  return (w.buildUserPrompt as (c: AnyObj, o: AnyObj, p: GenerationPhase) => string)(
+    revisionContext(present), { projectId: "p" }, GenerationPhase.REVISION
+  );
+}
+
+describe("WriterAgent REVISION prompt character profiles", () => {
+  it("includes only the profiles of characters present in the scene", () => {
+    const prompt = revisionPrompt(["mara"]);
+    expect(prompt).toContain("MARA_BACKSTORY");
+    expect(prompt).not.toContain("VEX_BACKSTORY");
+  });
+
+  it("falls back to the full cast when presence is unknown", () => {
+    const prompt = revisionPrompt([]);
+    expect(prompt).toContain("MARA_BACKSTORY");
+    expect(prompt).toContain("VEX_BACKSTORY");
+  });
+});
+
+describe("WriterAgent scene outline serialization", () => {
+  it("does not repeat retrieved context inside the outline JSON", () => {
+    const w = makeWriter() as unknown as AnyObj;
+    const ctx = revisionContext([]);
+    (ctx.state as AnyObj).currentSceneOutline = { title: "Dock", retrievedContext: "RETRIEVED_CTX" };
+    const prompt = (w.buildUserPrompt as (c: AnyObj, o: AnyObj, p: GenerationPhase) => string)(
+      ctx, { projectId: "p" }, GenerationPhase.REVISION
+    );
+    expect(prompt.split("RETRIEVED_CTX")).toHaveLength(2);
+    expect(prompt).toContain('{"title":"Dock"}');
+  });
+});
+
+describe("WriterAgent revision feedback payload", () => {
+  it("sends only non-empty feedback sections and weak rubric dimensions", () => {
+    const w = makeWriter() as unknown as AnyObj;
+    const ctx = revisionContext([]);
+    const critiques = (ctx.state as AnyObj).critiques as Map<number, AnyObj[]>;
+    critiques.set(1, [{ issues: ["flat"], revisionRequests: [], rubric: { pacing: 5, proseCraft: 8 } }]);
+    const prompt = (w.buildUserPrompt as (c: AnyObj, o: AnyObj, p: GenerationPhase) => string)(
+      ctx, { projectId: "p" }, GenerationPhase.REVISION
+    );
+    expect(prompt).toContain('{"issues":["flat"],"weakRubric":{"pacing":5}}');
+  });
+});
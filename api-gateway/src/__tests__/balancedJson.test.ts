@@ -0,0 +1,52 @@
+import { findBalancedJSON, parseEmbeddedJSON } from "../utils/balancedJson";
+
+describe("findBalancedJSON (real shipped logic)", () => {
+  it("finds an object surrounded by prose", () => {
+    expect(findBalancedJSON('Sure! {"score": 8} Hope this helps.')).toBe('{"score": 8}');
+  });
+
+  it("ignores brackets inside string literals, including escaped quotes", () => {
+    const text = 'Result: {"note": "a } and a \\" quote", "n": [1, 2]} trailing }';
+    expect(findBalancedJSON(text)).toBe('{"note": "a } and a \\" quote", "n": [1, 2]}');
+  });
+
+  it("finds a top-level array", () => {
+    expect(findBalancedJSON('Here: [{"a": 1}] done')).toBe('[{"a": 1}]');
+  });
+
+  it("returns null when there is no bracket or the span never closes", () => {
+    expect(findBalancedJSON("no json here")).toBeNull();
+    expect(findBalancedJSON('{"open": true')).toBeNull();
+  });
+
+  it("retries from a later opener when an earlier one never closes", () => {
+    expect(findBalancedJSON('Note: { see below. {"score": 8}')).toBe('{"score": 8}');
+  });
+});
+
+describe("parseEmbeddedJSON (real shipped logic)", () => {
+  it("skips balanced spans that are not JSON", () => {
+    expect(parseEmbeddedJSON('Per [ref 1] and {draft}: {"score": 8}')).toEqual({
+      json: '{"score": 8}',
+      value: { score: 8 },
+    });
+  });
+
+  it("skips a bracketed citation ahead of the payload", () => {
+    expect(parseEmbeddedJSON('Per the rubric [1], here is my score: {"score": 8}')).toEqual({
+      json: '{"score": 8}',
+      value: { score: 8 },
+    });
+  });
+
+  it("returns an embedded array whole when no object follows it", () => {
+    expect(parseEmbeddedJSON('Here: [{"a": 1}, {"a": 2}] {note}')).toEqual({
+      json: '[{"a": 1}, {"a": 2}]',
+      value: [{ a: 1 }, { a: 2 }],
+    });
+  });
+
+  it("returns null when no span parses", () => {
+    expect(parseEmbeddedJSON("[a] {b}")).toBeNull();
+  });
+});
@@ -0,0 +1,48 @@
+import { characterIndex, characterNameVariants, memoizeRosterBlock, selectCharactersByName } from "../utils/characterIndex";
+
+describe("characterIndex (real shipped logic)", () => {
+  const cast = [
+    { name: "Mara", role: "lead" },
+    { name: " Vex ", role: "foe" },
+    { role: "nameless" },
+    { name: "mara", role: "duplicate" },
+  ];
+
+  it("indexes by trimmed, lower-cased name and keeps the first duplicate", () => {
+    const index = characterIndex(cast);
+    expect(index.get("vex")?.role).toBe("foe");
+    expect(index.get("mara")?.role).toBe("lead");
+    expect(index.size).toBe(2);
+  });
+
+  it("reuses the index for the same roster array", () => {
+    expect(characterIndex(cast)).toBe(characterIndex(cast));
+    expect(characterIndex([...cast])).not.toBe(characterIndex(cast));
+  });
+
+  it("selects profiles in the requested order, skipping unknown and repeated names", () => {
+    const selected = selectCharactersByName(cast, ["VEX", "Nobody", "Mara", "vex"]);
+    expect(selected.map((c) => c.role)).toEqual(["foe", "lead"]);
+  });
+});
+
+describe("memoizeRosterBlock (real shipped logic)", () => {
+  it("builds once per roster and key", () => {
+    const cast = [{ name: "Mara" }];
+    const build = jest.fn(() => "block");
+    expect(memoizeRosterBlock(cast, "a", build)).toBe("block");
+    expect(memoizeRosterBlock(cast, "a", build)).toBe("block");
+    expect(build).toHaveBeenCalledTimes(1);
+    memoizeRosterBlock(cast, "b", build);
+    memoizeRosterBlock([...cast], "a", build);
+    expect(build).toHaveBeenCalledTimes(3);
+  });
+});
+
+describe("characterNameVariants (real shipped logic)", () => {
+  it("collects lower-cased full, first and last names once per roster", () => {
+    const cast = [{ name: "Mara Quill" }, { name: "Vex" }, { role: "nameless" }];
+    expect([...characterNameVariants(cast)]).toEqual(["mara quill", "mara", "quill", "vex"]);
+    expect(characterNameVariants(cast)).toBe(characterNameVariants(cast));
+  });
+});
@@ -11,4 +11,10 @@ describe("buildConstraintsBlock (real shipped format)", () => {
     ]);
     expect(out).toBe("- genre: noir (Scene 0)\n- weapon: revolver (Scene 3)");
   });
+  it("re-renders an array only when it grows", () => {
+    const constraints = [{ key: "genre", value: "noir", sceneNumber: 0 }];
+    expect(buildConstraintsBlock(constraints)).toBe(buildConstraintsBlock(constraints));
+    constraints.push({ key: "city", value: "Oslo", sceneNumber: 2 });
+    expect(buildConstraintsBlock(constraints)).toBe("- genre: noir (Scene 0)\n- city: Oslo (Scene 2)");
+  });
 });
@@ -1,4 +1,4 @@
-import { parseEvaluationResponse } from "../utils/evaluationResponseParser";
+import { parseEvaluationResponse, parseBatchEvaluationResponse, normalizeBatchItem } from "../utils/evaluationResponseParser";
 
 describe("parseEvaluationResponse (real shipped logic)", () => {
   it("parses a clean JSON object", () => {
@@ -35,3 +35,48 @@ describe("parseEvaluationResponse (real shipped logic)", () => {
     expect(parseEvaluationResponse('{"score": 0.5, ', "m", 1)).toBeNull();
   });
 });
+
+describe("parseBatchEvaluationResponse (real shipped logic)", () => {
+  it("returns one clamped result per numbered item", () => {
+    const r = parseBatchEvaluationResponse(
+      'Verdict: {"results": [{"item": 1, "score": 0.7, "reasoning": "fits"}, {"item": 2, "score": 3}, {"score": 0.5}]}',
+      "m", 4
+    );
+    expect([...r.keys()]).toEqual([1, 2]);
+    expect(r.get(1)).toEqual({ score: 0.7, reasoning: "fits", evaluationModel: "m", durationMs: 4 });
+    expect(r.get(2)?.score).toBe(1);
+  });
+
+  it("normalizes loosely echoed item labels and keeps the first entry per item", () => {
+    const r = parseBatchEvaluationResponse(
+      '{"results": [{"item": " ITEM 1 ", "score": 0.1}, {"item": "#2", "score": 0.2}, {"item": "3", "score": 0.3}, {"item": 1, "score": 0.9}, {"item": "Ada", "score": 0.4}]}',
+      "m", 1
+    );
+    expect([...r.entries()].map(([item, res]) => [item, res.score])).toEqual([[1, 0.1], [2, 0.2], [3, 0.3]]);
+  });
+
+  it("accepts a bare array", () => {
+    expect(parseBatchEvaluationResponse('[{"item": 1, "score": 0.2}]', "m", 1).get(1)?.score).toBe(0.2);
+  });
+
+  it("returns an empty map when there is no usable JSON", () => {
+    expect(parseBatchEvaluationResponse("no json here", "m", 1).size).toBe(0);
+    expect(parseBatchEvaluationResponse('{"results": [', "m", 1).size).toBe(0);
+  });
+});
+
+describe("normalizeBatchItem (real shipped logic)", () => {
+  it("maps numbers and item labels to positive item numbers", () => {
+    expect(normalizeBatchItem(2)).toBe(2);
+    expect(normalizeBatchItem(" item  4")).toBe(4);
+    expect(normalizeBatchItem("#5")).toBe(5);
+  });
+
+  it("rejects names, zero, negatives and fractions", () => {
+    expect(normalizeBatchItem("Scene 3")).toBeNull();
+    expect(normalizeBatchItem(0)).toBeNull();
+    expect(normalizeBatchItem(-1)).toBeNull();
+    expect(normalizeBatchItem(1.5)).toBeNull();
+    expect(normalizeBatchItem(undefined)).toBeNull();
+  });
+});
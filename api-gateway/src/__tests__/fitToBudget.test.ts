@@ -0,0 +1,21 @@
+import { fitToBudget } from "../utils/fitToBudget";
+
+describe("fitToBudget (real shipped logic)", () => {
+  it("returns components unchanged when they already fit", () => {
+    const parts = ["short", "also short"];
+    expect(fitToBudget(parts, 100)).toBe(parts);
+  });
+
+  it("keeps short components whole and gives their slack to long ones", () => {
+    const [short, long1, long2] = fitToBudget(["a".repeat(10), "b".repeat(500), "c".repeat(500)], 210);
+    expect(short).toBe("a".repeat(10));
+    expect(long1).toBe(`${"b".repeat(97)}...`);
+    expect(long2).toBe(`${"c".repeat(97)}...`);
+  });
+
+  it("never exceeds the budget", () => {
+    const out = fitToBudget(["x".repeat(300), "y".repeat(40), "z".repeat(900), "w".repeat(120)], 400);
+    expect(out.join("").length).toBeLessThanOrEqual(400);
+    expect(out[1]).toBe("y".repeat(40));
+  });
+});
@@ -0,0 +1,34 @@
+/**
+ * Real orchestrator/agent instances with their collaborators stubbed, for tests
+ * that exercise private methods through an untyped handle. Import this only
+ * after mocking LangfuseService (see ./langfuseMock).
+ */
+import { StorytellerOrchestrator } from "../../services/StorytellerOrchestrator";
+import { ArchivistAgent } from "../../agents/ArchivistAgent";
+import { WriterAgent } from "../../agents/WriterAgent";
+
+export type AnyObj = Record<string, unknown>;
+
+/** A fresh orchestrator plus the same instance viewed as a plain object for stubbing. */
+export function makeOrchestrator(): { orch: StorytellerOrchestrator; o: AnyObj } {
+  const orch = new StorytellerOrchestrator();
+  return { orch, o: orch as unknown as AnyObj };
+}
+
+/** Langfuse stand-in handed to agent constructors; pass `addEvent` to observe events. */
+export function agentLangfuse(addEvent: (...args: unknown[]) => void = () => {}) {
+  return { isEnabled: false, startSpan: () => "s", endSpan: () => {}, addEvent, trackLLMCall: () => {} } as unknown as ConstructorParameters<typeof ArchivistAgent>[1];
+}
+
+/** An ArchivistAgent with no LLM provider; only its prompt/merge helpers are usable. */
+export function makeArchivist(addEvent?: (...args: unknown[]) => void): ArchivistAgent {
+  const llmProvider = {} as unknown as ConstructorParameters<typeof ArchivistAgent>[0];
+  return new ArchivistAgent(llmProvider, agentLangfuse(addEvent));
+}
+
+/** A WriterAgent with no LLM provider and a no-op event stream. */
+export function makeWriter(): WriterAgent {
+  const llmProvider = {} as unknown as ConstructorParameters<typeof WriterAgent>[0];
+  const redisStreams = { publishEvent: jest.fn(async () => "e") } as unknown as ConstructorParameters<typeof WriterAgent>[4];
+  return new WriterAgent(llmProvider, agentLangfuse(), undefined, undefined, redisStreams);
+}
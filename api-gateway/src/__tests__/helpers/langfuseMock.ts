@@ -0,0 +1,23 @@
+/**
+ * Module factory for mocking LangfuseService, which otherwise pulls langfuse's
+ * ESM dynamic import into every test that loads an agent or the orchestrator.
+ *
+ *   jest.mock("../services/LangfuseService", () => require("./helpers/langfuseMock").langfuseServiceModule());
+ *
+ * jest hoists jest.mock above the test's imports, so the factory may only reach
+ * this module through require(). It must stay free of imports from src/ — the
+ * factory runs while those modules are still loading.
+ */
+export function langfuseServiceModule() {
+  return {
+    LangfuseService: class {
+      get isEnabled() { return false; }
+      startTrace() {} endTrace() {} startSpan() { return "span"; } endSpan() {}
+      addEvent() {} trackLLMCall() {} async getPrompt() { return { compile: () => "" }; }
+      recordUserFeedback() {} recordRegenerationRequest() {} async flush() {}
+      scoreFaithfulness() {} scoreRelevance() {}
+    },
+    AGENT_PROMPTS: {},
+    PHASE_PROMPTS: {},
+  };
+}
@@ -0,0 +1,54 @@
+import { runPhaseGraph, PhaseNode } from "../utils/phaseGraph";
+
+function node(id: string, deps: string[], log: string[], run?: () => Promise<void>): PhaseNode {
+  return {
+    id,
+    deps,
+    run: async () => {
+      log.push(`start ${id}`);
+      if (run) await run();
+      log.push(`end ${id}`);
+    },
+  };
+}
+
+const tick = () => Promise.resolve();
+
+describe("runPhaseGraph (real shipped logic)", () => {
+  it("starts a node once all of its deps have finished and overlaps independent ones", async () => {
+    const log: string[] = [];
+    const stopped = await runPhaseGraph([
+      node("a", [], log),
+      node("b", ["a"], log, tick),
+      node("c", ["a"], log, tick),
+      node("d", ["b", "c"], log),
+    ]);
+    expect(stopped).toBe(false);
+    expect(log).toEqual(["start a", "end a", "start b", "start c", "end b", "end c", "start d", "end d"]);
+  });
+
+  it("starts nothing new once shouldStop returns true", async () => {
+    const log: string[] = [];
+    let stop = false;
+    const stopped = await runPhaseGraph(
+      [node("a", [], log, async () => { stop = true; }), node("b", ["a"], log)],
+      () => stop
+    );
+    expect(stopped).toBe(true);
+    expect(log).toEqual(["start a", "end a"]);
+  });
+
+  it("waits for in-flight nodes, then rethrows the first failure", async () => {
+    const log: string[] = [];
+    const failing: PhaseNode = { id: "a", deps: [], run: async () => { throw new Error("boom"); } };
+    await expect(
+      runPhaseGraph([failing, node("b", [], log), node("c", ["a"], log)])
+    ).rejects.toThrow("boom");
+    expect(log).toEqual(["start b", "end b"]);
+  });
+
+  it("rejects unknown deps and cycles", async () => {
+    expect(() => runPhaseGraph([node("a", ["x"], [])])).toThrow(/unknown phase "x"/);
+    await expect(runPhaseGraph([node("a", ["b"], []), node("b", ["a"], [])])).rejects.toThrow(/cycle/);
+  });
+});
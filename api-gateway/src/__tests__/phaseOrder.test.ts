@@ -1,5 +1,5 @@
 import { GenerationPhase } from "../models/LLMModels";
-import { PHASE_CONFIGS, getNextPhase } from "../models/AgentModels";
+import { PHASE_CONFIGS, getNextPhase, getPhaseConfig } from "../models/AgentModels";
 
 describe("Generation phase order (real shipped definitions)", () => {
   const expectedOrder: GenerationPhase[] = [
@@ -44,4 +44,11 @@ describe("Generation phase order (real shipped definitions)", () => {
   it("getNextPhase returns null for an unknown phase", () => {
     expect(getNextPhase("not_a_phase" as GenerationPhase)).toBeNull();
   });
+
+  it("getPhaseConfig returns the config entry for each phase", () => {
+    for (const config of PHASE_CONFIGS) {
+      expect(getPhaseConfig(config.phase)).toBe(config);
+    }
+    expect(getPhaseConfig("not_a_phase" as GenerationPhase)).toBeUndefined();
+  });
 });
@@ -0,0 +1,29 @@
+import { compileTemplate, renderTemplate } from "../utils/promptTemplate";
+
+describe("renderTemplate (real shipped logic)", () => {
+  it("substitutes every occurrence, tolerating inner whitespace", () => {
+    expect(renderTemplate("A {{x}} and {{ x }} then {{y}}.", { x: "1", y: "2" })).toBe("A 1 and 1 then 2.");
+  });
+
+  it("leaves placeholders without a variable verbatim", () => {
+    expect(renderTemplate("Keep {{missing}} here", {})).toBe("Keep {{missing}} here");
+  });
+
+  it("inserts values literally (no replacement patterns, no re-substitution)", () => {
+    expect(renderTemplate("{{a}}|{{b}}", { a: "$& {{b}}", b: "B" })).toBe("$& {{b}}|B");
+  });
+
+  it("ignores inherited properties of the variables object", () => {
+    expect(renderTemplate("{{constructor}} {{toString}}", {})).toBe("{{constructor}} {{toString}}");
+  });
+
+  it("compiles each template text once", () => {
+    const t = "Narrative: {{narrative}}";
+    expect(compileTemplate(t)).toBe(compileTemplate(t));
+  });
+
+  it("passes text without placeholders through as a single literal", () => {
+    expect(compileTemplate("No slots here")).toEqual(["No slots here"]);
+    expect(renderTemplate("No slots here", { x: "1" })).toBe("No slots here");
+  });
+});
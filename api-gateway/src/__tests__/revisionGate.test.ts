@@ -1,4 +1,4 @@
-import { isRevisionNeeded, calculateWordCountCompliance } from "../utils/revisionGate";
+import { isRevisionNeeded, calculateWordCountCompliance, canSkipRevision } from "../utils/revisionGate";
 
 describe("isRevisionNeeded (real shipped logic)", () => {
   it("requires revision when word count is non-compliant, even with a high score", () => {
@@ -48,3 +48,28 @@ describe("calculateWordCountCompliance (real shipped logic)", () => {
     expect(calculateWordCountCompliance(1200, 1000).compliant).toBe(true);
   });
 });
+
+describe("canSkipRevision (real shipped logic)", () => {
+  it("skips revision for a score at the skip bar despite minor issues", () => {
+    expect(canSkipRevision({ score: 8.5, issues: ["slightly long paragraph"] })).toBe(true);
+  });
+
+  it("does not skip below the skip bar", () => {
+    expect(canSkipRevision({ score: 8.4 })).toBe(false);
+  });
+
+  it("never skips on a hard failure or explicit veto", () => {
+    expect(canSkipRevision({ score: 9, wordCountCompliance: false })).toBe(false);
+    expect(canSkipRevision({ score: 9, scopeAdherence: false })).toBe(false);
+    expect(canSkipRevision({ score: 9, approved: false })).toBe(false);
+  });
+
+  it("does not skip when the score is missing", () => {
+    expect(canSkipRevision({ approved: true })).toBe(false);
+  });
+
+  it("honours a caller-supplied bar", () => {
+    expect(canSkipRevision({ score: 8, issues: ["x"] }, 8)).toBe(true);
+    expect(canSkipRevision({ score: 8, scopeAdherence: false }, 8)).toBe(false);
+  });
+});
@@ -146,4 +146,82 @@ describe("sceneCheckpoint – scene-boundary state persistence (issue #157 Slice
     expect((serialized.drafts as AnyObj)[1]).toBeDefined();
     expect((serialized.valueShifts as AnyObj)[1]).toBe(0.5);
   });
+
+  it("stores only the checkpointed scene's draft with CHECKPOINT_DRAFT_DELTAS", async () => {
+    const orch = new StorytellerOrchestrator();
+    const runId = "run-delta";
+    seedHeap(orch, runId, makeState(runId));
+    const mockSave = jest.fn().mockResolvedValue(undefined);
+    injectFakeSupabase(orch, { saveRunArtifact: mockSave });
+
+    process.env.CHECKPOINT_DRAFT_DELTAS = "true";
+    try {
+      await callPrivate(orch, "checkpointScene", runId, 2);
+    } finally {
+      delete process.env.CHECKPOINT_DRAFT_DELTAS;
+    }
+    const content = (mockSave.mock.calls[0][0] as { content: AnyObj }).content;
+    expect(content.drafts).toEqual({ 2: { content: "Scene 2 text" } });
+    expect((content.critiques as AnyObj)[1]).toBeDefined();
+  });
+
+  it("restores from checkpoints by joining each checkpoint's drafts", async () => {
+    const orch = new StorytellerOrchestrator();
+    const o = orch as unknown as AnyObj;
+    const state = makeState("run-join");
+    const checkpoint = (n: number, drafts: AnyObj): AnyObj => ({
+      artifact_type: "run_state_checkpoint",
+      phase: `checkpoint_scene_${n}`,
+      content: { ...state, currentScene: n, drafts, critiques: {}, revisionCount: {}, valueShifts: {}, spiceRegions: {} },
+    });
+    o.supabase = {
+      getRunArtifact: jest.fn(async () => null),
+      getRunArtifacts: jest.fn(async () => [
+        checkpoint(2, { 2: { content: "Scene 2 text" } }),
+        checkpoint(1, { 1: { content: "Scene 1 text" } }),
+      ]),
+    };
+    o.publishEvent = jest.fn(async () => {});
+
+    expect(await orch.restoreFromShutdown("run-join")).toBe(1);
+    const restored = (o.activeRuns as Map<string, AnyObj>).get("run-join")!;
+    expect(restored.currentScene).toBe(2);
+    expect([...(restored.drafts as Map<number, AnyObj>).keys()].sort()).toEqual([1, 2]);
+  });
+
+  it("queues the write with CHECKPOINTS_BACKGROUND_SAVE and flushArtifacts waits for it", async () => {
+    const orch = new StorytellerOrchestrator();
+    const runId = "run-bg";
+    const state = makeState(runId);
+    state.worldState = { characters: [{ name: "Mara", status: "alive" }], locations: [], timeline: [] };
+    seedHeap(orch, runId, state);
+    let releaseSave!: () => void;
+    const mockSave = jest.fn(() => new Promise<void>((resolve) => { releaseSave = resolve; }));
+    injectFakeSupabase(orch, { saveRunArtifact: mockSave });
+
+    process.env.CHECKPOINTS_BACKGROUND_SAVE = "true";
+    try {
+      await callPrivate(orch, "checkpointScene", runId, 2);
+    } finally {
+      delete process.env.CHECKPOINTS_BACKGROUND_SAVE;
+    }
+    // The next scene's facts and Archivist diffs must not leak into the queued
+    // scene-2 checkpoint.
+    (state.rawFactsLog as AnyObj[]).push({ fact: "later", sceneNumber: 3 });
+    const worldState = state.worldState as { characters: AnyObj[]; timeline: AnyObj[] };
+    worldState.characters[0].status = "dead";
+    worldState.timeline.push({ event: "later" });
+
+    let flushed = false;
+    const flush = callPrivate<Promise<void>>(orch, "flushArtifacts", runId).then(() => { flushed = true; });
+    await new Promise((r) => setImmediate(r));
+    expect(mockSave).toHaveBeenCalledTimes(1);
+    expect(flushed).toBe(false);
+
+    releaseSave();
+    await flush;
+    const content = (mockSave.mock.calls[0] as unknown as [{ content: AnyObj }])[0].content;
+    expect(content.rawFactsLog).toEqual([]);
+    expect(content.worldState).toEqual({ characters: [{ name: "Mara", status: "alive" }], locations: [], timeline: [] });
+  });
 });
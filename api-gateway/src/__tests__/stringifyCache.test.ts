@@ -0,0 +1,51 @@
+import { parseCached, stringifyCached } from "../utils/stringifyCache";
+
+describe("stringifyCached (real shipped logic)", () => {
+  it("matches JSON.stringify for objects, arrays and primitives", () => {
+    for (const v of [{ a: 1, b: [2, "x"] }, [{ name: "Ada" }], "s", 3, null]) {
+      expect(stringifyCached(v)).toBe(JSON.stringify(v));
+    }
+  });
+
+  it("serializes a given object once and reuses the string", () => {
+    const narrative = { genre: "noir" };
+    const spy = jest.spyOn(JSON, "stringify");
+    const first = stringifyCached(narrative);
+    const second = stringifyCached(narrative);
+    expect(second).toBe(first);
+    expect(spy).toHaveBeenCalledTimes(1);
+    spy.mockRestore();
+  });
+
+  it("serializes a replacement object afresh", () => {
+    expect(stringifyCached({ genre: "noir" })).not.toBe(stringifyCached({ genre: "comedy" }));
+  });
+});
+
+describe("parseCached (real shipped logic)", () => {
+  it("matches JSON.parse and parses a repeated string once", () => {
+    const json = stringifyCached({ genre: "noir", tags: ["rain"] });
+    const spy = jest.spyOn(JSON, "parse");
+    const first = parseCached(json);
+    const second = parseCached(json);
+    expect(first).toEqual({ genre: "noir", tags: ["rain"] });
+    expect(second).toBe(first);
+    expect(spy).toHaveBeenCalledTimes(1);
+    spy.mockRestore();
+  });
+
+  it("throws on invalid JSON without caching the failure", () => {
+    expect(() => parseCached("{not json")).toThrow(SyntaxError);
+    expect(() => parseCached("{not json")).toThrow(SyntaxError);
+  });
+
+  it("evicts the oldest string once the cache is full", () => {
+    const oldest = JSON.stringify({ n: -1 });
+    parseCached(oldest);
+    for (let i = 0; i < 16; i++) parseCached(JSON.stringify({ n: i }));
+    const spy = jest.spyOn(JSON, "parse");
+    parseCached(oldest);
+    expect(spy).toHaveBeenCalledTimes(1);
+    spy.mockRestore();
+  });
+});
@@ -1,4 +1,4 @@
-import { wordCount } from "../utils/wordCount";
+import { wordCount, lastWords } from "../utils/wordCount";
 
 describe("wordCount (real shipped behavior: split(/\\s+/).length, no empty-filter)", () => {
   it("counts simple words", () => {
@@ -23,3 +23,15 @@ describe("wordCount (real shipped behavior: split(/\\s+/).length, no empty-filte
     expect(wordCount(" one two")).toBe(3);
   });
 });
+
+describe("lastWords (real shipped logic)", () => {
+  const reference = (text: string, n: number) => text.trim().split(/\s+/).slice(-n).join(" ");
+
+  it("matches trim/split/slice/join on representative inputs", () => {
+    for (const text of ["one two three four", "  lead\ttab\n\nnewline  ", "single", "", "   ", "a  b\u00a0c"]) {
+      for (const n of [1, 2, 3, 50]) {
+        expect(lastWords(text, n)).toBe(reference(text, n));
+      }
+    }
+  });
+});
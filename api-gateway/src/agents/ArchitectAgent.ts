@@ -14,6 +14,8 @@ import { AgentContext, AgentOutput, GenerationOptions } from "./types";
 import { NarrativeSchema, AdvancedPlanSchema } from "../schemas/AgentSchemas";
 import { ContentGuardrail, ConsistencyGuardrail } from "../guardrails";
 import { RedisStreamsService } from "../services/RedisStreamsService";
+import { stringifyCached } from "../utils/stringifyCache";
+import { renderTemplate } from "../utils/promptTemplate";
 
 export class ArchitectAgent extends BaseAgent {
   constructor(
@@ -96,7 +98,7 @@ export class ArchitectAgent extends BaseAgent {
         const prompt = await this.langfuse.getCompiledPrompt(
           promptName,
           variables,
-          { fallback: this.getFallbackPrompt(variables) }
+          { fallback: () => this.getFallbackPrompt(variables) }
         );
         return prompt;
       } catch (error) {
@@ -120,11 +122,7 @@ ${variables.seedIdea ? `Seed idea: ${variables.seedIdea}` : ""}`;
    * Compile fallback prompt with variables
    */
   private compileFallbackPrompt(variables: Record<string, string>): string {
-    let prompt = this.getFallbackPrompt(variables);
-    for (const [key, value] of Object.entries(variables)) {
-      prompt = prompt.replace(new RegExp(`\\{\\{${key}\\}\\}`, "g"), value);
-    }
-    return prompt;
+    return renderTemplate(this.getFallbackPrompt(variables), variables);
   }
 
   /**
@@ -160,7 +158,7 @@ IMPORTANT: themes must be an array of strings, arc must be a single string.`;
     }
 
     if (phase === GenerationPhase.OUTLINING) {
-      const narrative = JSON.stringify(context.state.narrative);
+      const narrative = stringifyCached(context.state.narrative);
       return `Based on the narrative concept, create a detailed scene-by-scene outline.
 
 Narrative: ${narrative}
@@ -181,8 +179,8 @@ Output as JSON with "scenes" array.`;
     }
 
     if (phase === GenerationPhase.ADVANCED_PLANNING) {
-      const narrative = JSON.stringify(context.state.narrative);
-      const outline = JSON.stringify(context.state.outline);
+      const narrative = stringifyCached(context.state.narrative);
+      const outline = stringifyCached(context.state.outline);
       return `Create advanced planning elements for the story:
 
 Narrative: ${narrative}
@@ -16,6 +16,11 @@ import { ContentGuardrail, ConsistencyGuardrail } from "../guardrails";
 import { RedisStreamsService } from "../services/RedisStreamsService";
 
 export class ArchivistAgent extends BaseAgent {
+  // Character budget for the raw-facts block. The log grows every scene, so
+  // past this the oldest facts (already folded into the existing constraints
+  // by earlier passes) are elided instead of growing the prompt without bound.
+  private static readonly RAW_FACTS_BUDGET = 32_000;
+
   constructor(
     llmProvider: LLMProviderService,
     langfuse: LangfuseService,
@@ -106,7 +111,7 @@ export class ArchivistAgent extends BaseAgent {
         return await this.langfuse.getCompiledPrompt(
           promptName,
           {},
-          { fallback: this.getFallbackPrompt() }
+          { fallback: () => this.getFallbackPrompt() }
         );
       } catch (error) {
         console.warn(`Failed to get prompt from Langfuse for ${this.agentType}, using fallback`);
@@ -128,20 +133,23 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
   ): string {
     const state = context.state;
     const upToScene = state.currentScene;
-    const rawFacts = state.rawFactsLog.filter(f => f.sceneNumber <= upToScene);
+    const { block: rawFactsBlock, elided } = this.buildRawFactsBlock(state.rawFactsLog, upToScene);
+    if (elided > 0) {
+      this.langfuse.addEvent(context.runId, "archivist_facts_elided", { elided, upToScene });
+    }
     const existingConstraints = state.keyConstraints;
     const existingWorldState = state.worldState;
 
     return `Process raw facts and generate/update key constraints up to Scene ${upToScene}.
 
 Raw facts collected:
-${rawFacts.map(f => `- ${f.fact} (Scene ${f.sceneNumber}, from ${f.source})`).join("\n")}
+${rawFactsBlock}
 
 Existing constraints:
-${existingConstraints.map(c => `- ${c.key}: ${c.value} (Scene ${c.sceneNumber})`).join("\n")}
+${existingConstraints.length > 0 ? this.buildConstraintsBlock(existingConstraints) : ""}
 
 Current world state:
-${existingWorldState ? JSON.stringify(existingWorldState, null, 2) : "No world state yet."}
+${existingWorldState ? JSON.stringify(existingWorldState) : "No world state yet."}
 
 Process:
 1. Identify new facts that should become constraints
@@ -161,6 +169,36 @@ Output JSON with:
   }`;
   }
 
+  /**
+   * Format raw facts up to `upToScene`, newest first into the character budget,
+   * then restore log order. Facts that don't fit are replaced by one marker
+   * line; `elided` counts them.
+   */
+  private buildRawFactsBlock(rawFactsLog: RawFact[], upToScene: number): { block: string; elided: number } {
+    const lines: string[] = [];
+    let used = 0;
+    let elided = 0;
+    for (let i = rawFactsLog.length - 1; i >= 0; i--) {
+      const f = rawFactsLog[i];
+      if (f.sceneNumber > upToScene) continue;
+      if (elided > 0) {
+        elided++;
+        continue;
+      }
+      const line = `- ${f.fact} (Scene ${f.sceneNumber}, from ${f.source})`;
+      if (used + line.length + 1 > ArchivistAgent.RAW_FACTS_BUDGET) {
+        elided = 1;
+        continue;
+      }
+      lines.push(line);
+      used += line.length + 1;
+    }
+    if (elided > 0) {
+      lines.push(`- ... ${elided} older facts elided (already reflected in existing constraints)`);
+    }
+    return { block: lines.reverse().join("\n"), elided };
+  }
+
   /**
    * Build initial world state from character profiles
    * Called after Characters phase to initialize world state
@@ -235,15 +273,24 @@ Output JSON with:
     sceneNumber: number
   ): WorldState {
     const newState = { ...currentState };
+    // One timestamp for the whole diff: every change in it belongs to the same
+    // Archivist pass, so timeline events reuse it instead of reading the clock.
+    const appliedAt = new Date().toISOString();
     newState.lastUpdatedScene = sceneNumber;
-    newState.lastUpdatedAt = new Date().toISOString();
+    newState.lastUpdatedAt = appliedAt;
 
     // Apply character updates
     if (diff.characterUpdates && Array.isArray(diff.characterUpdates)) {
+      // Index the tracked characters once instead of scanning the whole list
+      // for every update (first entry wins, as with a front-to-back find).
+      const charactersByName = new Map<string, CharacterState>();
+      for (const c of newState.characters) {
+        if (!charactersByName.has(c.name)) charactersByName.set(c.name, c);
+      }
       for (const update of diff.characterUpdates) {
         const charUpdate = update as Record<string, unknown>;
         const charName = String(charUpdate.name || "");
-        const existingChar = newState.characters.find(c => c.name === charName);
+        const existingChar = charactersByName.get(charName);
         
         if (existingChar) {
           if (charUpdate.status) {
@@ -265,6 +312,9 @@ Output JSON with:
 
     // Add new locations
     if (diff.newLocations && Array.isArray(diff.newLocations)) {
+      // Known names in a set, so each new location is a membership check rather
+      // than a scan of every tracked location (added ones join the set as well).
+      const knownLocations = new Set(newState.locations.map(l => l.name));
       for (const loc of diff.newLocations) {
         const locData = loc as Record<string, unknown>;
         const newLoc: LocationState = {
@@ -276,7 +326,8 @@ Output JSON with:
         };
         
         // Only add if not already exists
-        if (!newState.locations.find(l => l.name === newLoc.name)) {
+        if (!knownLocations.has(newLoc.name)) {
+          knownLocations.add(newLoc.name);
           newState.locations.push(newLoc);
         }
       }
@@ -290,7 +341,7 @@ Output JSON with:
           event: String(eventData.event || ""),
           sceneNumber,
           significance: (eventData.significance as TimelineFact["significance"]) || "minor",
-          timestamp: new Date().toISOString(),
+          timestamp: appliedAt,
         };
         newState.timeline.push(newEvent);
       }
@@ -7,6 +7,9 @@
 
 import { AgentType, GenerationState, MessageType, KeyConstraint, WorldState, NarratorVoice, SynopsisEntry, SceneContract } from "../models/AgentModels";
 import { buildConstraintsBlock as buildConstraintsBlockHelper } from "../utils/constraintsBlock";
+import { parseEmbeddedJSON } from "../utils/balancedJson";
+import { characterIndex, memoizeRosterBlock, normalizeCharacterName, selectCharactersByName } from "../utils/characterIndex";
+import { stringifyCached } from "../utils/stringifyCache";
 import { GenerationPhase, ChatMessage, MessageRole, getMaxTokensForPhase, LLMProvider } from "../models/LLMModels";
 import { LLMProviderService } from "../services/LLMProviderService";
 import { LangfuseService } from "../services/LangfuseService";
@@ -16,12 +19,39 @@ import { z } from "zod";
 import { ValidationError } from "../schemas/AgentSchemas";
 import { ContentGuardrail, ConsistencyGuardrail, GuardrailResult } from "../guardrails";
 
+// Placeholder lines for the always-on prompt blocks, shared by every early
+// return instead of being re-spelled at each site.
+const NO_ADVANCED_PLAN = "No advanced plan available.";
+const NO_NARRATOR_VOICE = "No narrator voice specified — use a consistent, natural narrative voice.";
+const NO_VOICE_EXEMPLARS = "No voice exemplars available — give each character a distinct rhythm and idiolect.";
+
+// Rendered synopsis per entries array, valid while the (append-only) array
+// keeps its length and the scene is unchanged: the Writer and Critic re-render
+// it several times per scene.
+const synopsisBlockCache = new WeakMap<object, { length: number; sceneNum: number; block: string }>();
+
+/** Pick this scene's entry from a per-scene map ("3" or "scene3" keys), else the whole value. */
+function pickSceneEntry(obj: unknown, sceneNum: number): unknown {
+  if (obj && typeof obj === "object" && !Array.isArray(obj)) {
+    const rec = obj as Record<string, unknown>;
+    return rec[String(sceneNum)] ?? rec[`scene${sceneNum}`] ?? rec;
+  }
+  return obj;
+}
+
 /**
  * Abstract base class for all agents
  */
 export abstract class BaseAgent {
   protected redisStreams?: RedisStreamsService;
 
+  /**
+   * Optional sink the orchestrator wires up so agent events go through its
+   * per-run publish queue and keep stream order with the orchestrator's own
+   * events. Unwired agents publish straight to Redis Streams.
+   */
+  public onPublishEvent?: (runId: string, eventType: string, data: Record<string, unknown>) => Promise<void>;
+
   /** Optional sink the orchestrator wires up to record per-phase resolved model + sampling params (issue #162). */
   public onLLMCall?: (runId: string, meta: {
     provider: string; requestedModel: string; resolvedModel: string;
@@ -112,9 +142,13 @@ export abstract class BaseAgent {
    * BEFORE the real answer in a second fence. The previous non-greedy regex
    * matched the FIRST fence and parsed the example. We instead collect ALL
    * fenced blocks and return the LAST one that JSON.parses successfully
-   * (the answer almost always comes after any example). If no fenced block
-   * parses, we fall back to the whole response string (also validated by a
-   * trial JSON.parse). If nothing parses, return null.
+   * (the answer almost always comes after any example). A response that is
+   * itself bare JSON is parsed first without scanning for fences. If no fenced
+   * block parses, we fall back to the whole response (bare primitives included)
+   * and then to the first balanced {...} span in the prose that passes a
+   * trial JSON.parse, skipping citation-style arrays such as `[1]` ahead of it
+   * (an embedded array is used only when no object follows it). If nothing
+   * parses, return null.
    *
    * Heuristic limitation: LAST-block selection has a known inverse failure —
    * if the model emits its real ANSWER first and an illustrative EXAMPLE fence
@@ -123,6 +157,27 @@ export abstract class BaseAgent {
    * BaseAgentParseJSON.test.ts so future changes are intentional.)
    */
   protected static extractJSON(response: string): string | null {
+    return BaseAgent.extractParsedJSON(response)?.json ?? null;
+  }
+
+  /**
+   * Same selection as extractJSON, but also returns the value produced by the
+   * trial JSON.parse so callers don't parse the winning candidate twice.
+   */
+  protected static extractParsedJSON(response: string): { json: string; value: unknown } | null {
+    const trimmed = response.trim();
+
+    // Fast path: JSON-mode replies are bare JSON — parse directly and skip the
+    // fence scan entirely.
+    const first = trimmed[0];
+    if (first === "{" || first === "[") {
+      try {
+        return { json: trimmed, value: JSON.parse(trimmed) };
+      } catch {
+        // fall through to fence / embedded-span extraction
+      }
+    }
+
     const fenceRegex = /```(?:json)?\s*([\s\S]*?)```/g;
     const candidates: string[] = [];
     let match: RegExpExecArray | null;
@@ -133,21 +188,24 @@ export abstract class BaseAgent {
     // Prefer the LAST fenced block that parses to valid JSON.
     for (let i = candidates.length - 1; i >= 0; i--) {
       try {
-        JSON.parse(candidates[i]);
-        return candidates[i];
+        return { json: candidates[i], value: JSON.parse(candidates[i]) };
       } catch {
         // try the next candidate
       }
     }
 
-    // No (parseable) fence — fall back to the whole string if it is JSON.
-    const trimmed = response.trim();
+    // No (parseable) fence — the whole reply may still be JSON the fast path
+    // does not cover (a bare primitive such as `42` or `"text"`).
     try {
-      JSON.parse(trimmed);
-      return trimmed;
+      return { json: trimmed, value: JSON.parse(trimmed) };
     } catch {
-      return null;
+      // fall through to the embedded-span scan
     }
+
+    // Otherwise take the first balanced {...} span in the prose that parses,
+    // skipping unclosed, non-JSON or citation-style `[1]` brackets ahead of it
+    // (an embedded array is only used when no object follows it).
+    return parseEmbeddedJSON(trimmed);
   }
 
   /**
@@ -162,20 +220,14 @@ export abstract class BaseAgent {
    *   inspected `.raw` still works.
    */
   protected parseJSON(response: string): Record<string, unknown> {
-    const json = BaseAgent.extractJSON(response);
-    if (json !== null) {
-      try {
-        return JSON.parse(json);
-      } catch (error) {
-        // extractJSON already validated parseability; reaching here means the
-        // payload changed shape unexpectedly. Fall through to the sentinel.
-        console.warn(`[${this.agentType}] Failed to parse extracted JSON:`, error);
-      }
-    } else {
-      console.warn(
-        `[${this.agentType}] Failed to parse JSON response (no parseable JSON found)`
-      );
+    // Single parse: reuse the value from extractParsedJSON's trial parse.
+    const extracted = BaseAgent.extractParsedJSON(response);
+    if (extracted !== null) {
+      return extracted.value as Record<string, unknown>;
     }
+    console.warn(
+      `[${this.agentType}] Failed to parse JSON response (no parseable JSON found)`
+    );
     return { __parseError: true, raw: response };
   }
 
@@ -218,21 +270,22 @@ export abstract class BaseAgent {
    */
   protected buildWorldStateBlock(worldState?: WorldState): string {
     if (!worldState) return "No world state tracked yet.";
-    const lines: string[] = [];
+    // Appended straight into one string: this block goes into every Writer and
+    // Critic prompt and grows with the cast and the fact list.
+    let block = "";
     const chars = worldState.characters ?? [];
     if (chars.length > 0) {
-      lines.push("Characters (current status):");
+      block += "Characters (current status):";
       for (const c of chars) {
-        const loc = c.currentLocation ? `, at ${c.currentLocation}` : "";
-        lines.push(`- ${c.name} [${c.status}${loc}] (last seen scene ${c.lastSeenScene})`);
+        block += `\n- ${c.name} [${c.status}${c.currentLocation ? `, at ${c.currentLocation}` : ""}] (last seen scene ${c.lastSeenScene})`;
       }
     }
     const facts = worldState.keyFacts ?? [];
     if (facts.length > 0) {
-      lines.push("Established facts:");
-      for (const f of facts) lines.push(`- ${f}`);
+      block += block ? "\nEstablished facts:" : "Established facts:";
+      for (const f of facts) block += `\n- ${f}`;
     }
-    return lines.length > 0 ? lines.join("\n") : "No world state tracked yet.";
+    return block || "No world state tracked yet.";
   }
 
   /**
@@ -242,38 +295,50 @@ export abstract class BaseAgent {
    * else the whole sub-object is summarized.
    */
   protected buildAdvancedPlanBlock(plan: Record<string, unknown> | undefined, sceneNum: number): string {
-    if (!plan || Object.keys(plan).length === 0) return "No advanced plan available.";
-    const pick = (obj: unknown): unknown => {
-      if (obj && typeof obj === "object" && !Array.isArray(obj)) {
-        const rec = obj as Record<string, unknown>;
-        return rec[String(sceneNum)] ?? rec[`scene${sceneNum}`] ?? rec;
-      }
-      return obj;
-    };
+    if (!plan || Object.keys(plan).length === 0) return NO_ADVANCED_PLAN;
     const parts: string[] = [];
-    if (plan.motifs) parts.push(`Motifs: ${JSON.stringify(plan.motifs)}`);
-    if (plan.subtext) parts.push(`Subtext: ${JSON.stringify(plan.subtext)}`);
-    if (plan.emotionalBeats) parts.push(`Emotional beat (this scene): ${JSON.stringify(pick(plan.emotionalBeats))}`);
-    if (plan.sensory) parts.push(`Sensory blueprint: ${JSON.stringify(pick(plan.sensory))}`);
-    return parts.length > 0 ? parts.join("\n") : "No advanced plan available.";
+    // The plan is fixed for the run, so its pieces serialize once and are reused
+    // by every Writer call (each beat part, expansion and revision of each scene).
+    if (plan.motifs) parts.push(`Motifs: ${stringifyCached(plan.motifs)}`);
+    if (plan.subtext) parts.push(`Subtext: ${stringifyCached(plan.subtext)}`);
+    if (plan.emotionalBeats) parts.push(`Emotional beat (this scene): ${stringifyCached(pickSceneEntry(plan.emotionalBeats, sceneNum))}`);
+    if (plan.sensory) parts.push(`Sensory blueprint: ${stringifyCached(pickSceneEntry(plan.sensory, sceneNum))}`);
+    return parts.length > 0 ? parts.join("\n") : NO_ADVANCED_PLAN;
   }
 
   /** Render narrator voice/POV design into a compact, always-on style block. */
   protected buildNarratorVoiceBlock(voice?: NarratorVoice): string {
-    if (!voice || Object.keys(voice).length === 0) return "No narrator voice specified — use a consistent, natural narrative voice.";
+    if (!voice || Object.keys(voice).length === 0) return NO_NARRATOR_VOICE;
     const parts: string[] = [];
     if (voice.perspective) parts.push(`POV: ${voice.perspective}`);
     if (voice.voice) parts.push(`Voice: ${voice.voice}`);
     if (voice.tone) parts.push(`Tone: ${voice.tone}`);
     if (voice.style) parts.push(`Style: ${voice.style}`);
-    return parts.length > 0 ? parts.join("\n") : "No narrator voice specified — use a consistent, natural narrative voice.";
+    return parts.length > 0 ? parts.join("\n") : NO_NARRATOR_VOICE;
   }
 
   /** Render the rolling synopsis of scenes strictly BEFORE sceneNum (never the future). */
   protected buildSynopsisBlock(entries: SynopsisEntry[] | undefined, sceneNum: number): string {
-    const prior = (entries ?? []).filter((e) => e.sceneNumber < sceneNum).sort((a, b) => a.sceneNumber - b.sceneNumber);
-    if (prior.length === 0) return "No prior scenes (this is the opening).";
-    return prior.map((e) => `Scene ${e.sceneNumber}: ${e.summary}`).join("\n");
+    if (!entries || entries.length === 0) return "No prior scenes (this is the opening).";
+    const cached = synopsisBlockCache.get(entries);
+    if (cached && cached.length === entries.length && cached.sceneNum === sceneNum) return cached.block;
+    // Entries are appended in scene order, so render in one pass and only fall
+    // back to filter → sort → join if an out-of-order entry turns up.
+    let block = "";
+    let lastScene = -Infinity;
+    for (const e of entries) {
+      if (e.sceneNumber >= sceneNum) continue;
+      if (e.sceneNumber < lastScene) {
+        block = entries.filter((x) => x.sceneNumber < sceneNum).sort((a, b) => a.sceneNumber - b.sceneNumber)
+          .map((x) => `Scene ${x.sceneNumber}: ${x.summary}`).join("\n");
+        break;
+      }
+      lastScene = e.sceneNumber;
+      block += `${block ? "\n" : ""}Scene ${e.sceneNumber}: ${e.summary}`;
+    }
+    if (!block) block = "No prior scenes (this is the opening).";
+    synopsisBlockCache.set(entries, { length: entries.length, sceneNum, block });
+    return block;
   }
 
   /** Render the per-scene contract (goal/conflict/hook/value-shift/motifs). */
@@ -300,25 +365,35 @@ export abstract class BaseAgent {
    */
   protected buildVoiceExemplarsBlock(characters: unknown, present: string[]): string {
     if (!Array.isArray(characters) || characters.length === 0) {
-      return "No voice exemplars available — give each character a distinct rhythm and idiolect.";
-    }
-    const presentSet = new Set(present.map((n) => n.trim().toLowerCase()));
-    const blocks: string[] = [];
-    for (const char of characters) {
-      if (typeof char !== "object" || char === null) continue;
-      const rec = char as Record<string, unknown>;
-      const name = typeof rec.name === "string" ? rec.name.trim() : "";
-      if (!name || (presentSet.size > 0 && !presentSet.has(name.toLowerCase()))) continue;
-      const exemplars = Array.isArray(rec.voiceExemplars)
-        ? rec.voiceExemplars.filter((e): e is string => typeof e === "string" && e.trim().length > 0)
-        : [];
-      if (exemplars.length === 0) continue;
-      blocks.push(`${name}:\n${exemplars.map((e) => `  "${e}"`).join("\n")}`);
+      return NO_VOICE_EXEMPLARS;
     }
-    if (blocks.length === 0) {
-      return "No voice exemplars available — give each character a distinct rhythm and idiolect.";
-    }
-    return `These are the characters' baseline voices (drift is allowed as the arc demands). Make them sound DIFFERENT from each other:\n${blocks.join("\n")}`;
+    // The block depends only on the roster and the present list, and is
+    // rendered on every draft, beat part and expansion of a scene.
+    const key = `voices:${present.map(normalizeCharacterName).join("\u0000")}`;
+    return memoizeRosterBlock(characters, key, () => {
+      // With a present list, look the few present characters up by name instead
+      // of scanning the whole cast; with none, every named character qualifies.
+      const candidates = present.length > 0
+        ? selectCharactersByName(characters, present)
+        : Array.from(characterIndex(characters).values());
+      const blocks: string[] = [];
+      for (const rec of candidates) {
+        const name = (rec.name as string).trim();
+        if (!Array.isArray(rec.voiceExemplars) || rec.voiceExemplars.length === 0) continue;
+        // Single pass: filter and quote in one loop rather than filter → map → join.
+        let rendered = "";
+        for (const e of rec.voiceExemplars) {
+          if (typeof e !== "string" || e.trim().length === 0) continue;
+          rendered += `\n  "${e}"`;
+        }
+        if (!rendered) continue;
+        blocks.push(`${name}:${rendered}`);
+      }
+      if (blocks.length === 0) {
+        return NO_VOICE_EXEMPLARS;
+      }
+      return `These are the characters' baseline voices (drift is allowed as the arc demands). Make them sound DIFFERENT from each other:\n${blocks.join("\n")}`;
+    });
   }
 
   /**
@@ -376,11 +451,11 @@ export abstract class BaseAgent {
     const repairUserPrompt = `The following JSON data failed validation:
 
 \`\`\`json
-${JSON.stringify(data, null, 2)}
+${JSON.stringify(data)}
 \`\`\`
 
 Validation errors:
-${JSON.stringify(result.error.errors, null, 2)}
+${JSON.stringify(result.error.errors)}
 
 ${repairHint ? `Hint: ${repairHint}` : ""}
 
@@ -452,6 +527,19 @@ Please fix the JSON to resolve these validation errors. Output only the correcte
     return results;
   }
 
+  /**
+   * Publish an agent event through the orchestrator's sink when wired, otherwise
+   * directly to Redis Streams. Only the direct path returns a stream event ID.
+   */
+  private async publishAgentEvent(
+    runId: string,
+    eventType: string,
+    data: Record<string, unknown>
+  ): Promise<string | void> {
+    if (this.onPublishEvent) return this.onPublishEvent(runId, eventType, data);
+    return this.redisStreams!.publishEvent(runId, eventType, data);
+  }
+
   /**
    * Emit agent thought event (for Cinematic UI)
    */
@@ -464,13 +552,13 @@ Please fix the JSON to resolve these validation errors. Output only the correcte
     if (this.redisStreams) {
       console.log(`[${this.agentType}] Emitting thought:`, thought, `runId: ${runId}`);
       try {
-        const eventId = await this.redisStreams.publishEvent(runId, "agent_thought", {
+        const eventId = await this.publishAgentEvent(runId, "agent_thought", {
           agent: this.agentType,
           thought,
           sentiment,
           targetAgent,
         });
-        console.log(`[${this.agentType}] Published event with ID:`, eventId);
+        console.log(`[${this.agentType}] Published event with ID:`, eventId ?? "(queued)");
       } catch (error) {
         console.error(`[${this.agentType}] Error publishing thought event:`, error);
       }
@@ -491,13 +579,13 @@ Please fix the JSON to resolve these validation errors. Output only the correcte
     if (this.redisStreams) {
       console.log(`[${this.agentType}] Emitting dialogue to ${to}:`, message, `runId: ${runId}`);
       try {
-        const eventId = await this.redisStreams.publishEvent(runId, "agent_dialogue", {
+        const eventId = await this.publishAgentEvent(runId, "agent_dialogue", {
           from: this.agentType,
           to,
           message,
           dialogueType,
         });
-        console.log(`[${this.agentType}] Published dialogue event with ID:`, eventId);
+        console.log(`[${this.agentType}] Published dialogue event with ID:`, eventId ?? "(queued)");
       } catch (error) {
         console.error(`[${this.agentType}] Error publishing dialogue event:`, error);
       }
@@ -528,13 +616,13 @@ Please fix the JSON to resolve these validation errors. Output only the correcte
       const logContent = contentStr.length > 200 ? contentStr.substring(0, 200) + "..." : contentStr;
       console.log(`[${this.agentType}] Emitting message:`, logContent, `runId: ${runId}, sceneNum: ${sceneNum}`);
       try {
-        const eventId = await this.redisStreams.publishEvent(runId, "agent_message", {
+        const eventId = await this.publishAgentEvent(runId, "agent_message", {
           agent: this.agentType,
           content: contentStr,
           phase,
           sceneNum,  // Include sceneNum for frontend deduplication
         });
-        console.log(`[${this.agentType}] Published message event with ID:`, eventId);
+        console.log(`[${this.agentType}] Published message event with ID:`, eventId ?? "(queued)");
       } catch (error) {
         console.error(`[${this.agentType}] Error publishing message event:`, error);
       }
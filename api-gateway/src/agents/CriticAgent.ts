@@ -15,6 +15,9 @@ import { CritiqueSchema } from "../schemas/AgentSchemas";
 import { ContentGuardrail, ConsistencyGuardrail } from "../guardrails";
 import { RedisStreamsService } from "../services/RedisStreamsService";
 import { isRevisionNeeded as gateIsRevisionNeeded, calculateWordCountCompliance } from "../utils/revisionGate";
+import { memoizeRosterBlock } from "../utils/characterIndex";
+import { stringifyCached } from "../utils/stringifyCache";
+import { renderTemplate } from "../utils/promptTemplate";
 
 export class CriticAgent extends BaseAgent {
   constructor(
@@ -104,7 +107,7 @@ export class CriticAgent extends BaseAgent {
         const prompt = await this.langfuse.getCompiledPrompt(
           promptName,
           variables,
-          { fallback: this.getFallbackPrompt(variables) }
+          { fallback: () => this.getFallbackPrompt(variables) }
         );
         return prompt;
       } catch (error) {
@@ -129,11 +132,7 @@ Key Constraints: ${variables.keyConstraints || "No constraints established yet."
    * Compile fallback prompt with variables
    */
   private compileFallbackPrompt(variables: Record<string, string>): string {
-    let prompt = this.getFallbackPrompt(variables);
-    for (const [key, value] of Object.entries(variables)) {
-      prompt = prompt.replace(new RegExp(`\\{\\{${key}\\}\\}`, "g"), value);
-    }
-    return prompt;
+    return renderTemplate(this.getFallbackPrompt(variables), variables);
   }
 
   /**
@@ -169,9 +168,11 @@ Key Constraints: ${variables.keyConstraints || "No constraints established yet."
       const sceneHook = sceneOutline.hook ?? sceneOutline.endHook ?? "";
 
       // Slice 1a: give the Critic the context it needs to judge consistency.
-      const rosterBlock = (state.characters ?? [])
-        .map((c) => `- ${String(c.name ?? "?")}${c.role ? ` (${String(c.role)})` : ""}`)
-        .join("\n") || "No characters defined.";
+      const roster = state.characters ?? [];
+      const rosterBlock = roster.length === 0
+        ? "No characters defined."
+        : memoizeRosterBlock(roster, "roster", () =>
+          roster.map((c) => `- ${String(c.name ?? "?")}${c.role ? ` (${String(c.role)})` : ""}`).join("\n"));
       const worldStateBlock = this.buildWorldStateBlock(state.worldState);
       const narratorVoiceBlock = this.buildNarratorVoiceBlock(state.narratorVoice);
       const synopsisBlock = this.buildSynopsisBlock(state.rollingSynopsis, sceneNum);
@@ -182,7 +183,7 @@ Key Constraints: ${variables.keyConstraints || "No constraints established yet."
 ${(draft as Record<string, unknown>).content}
 
 SCENE OUTLINE (for scope checking):
-${JSON.stringify(sceneOutline, null, 2)}
+${stringifyCached(sceneOutline)}
 
 CHARACTER ROSTER (for consistency checking):
 ${rosterBlock}
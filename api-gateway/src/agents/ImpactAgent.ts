@@ -15,6 +15,23 @@ import { ImpactReportSchema } from "../schemas/AgentSchemas";
 import { ContentGuardrail, ConsistencyGuardrail } from "../guardrails";
 import { RedisStreamsService } from "../services/RedisStreamsService";
 
+// Invariant task/schema text for the impact prompt. Kept at module level and
+// placed at the START of the user prompt so it forms a cacheable prefix.
+const IMPACT_INSTRUCTIONS = `Assess the emotional impact of the scene below.
+
+Evaluate:
+1. Emotional resonance
+2. Reader engagement
+3. Character connection
+4. Tension and stakes
+5. Payoff satisfaction
+
+Output JSON with:
+- impact_score: number (1-10)
+- emotional_beats: string[]
+- engagement_level: "high" | "medium" | "low"
+- recommendations: string[]`;
+
 export class ImpactAgent extends BaseAgent {
   constructor(
     llmProvider: LLMProviderService,
@@ -75,7 +92,7 @@ export class ImpactAgent extends BaseAgent {
         return await this.langfuse.getCompiledPrompt(
           promptName,
           {},
-          { fallback: this.getFallbackPrompt() }
+          { fallback: () => this.getFallbackPrompt() }
         );
       } catch (error) {
         console.warn(`Failed to get prompt from Langfuse for ${this.agentType}, using fallback`);
@@ -101,22 +118,13 @@ Your role is to evaluate how effectively the prose engages readers emotionally.`
       throw new Error(`No draft found for scene ${sceneNum}`);
     }
 
-    return `Assess emotional impact of Scene ${sceneNum}:
+    // Static instructions first, scene-specific text last, so consecutive
+    // scenes share a long common prompt prefix for provider prompt caching.
+    return `${IMPACT_INSTRUCTIONS}
 
-${(draft as Record<string, unknown>).content}
+Scene ${sceneNum}:
 
-Evaluate:
-1. Emotional resonance
-2. Reader engagement
-3. Character connection
-4. Tension and stakes
-5. Payoff satisfaction
-
-Output JSON with:
-- impact_score: number (1-10)
-- emotional_beats: string[]
-- engagement_level: "high" | "medium" | "low"
-- recommendations: string[]`;
+${(draft as Record<string, unknown>).content}`;
   }
 }
 
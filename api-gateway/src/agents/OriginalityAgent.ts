@@ -15,6 +15,21 @@ import { OriginalityReportSchema } from "../schemas/AgentSchemas";
 import { ContentGuardrail, ConsistencyGuardrail } from "../guardrails";
 import { RedisStreamsService } from "../services/RedisStreamsService";
 
+// Invariant task/schema text for the originality prompt. Kept at module level
+// and placed at the START of the user prompt so it forms a cacheable prefix.
+const ORIGINALITY_INSTRUCTIONS = `Check the scene below for originality.
+
+Identify:
+1. Cliches and overused tropes
+2. Predictable plot elements
+3. Generic character moments
+4. Unoriginal dialogue patterns
+
+Output JSON with:
+- originality_score: number (1-10)
+- cliches_found: string[]
+- suggestions: string[] (unique alternatives)`;
+
 export class OriginalityAgent extends BaseAgent {
   constructor(
     llmProvider: LLMProviderService,
@@ -77,7 +92,7 @@ export class OriginalityAgent extends BaseAgent {
         return await this.langfuse.getCompiledPrompt(
           promptName,
           {},
-          { fallback: this.getFallbackPrompt() }
+          { fallback: () => this.getFallbackPrompt() }
         );
       } catch (error) {
         console.warn(`Failed to get prompt from Langfuse for ${this.agentType}, using fallback`);
@@ -103,20 +118,13 @@ Your role is to identify overused elements and suggest unique alternatives.`;
       throw new Error(`No draft found for scene ${sceneNum}`);
     }
 
-    return `Check Scene ${sceneNum} for originality:
+    // Static instructions first, scene-specific text last, so consecutive
+    // scenes share a long common prompt prefix for provider prompt caching.
+    return `${ORIGINALITY_INSTRUCTIONS}
 
-${(draft as Record<string, unknown>).content}
+Scene ${sceneNum}:
 
-Identify:
-1. Cliches and overused tropes
-2. Predictable plot elements
-3. Generic character moments
-4. Unoriginal dialogue patterns
-
-Output JSON with:
-- originality_score: number (1-10)
-- cliches_found: string[]
-- suggestions: string[] (unique alternatives)`;
+${(draft as Record<string, unknown>).content}`;
   }
 }
 
@@ -14,6 +14,8 @@ import { AgentContext, AgentOutput, GenerationOptions } from "./types";
 import { CharactersArraySchema } from "../schemas/AgentSchemas";
 import { ContentGuardrail, ConsistencyGuardrail } from "../guardrails";
 import { RedisStreamsService } from "../services/RedisStreamsService";
+import { stringifyCached } from "../utils/stringifyCache";
+import { renderTemplate } from "../utils/promptTemplate";
 
 export class ProfilerAgent extends BaseAgent {
   constructor(
@@ -92,7 +94,7 @@ export class ProfilerAgent extends BaseAgent {
   ): Promise<string> {
     const promptName = AGENT_PROMPTS.PROFILER;
     const variables: Record<string, string> = {
-      narrative: JSON.stringify(context.state.narrative || {}),
+      narrative: stringifyCached(context.state.narrative || {}),
     };
 
     if (this.langfuse.isEnabled) {
@@ -100,7 +102,7 @@ export class ProfilerAgent extends BaseAgent {
         return await this.langfuse.getCompiledPrompt(
           promptName,
           variables,
-          { fallback: this.getFallbackPrompt(variables) }
+          { fallback: () => this.getFallbackPrompt(variables) }
         );
       } catch (error) {
         console.warn(`Failed to get prompt from Langfuse for ${this.agentType}, using fallback`);
@@ -117,11 +119,7 @@ Narrative context: ${variables.narrative || "No narrative yet"}`;
   }
 
   private compileFallbackPrompt(variables: Record<string, string>): string {
-    let prompt = this.getFallbackPrompt(variables);
-    for (const [key, value] of Object.entries(variables)) {
-      prompt = prompt.replace(new RegExp(`\\{\\{${key}\\}\\}`, "g"), value);
-    }
-    return prompt;
+    return renderTemplate(this.getFallbackPrompt(variables), variables);
   }
 
   /**
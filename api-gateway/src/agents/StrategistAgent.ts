@@ -14,6 +14,8 @@ import { AgentContext, AgentOutput, GenerationOptions } from "./types";
 import { OutlineSchema, AdvancedPlanSchema } from "../schemas/AgentSchemas";
 import { ContentGuardrail, ConsistencyGuardrail } from "../guardrails";
 import { RedisStreamsService } from "../services/RedisStreamsService";
+import { stringifyCached } from "../utils/stringifyCache";
+import { renderTemplate } from "../utils/promptTemplate";
 
 export class StrategistAgent extends BaseAgent {
   constructor(
@@ -85,9 +87,9 @@ export class StrategistAgent extends BaseAgent {
   ): Promise<string> {
     const promptName = AGENT_PROMPTS.STRATEGIST;
     const variables: Record<string, string> = {
-      narrative: JSON.stringify(context.state.narrative || {}),
-      characters: JSON.stringify(context.state.characters || []),
-      worldbuilding: JSON.stringify(context.state.worldbuilding || {}),
+      narrative: stringifyCached(context.state.narrative || {}),
+      characters: stringifyCached(context.state.characters || []),
+      worldbuilding: stringifyCached(context.state.worldbuilding || {}),
     };
 
     if (this.langfuse.isEnabled) {
@@ -95,7 +97,7 @@ export class StrategistAgent extends BaseAgent {
         return await this.langfuse.getCompiledPrompt(
           promptName,
           variables,
-          { fallback: this.getFallbackPrompt(variables) }
+          { fallback: () => this.getFallbackPrompt(variables) }
         );
       } catch (error) {
         console.warn(`Failed to get prompt from Langfuse for ${this.agentType}, using fallback`);
@@ -114,11 +116,7 @@ World: ${variables.worldbuilding || "No worldbuilding yet"}`;
   }
 
   private compileFallbackPrompt(variables: Record<string, string>): string {
-    let prompt = this.getFallbackPrompt(variables);
-    for (const [key, value] of Object.entries(variables)) {
-      prompt = prompt.replace(new RegExp(`\\{\\{${key}\\}\\}`, "g"), value);
-    }
-    return prompt;
+    return renderTemplate(this.getFallbackPrompt(variables), variables);
   }
 
   /**
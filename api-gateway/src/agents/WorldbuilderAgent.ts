@@ -14,6 +14,8 @@ import { AgentContext, AgentOutput, GenerationOptions } from "./types";
 import { WorldbuildingSchema } from "../schemas/AgentSchemas";
 import { ContentGuardrail, ConsistencyGuardrail } from "../guardrails";
 import { RedisStreamsService } from "../services/RedisStreamsService";
+import { parseCached, stringifyCached } from "../utils/stringifyCache";
+import { renderTemplate } from "../utils/promptTemplate";
 
 export class WorldbuilderAgent extends BaseAgent {
   constructor(
@@ -62,8 +64,8 @@ export class WorldbuilderAgent extends BaseAgent {
   ): Promise<string> {
     const promptName = AGENT_PROMPTS.WORLDBUILDER;
     const variables: Record<string, string> = {
-      narrative: JSON.stringify(context.state.narrative || {}),
-      characters: JSON.stringify(context.state.characters || []),
+      narrative: stringifyCached(context.state.narrative || {}),
+      characters: stringifyCached(context.state.characters || []),
     };
 
     if (this.langfuse.isEnabled) {
@@ -71,7 +73,7 @@ export class WorldbuilderAgent extends BaseAgent {
         return await this.langfuse.getCompiledPrompt(
           promptName,
           variables,
-          { fallback: this.getFallbackPrompt(variables) }
+          { fallback: () => this.getFallbackPrompt(variables) }
         );
       } catch (error) {
         console.warn(`Failed to get prompt from Langfuse for ${this.agentType}, using fallback`);
@@ -85,7 +87,7 @@ export class WorldbuilderAgent extends BaseAgent {
     // Parse narrative to extract genre for system prompt emphasis
     let genreInstruction = "";
     try {
-      const narrative = JSON.parse(variables.narrative || "{}");
+      const narrative = parseCached(variables.narrative || "{}") as Record<string, unknown> | null;
       const genre = this.extractStringValue(narrative?.genre);
       if (genre) {
         genreInstruction = `\n\nCRITICAL GENRE CONSTRAINT: The story genre is "${genre}". You MUST strictly adhere to this genre. DO NOT introduce elements that contradict it (e.g., no fantasy/magic in sci-fi, no sci-fi tech in historical fiction).`;
@@ -101,11 +103,7 @@ Characters: ${variables.characters || "No characters yet"}${genreInstruction}`;
   }
 
   private compileFallbackPrompt(variables: Record<string, string>): string {
-    let prompt = this.getFallbackPrompt(variables);
-    for (const [key, value] of Object.entries(variables)) {
-      prompt = prompt.replace(new RegExp(`\\{\\{${key}\\}\\}`, "g"), value);
-    }
-    return prompt;
+    return renderTemplate(this.getFallbackPrompt(variables), variables);
   }
 
   private buildUserPrompt(
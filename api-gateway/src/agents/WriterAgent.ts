@@ -14,6 +14,46 @@ import { AgentContext, AgentOutput, GenerationOptions } from "./types";
 import { ContentGuardrail, ConsistencyGuardrail } from "../guardrails";
 import { RedisStreamsService } from "../services/RedisStreamsService";
 import { buildCanonicalNamesBlock as buildCanonicalNamesBlockHelper } from "../utils/canonicalNames";
+import { memoizeRosterBlock, normalizeCharacterName, selectCharactersByName } from "../utils/characterIndex";
+import { lastWords } from "../utils/wordCount";
+import { stringifyCached } from "../utils/stringifyCache";
+import { renderTemplate } from "../utils/promptTemplate";
+
+// Prompt fragments that do not depend on state are built once at module load
+// rather than re-allocated on every buildUserPrompt call.
+
+// Critical instruction to prevent persona break - added to ALL user prompts
+// This cannot be overridden by Langfuse system prompts
+const AUTONOMOUS_INSTRUCTION = `
+CRITICAL: Output ONLY the story prose. DO NOT ask questions. DO NOT offer options (A/B/C). DO NOT include meta-commentary like "Here is the scene" or "Which approach would you prefer". Just write the story content directly.`;
+
+const SPICE_INSTRUCTION = `
+SPICE TAGGING: If this scene contains an intimate/sexual passage, wrap ONLY that passage in spice tags so it can later be intensified:
+{{SPICE style="<short label of where the intimacy goes, e.g. 'tender to intense' or 'dom/sub escalation'>"}}
+...write the FULL passage at your normal strength here, including the dialogue, psychology, and build-up...
+{{/SPICE}}
+Write the passage completely and well — do NOT soften or skip it. Tag only the intimate fragment, not the whole scene. If the scene has no intimacy, do not emit any tags.`;
+
+// Transport fields the orchestrator rides along on the scene outline. Their
+// text is rendered in its own prompt section, so serializing them again inside
+// the outline JSON only doubles the largest payload in the prompt.
+const OUTLINE_TRANSPORT_FIELDS = new Set(["retrievedContext", "existingContent"]);
+
+// Rubric dimensions scored below this are surfaced to the Writer on revision.
+const WEAK_RUBRIC_SCORE = 7;
+
+// Interactive-assistant phrasings that indicate the Writer broke persona.
+// None use the /g flag, so .test() is stateless and the array can be shared.
+const PERSONA_BREAK_PATTERNS: RegExp[] = [
+  /which (?:approach|option|version) (?:would you|do you) prefer/i,
+  /\b[ABC]\)\s+/,  // A) B) C) options
+  /your guidance/i,
+  /let me know (?:if|which|what)/i,
+  /would you like me to/i,
+  /here (?:is|are) (?:the|some) (?:revised|options|approaches)/i,
+  /please (?:choose|select|let me know)/i,
+  /\?{2,}/,  // Multiple question marks
+];
 
 export class WriterAgent extends BaseAgent {
   constructor(
@@ -96,8 +136,8 @@ export class WriterAgent extends BaseAgent {
     const constraintsBlock = this.buildConstraintsBlock(context.state.keyConstraints);
     
     const variables: Record<string, string> = {
-      narrative: JSON.stringify(context.state.narrative || {}),
-      characters: JSON.stringify(context.state.characters || []),
+      narrative: stringifyCached(context.state.narrative || {}),
+      characters: stringifyCached(context.state.characters || []),
       keyConstraints: constraintsBlock,
     };
 
@@ -106,7 +146,7 @@ export class WriterAgent extends BaseAgent {
         const prompt = await this.langfuse.getCompiledPrompt(
           promptName,
           variables,
-          { fallback: this.getFallbackPrompt(variables) }
+          { fallback: () => this.getFallbackPrompt(variables) }
         );
         return prompt;
       } catch (error) {
@@ -142,11 +182,7 @@ Key Constraints: ${variables.keyConstraints || "No constraints established yet."
    * Compile fallback prompt with variables
    */
   private compileFallbackPrompt(variables: Record<string, string>): string {
-    let prompt = this.getFallbackPrompt(variables);
-    for (const [key, value] of Object.entries(variables)) {
-      prompt = prompt.replace(new RegExp(`\\{\\{${key}\\}\\}`, "g"), value);
-    }
-    return prompt;
+    return renderTemplate(this.getFallbackPrompt(variables), variables);
   }
 
   /**
@@ -161,21 +197,9 @@ Key Constraints: ${variables.keyConstraints || "No constraints established yet."
     const state = context.state;
     const constraintsBlock = this.buildConstraintsBlock(state.keyConstraints);
     
-    // Critical instruction to prevent persona break - added to ALL user prompts
-    // This cannot be overridden by Langfuse system prompts
-    const autonomousInstruction = `
-CRITICAL: Output ONLY the story prose. DO NOT ask questions. DO NOT offer options (A/B/C). DO NOT include meta-commentary like "Here is the scene" or "Which approach would you prefer". Just write the story content directly.`;
-
     // Slice 2: only ask the model to tag intimate fragments when spice is enabled.
     // With spice off this is "" and no {{SPICE}} markup is ever produced.
-    const spiceInstruction = options.spiceConfig
-      ? `
-SPICE TAGGING: If this scene contains an intimate/sexual passage, wrap ONLY that passage in spice tags so it can later be intensified:
-{{SPICE style="<short label of where the intimacy goes, e.g. 'tender to intense' or 'dom/sub escalation'>"}}
-...write the FULL passage at your normal strength here, including the dialogue, psychology, and build-up...
-{{/SPICE}}
-Write the passage completely and well — do NOT soften or skip it. Tag only the intimate fragment, not the whole scene. If the scene has no intimacy, do not emit any tags.`
-      : "";
+    const spiceInstruction = options.spiceConfig ? SPICE_INSTRUCTION : "";
 
     if (phase === GenerationPhase.DRAFTING) {
       const sceneNum = state.currentScene;
@@ -234,7 +258,7 @@ STORY CRAFT PLAN (weave these in):
 ${advancedPlanBlock}
 
 Scene outline:
-${JSON.stringify(sceneOutline, null, 2)}
+${this.serializeSceneOutline(sceneOutline)}
 
 BEATS METHOD INSTRUCTION:
 You are writing Part 1 of ${partsTotal} parts for this scene.
@@ -250,12 +274,12 @@ Requirements:
 KEY CONSTRAINTS (MUST NOT VIOLATE):
 ${constraintsBlock}
 ${retrievedContext}
-${autonomousInstruction}${spiceInstruction}`;
+${AUTONOMOUS_INSTRUCTION}${spiceInstruction}`;
         } else {
           // Continuation parts (2, 3, 4...)
           // Use 50 words of context (not 20) to maintain narrative voice and tone consistency
-          const lastWords = existingContent.trim().split(/\s+/).slice(-50).join(" ");
-          const lastChars = lastWords.length > 300 ? lastWords.slice(-300) : lastWords;
+          const endingWords = lastWords(existingContent, 50);
+          const lastChars = endingWords.length > 300 ? endingWords.slice(-300) : endingWords;
 
           const partInstruction = isFinalPart
             ? `This is the FINAL part. You MUST conclude the scene and end with the specified hook.`
@@ -300,7 +324,7 @@ ${isFinalPart ? "- End with the specified hook from the scene outline" : "- Prog
 KEY CONSTRAINTS (MUST NOT VIOLATE):
 ${constraintsBlock}
 ${retrievedContext}
-${autonomousInstruction}`;
+${AUTONOMOUS_INSTRUCTION}`;
         }
       }
 
@@ -311,8 +335,8 @@ ${autonomousInstruction}`;
         
         // Get the last ~100 characters, breaking at word boundary to avoid mid-word/mid-character cuts
         // This prevents UTF-8 issues with multi-byte characters (emojis, special chars)
-        const lastWords = existingContent.trim().split(/\s+/).slice(-15).join(" ");
-        const lastChars = lastWords.length > 100 ? lastWords.slice(-100) : lastWords;
+        const endingWords = lastWords(existingContent, 15);
+        const lastChars = endingWords.length > 100 ? endingWords.slice(-100) : endingWords;
         
         return `Continue Scene ${sceneNum}: "${sceneTitle}"
 
@@ -351,7 +375,7 @@ Requirements:
 
 KEY CONSTRAINTS (MUST NOT VIOLATE):
 ${constraintsBlock}
-${autonomousInstruction}`;
+${AUTONOMOUS_INSTRUCTION}`;
       }
 
       // Include retrieved context from Qdrant for hallucination prevention
@@ -378,7 +402,7 @@ STORY CRAFT PLAN (weave these in):
 ${advancedPlanBlock}
 
 Scene outline:
-${JSON.stringify(sceneOutline, null, 2)}
+${this.serializeSceneOutline(sceneOutline)}
 
 SCOPE CONTROL (CRITICAL):
 - Cover ONLY what's in this scene outline - do not advance the plot beyond what's specified
@@ -396,7 +420,7 @@ Requirements:
 KEY CONSTRAINTS (MUST NOT VIOLATE):
 ${constraintsBlock}
 ${retrievedContext}
-${autonomousInstruction}${spiceInstruction}`;
+${AUTONOMOUS_INSTRUCTION}${spiceInstruction}`;
     }
 
     if (phase === GenerationPhase.REVISION) {
@@ -426,17 +450,16 @@ CANONICAL NAMES (DO NOT INTRODUCE NEW NAMED CHARACTERS):
 ${characterNames}
 
 CHARACTER PROFILES:
-${JSON.stringify(state.characters || [], null, 2)}
+${this.serializePresentProfiles(state.characters, state.currentSceneContract?.charactersPresent ?? [])}
 
 SCENE OUTLINE (goals, hook, characters):
-${JSON.stringify(sceneOutline, null, 2)}
+${this.serializeSceneOutline(sceneOutline)}
 
 Original draft:
 ${(draft as Record<string, unknown>).content}
 
-Critique feedback:
-Issues: ${JSON.stringify(latestCritique.issues || [])}
-Revision requests: ${JSON.stringify(latestCritique.revisionRequests || [])}
+Critique feedback (JSON; issues, revisionRequests, weakRubric = rubric dimensions scored under ${WEAK_RUBRIC_SCORE}; absent keys have nothing to report):
+${this.buildRevisionFeedback(latestCritique)}
 
 KEY CONSTRAINTS (MUST NOT VIOLATE):
 ${constraintsBlock}
@@ -446,7 +469,7 @@ CRITICAL: When revising, you MUST:
 - Use ONLY the canonical character names listed above
 - Do NOT introduce new named characters not in the character profiles
 - Maintain consistency with established facts and character traits
-${autonomousInstruction}`;
+${AUTONOMOUS_INSTRUCTION}`;
     }
 
     if (phase === GenerationPhase.POLISH) {
@@ -476,7 +499,7 @@ CRITICAL REQUIREMENTS:
 - Do NOT shorten or summarize - the polished version must be at least ${currentWordCount} words
 - Output EVERY SINGLE WORD of the polished scene from beginning to end
 - Preserve all story beats and plot points
-${autonomousInstruction}`;
+${AUTONOMOUS_INSTRUCTION}`;
     }
 
     throw new Error(`WriterAgent not configured for phase: ${phase}`);
@@ -487,18 +510,65 @@ ${autonomousInstruction}`;
    * Returns true if the output contains interactive assistant patterns
    */
   public detectPersonaBreak(content: string): boolean {
-    const personaBreakPatterns = [
-      /which (?:approach|option|version) (?:would you|do you) prefer/i,
-      /\b[ABC]\)\s+/,  // A) B) C) options
-      /your guidance/i,
-      /let me know (?:if|which|what)/i,
-      /would you like me to/i,
-      /here (?:is|are) (?:the|some) (?:revised|options|approaches)/i,
-      /please (?:choose|select|let me know)/i,
-      /\?{2,}/,  // Multiple question marks
-    ];
-
-    return personaBreakPatterns.some(pattern => pattern.test(content));
+    return PERSONA_BREAK_PATTERNS.some(pattern => pattern.test(content));
+  }
+
+  /**
+   * Compact JSON of the critique feedback the revision must act on. Empty
+   * sections are omitted rather than sent as labelled empty lists, and the
+   * rubric is reduced to its weak dimensions.
+   */
+  private buildRevisionFeedback(critique: Record<string, unknown>): string {
+    const feedback: Record<string, unknown> = {};
+    if (Array.isArray(critique.issues) && critique.issues.length > 0) {
+      feedback.issues = critique.issues;
+    }
+    if (Array.isArray(critique.revisionRequests) && critique.revisionRequests.length > 0) {
+      feedback.revisionRequests = critique.revisionRequests;
+    }
+    const rubric = critique.rubric;
+    if (rubric && typeof rubric === "object") {
+      const weak: Record<string, number> = {};
+      for (const [dimension, score] of Object.entries(rubric as Record<string, unknown>)) {
+        if (typeof score === "number" && score < WEAK_RUBRIC_SCORE) weak[dimension] = score;
+      }
+      if (Object.keys(weak).length > 0) feedback.weakRubric = weak;
+    }
+    return JSON.stringify(feedback);
+  }
+
+  /**
+   * Serialize the scene outline for the prompt without the transport fields
+   * (retrieved context, prior-part content) that are rendered on their own.
+   * Only the top level is filtered, so stringify keeps its native fast path.
+   */
+  private serializeSceneOutline(sceneOutline: Record<string, unknown>): string {
+    const outline: Record<string, unknown> = {};
+    for (const key of Object.keys(sceneOutline)) {
+      if (!OUTLINE_TRANSPORT_FIELDS.has(key)) outline[key] = sceneOutline[key];
+    }
+    return JSON.stringify(outline);
+  }
+
+  /**
+   * Narrow the full cast to the characters present in this scene for the
+   * revision prompt. Every revision round re-sends the profiles alongside the
+   * draft, so shipping the whole cast multiplies prompt tokens by the number
+   * of rounds. Falls back to the full cast when presence is unknown or no
+   * present name matches a profile. The canonical names block still lists
+   * everyone, so name discipline is unaffected.
+   *
+   * Serialized once per roster and present list; the full-cast fallback
+   * reuses the string the draft prompt already built for `characters`.
+   */
+  private serializePresentProfiles(characters: Record<string, unknown>[] | undefined, present: string[]): string {
+    const all = characters ?? [];
+    if (present.length === 0 || all.length === 0) return stringifyCached(all);
+    const key = `profiles:${present.map(normalizeCharacterName).join("\u0000")}`;
+    return memoizeRosterBlock(all, key, () => {
+      const selected = selectCharactersByName(all, present);
+      return selected.length > 0 ? JSON.stringify(selected) : stringifyCached(all);
+    });
   }
 
   /**
@@ -39,6 +39,15 @@ interface VeniceModelsResponse {
   data: Array<{ id: string; name?: string; context_length?: number }>;
 }
 
+// Known OpenAI context windows; exact ids first, then the first matching prefix.
+const OPENAI_CONTEXT_LENGTHS: Record<string, number> = {
+  "gpt-5.5": 1000000,
+  "gpt-5.4": 400000,
+  "gpt-5.4-mini": 400000,
+  "gpt-5.4-nano": 400000,
+  "gpt-5": 400000,
+};
+
 @Controller("/models")
 @Tags("Dynamic Models")
 @Description("Dynamic model fetching from provider APIs")
@@ -249,21 +258,13 @@ export class DynamicModelsController {
   }
 
   private getOpenAIContextLength(modelId: string): number {
-    const contextLengths: Record<string, number> = {
-      "gpt-5.5": 1000000,
-      "gpt-5.4": 400000,
-      "gpt-5.4-mini": 400000,
-      "gpt-5.4-nano": 400000,
-      "gpt-5": 400000,
-    };
-
     // Check for exact match first
-    if (contextLengths[modelId]) {
-      return contextLengths[modelId];
+    if (OPENAI_CONTEXT_LENGTHS[modelId]) {
+      return OPENAI_CONTEXT_LENGTHS[modelId];
     }
 
     // Check for prefix match
-    for (const [prefix, length] of Object.entries(contextLengths)) {
+    for (const [prefix, length] of Object.entries(OPENAI_CONTEXT_LENGTHS)) {
       if (modelId.startsWith(prefix)) {
         return length;
       }
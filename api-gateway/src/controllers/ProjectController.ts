@@ -7,6 +7,8 @@ import { QdrantMemoryService } from "../services/QdrantMemoryService";
 import { CacheService } from "../services/CacheService";
 import { StoryProjectDTO, ProjectResponseDTO, NarrativePossibilityDTO } from "../models/ProjectModels";
 
+const PHASE_ORDER: readonly string[] = ["genesis", "characters", "outlining", "drafting", "critique", "completed"];
+
 @Controller("/project")
 @Tags("Project")
 @Description("Project management endpoints")
@@ -117,9 +119,8 @@ export class ProjectController {
     }
 
     // Determine next phase
-    const phaseOrder = ["genesis", "characters", "outlining", "drafting", "critique", "completed"];
-    const currentIndex = phaseOrder.indexOf(project.status);
-    const nextPhase = phaseOrder[currentIndex + 1];
+    const currentIndex = PHASE_ORDER.indexOf(project.status);
+    const nextPhase = PHASE_ORDER[currentIndex + 1];
 
     if (!nextPhase || nextPhase === "completed") {
       return {
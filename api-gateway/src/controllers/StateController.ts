@@ -7,7 +7,7 @@
 import { Controller, Get, PathParams } from "@tsed/common";
 import { Inject } from "@tsed/di";
 import { StorytellerOrchestrator } from "../services/StorytellerOrchestrator";
-import { GENERATION_GRAPH, getStateNodeByPhase, getNextStates } from "../models/StateGraph";
+import { GENERATION_GRAPH, getStateNodeByPhase, getStateNodeIndex, getNextStates } from "../models/StateGraph";
 import { GenerationPhase } from "../models/LLMModels";
 
 /**
@@ -70,11 +70,12 @@ export class StateController {
     const nextStates = getNextStates(currentStateNode.id, context);
 
     // Build all states with their current status
+    const currentIndex = getStateNodeIndex(currentStateNode.id);
     const allStates = GENERATION_GRAPH.map((node) => {
       let status: string = "pending";
       if (node.id === currentStateNode.id) {
         status = runStatus.isCompleted ? "completed" : runStatus.isPaused ? "pending" : "active";
-      } else if (GENERATION_GRAPH.findIndex((n) => n.id === node.id) < GENERATION_GRAPH.findIndex((n) => n.id === currentStateNode.id)) {
+      } else if (getStateNodeIndex(node.id) < currentIndex) {
         status = "completed";
       }
 
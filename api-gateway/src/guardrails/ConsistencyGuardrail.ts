@@ -45,6 +45,8 @@ export interface ConsistencyCheckOptions {
   projectId?: string;
 }
 
+const HAIR_COLORS = ["blonde", "brunette", "black", "red", "brown", "gray", "white"];
+
 @Service()
 export class ConsistencyGuardrail {
   @Inject()
@@ -187,72 +189,58 @@ export class ConsistencyGuardrail {
 
   /**
    * Keyword-based constraint checking
-   * Fast check for known contradiction patterns
+   * Fast check for known contradiction patterns. The content-side facts (hair
+   * colors, eye colors, life/death words, first location) are scanned once per
+   * call, so each constraint costs O(1) instead of another pass over the scene.
    */
   private checkKeywordConstraints(content: string, constraints: KeyConstraint[]): string[] {
     const violations: string[] = [];
     const contentLower = content.toLowerCase();
 
+    const otherEyeColor = contentLower.includes("green eye") || contentLower.includes("brown eye");
+    const hairColorsInContent = new Set(HAIR_COLORS.filter(c => contentLower.includes(`${c} hair`)));
+    const mentionsAlive = contentLower.includes("alive");
+    const mentionsDeath = contentLower.includes("died") || contentLower.includes("dead");
+    const contentLocation = contentLower.match(/(?:in|at|near)\s+(\w+)/i)?.[1];
+
     for (const constraint of constraints) {
       const constraintKey = constraint.key.toLowerCase();
       const constraintValue = constraint.value.toLowerCase();
+      const contradiction = `Contradicts constraint: ${constraint.key} = ${constraint.value} (Scene ${constraint.sceneNumber})`;
 
       // Check for eye color contradictions
-      if (constraintKey.includes("eye") && constraintValue.includes("blue")) {
-        if (contentLower.includes("green eye") || contentLower.includes("brown eye")) {
-          violations.push(
-            `Contradicts constraint: ${constraint.key} = ${constraint.value} (Scene ${constraint.sceneNumber})`
-          );
-        }
+      if (constraintKey.includes("eye") && constraintValue.includes("blue") && otherEyeColor) {
+        violations.push(contradiction);
       }
 
       // Check for hair color contradictions
-      if (constraintKey.includes("hair")) {
-        const hairColors = ["blonde", "brunette", "black", "red", "brown", "gray", "white"];
-        const constraintColor = hairColors.find(c => constraintValue.includes(c));
-        if (constraintColor) {
-          const otherColors = hairColors.filter(c => c !== constraintColor);
-          for (const color of otherColors) {
-            if (contentLower.includes(`${color} hair`)) {
-              violations.push(
-                `Contradicts constraint: ${constraint.key} = ${constraint.value} (Scene ${constraint.sceneNumber})`
-              );
-              break;
-            }
-          }
+      if (constraintKey.includes("hair") && hairColorsInContent.size > 0) {
+        const constraintColor = HAIR_COLORS.find(c => constraintValue.includes(c));
+        if (constraintColor && (hairColorsInContent.size > 1 || !hairColorsInContent.has(constraintColor))) {
+          violations.push(contradiction);
         }
       }
 
       // Check for status contradictions (alive/dead)
       if (constraintKey.includes("status") || constraintKey.includes("alive") || constraintKey.includes("dead")) {
-        if (constraintValue.includes("dead") && contentLower.includes("alive")) {
-          violations.push(
-            `Contradicts constraint: ${constraint.key} = ${constraint.value} (Scene ${constraint.sceneNumber})`
-          );
+        if (constraintValue.includes("dead") && mentionsAlive) {
+          violations.push(contradiction);
         }
-        if (constraintValue.includes("alive") && (contentLower.includes("died") || contentLower.includes("dead"))) {
-          violations.push(
-            `Contradicts constraint: ${constraint.key} = ${constraint.value} (Scene ${constraint.sceneNumber})`
-          );
+        if (constraintValue.includes("alive") && mentionsDeath) {
+          violations.push(contradiction);
         }
       }
 
       // Check for location contradictions
-      if (constraintKey.includes("location") || constraintKey.includes("place")) {
+      if (contentLocation && (constraintKey.includes("location") || constraintKey.includes("place"))) {
         // Extract location name from constraint
         const locationMatch = constraintValue.match(/(?:in|at|near)\s+(\w+)/i);
-        if (locationMatch) {
-          const expectedLocation = locationMatch[1].toLowerCase();
-          // Check if content mentions being in a different location
-          const contentLocationMatch = contentLower.match(/(?:in|at|near)\s+(\w+)/i);
-          if (contentLocationMatch && contentLocationMatch[1] !== expectedLocation) {
-            // Only flag if the constraint is about current location
-            if (constraintKey.includes("current") || constraintKey.includes("now")) {
-              violations.push(
-                `Potential location contradiction: ${constraint.key} = ${constraint.value} (Scene ${constraint.sceneNumber})`
-              );
-            }
-          }
+        // Only flag if the content names a different place and the constraint is about current location
+        if (locationMatch && contentLocation !== locationMatch[1].toLowerCase()
+          && (constraintKey.includes("current") || constraintKey.includes("now"))) {
+          violations.push(
+            `Potential location contradiction: ${constraint.key} = ${constraint.value} (Scene ${constraint.sceneNumber})`
+          );
         }
       }
     }
@@ -700,21 +700,28 @@ export const PHASE_CONFIGS: PhaseConfig[] = [
   },
 ];
 
+/**
+ * Position of each phase in PHASE_CONFIGS, built once so phase lookups are a
+ * map hit instead of a scan of the config list.
+ */
+const PHASE_INDEX: ReadonlyMap<GenerationPhase, number> = new Map(
+  PHASE_CONFIGS.map((config, index) => [config.phase, index])
+);
+
 /**
  * Get phase config by phase enum
  */
 export function getPhaseConfig(phase: GenerationPhase): PhaseConfig | undefined {
-  return PHASE_CONFIGS.find((config) => config.phase === phase);
+  const index = PHASE_INDEX.get(phase);
+  return index === undefined ? undefined : PHASE_CONFIGS[index];
 }
 
 /**
  * Get next phase in the flow
  */
 export function getNextPhase(currentPhase: GenerationPhase): GenerationPhase | null {
-  const currentIndex = PHASE_CONFIGS.findIndex(
-    (config) => config.phase === currentPhase
-  );
-  if (currentIndex === -1 || currentIndex === PHASE_CONFIGS.length - 1) {
+  const currentIndex = PHASE_INDEX.get(currentPhase);
+  if (currentIndex === undefined || currentIndex === PHASE_CONFIGS.length - 1) {
     return null;
   }
   return PHASE_CONFIGS[currentIndex + 1].phase;
@@ -120,18 +120,34 @@ export const GENERATION_GRAPH: StateNode[] = [
   },
 ];
 
+// Lookup indexes built once from the static graph (first node wins, like find).
+const NODE_INDEX_BY_ID = new Map<string, number>();
+const NODE_BY_PHASE = new Map<GenerationPhase, StateNode>();
+GENERATION_GRAPH.forEach((node, index) => {
+  if (!NODE_INDEX_BY_ID.has(node.id)) NODE_INDEX_BY_ID.set(node.id, index);
+  if (!NODE_BY_PHASE.has(node.phase)) NODE_BY_PHASE.set(node.phase, node);
+});
+
 /**
  * Get state node by ID
  */
 export function getStateNode(id: string): StateNode | undefined {
-  return GENERATION_GRAPH.find((node) => node.id === id);
+  const index = NODE_INDEX_BY_ID.get(id);
+  return index === undefined ? undefined : GENERATION_GRAPH[index];
+}
+
+/**
+ * Get a state node's position in GENERATION_GRAPH, or -1 if unknown
+ */
+export function getStateNodeIndex(id: string): number {
+  return NODE_INDEX_BY_ID.get(id) ?? -1;
 }
 
 /**
  * Get state node by phase
  */
 export function getStateNodeByPhase(phase: GenerationPhase): StateNode | undefined {
-  return GENERATION_GRAPH.find((node) => node.phase === phase);
+  return NODE_BY_PHASE.get(phase);
 }
 
 /**
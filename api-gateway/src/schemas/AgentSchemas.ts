@@ -215,6 +215,16 @@ const ArchivistConstraintSchema = z.object({
   reasoning: z.string().optional(),
 });
 
+/**
+ * Common LLM status variations mapped to the standard values, one lookup per
+ * character instead of three list scans.
+ */
+const CHARACTER_STATUS_ALIASES = new Map<string, "alive" | "dead" | "transformed">([
+  ...["alive", "active", "living", "healthy", "well", "present"].map((s) => [s, "alive"] as const),
+  ...["dead", "deceased", "killed", "died", "perished"].map((s) => [s, "dead"] as const),
+  ...["transformed", "changed", "mutated", "evolved", "altered"].map((s) => [s, "transformed"] as const),
+]);
+
 /**
  * Normalize character status from LLM output to valid enum value
  * Maps common variations to standard values
@@ -223,22 +233,8 @@ const normalizeCharacterStatus = (val: unknown): "alive" | "dead" | "unknown" |
   if (val === null || val === undefined) return undefined;
   if (typeof val !== "string") return undefined;
   
-  const lower = val.toLowerCase().trim();
-  
-  // Map to "alive"
-  if (["alive", "active", "living", "healthy", "well", "present"].includes(lower)) {
-    return "alive";
-  }
-  // Map to "dead"
-  if (["dead", "deceased", "killed", "died", "perished"].includes(lower)) {
-    return "dead";
-  }
-  // Map to "transformed"
-  if (["transformed", "changed", "mutated", "evolved", "altered"].includes(lower)) {
-    return "transformed";
-  }
   // Default to "unknown" for unrecognized values
-  return "unknown";
+  return CHARACTER_STATUS_ALIASES.get(val.toLowerCase().trim()) ?? "unknown";
 };
 
 /**
@@ -5,6 +5,7 @@
  * Features:
  * - Faithfulness evaluation: How well Writer output matches Architect plan
  * - Relevance evaluation: How well Profiler output matches user's seed idea
+ * - Batched variants judge several characters / scenes in one prompt
  * - Records scores in Langfuse and Prometheus metrics
  * - N=3 samples at temperature 0; median reported (issue #168)
  */
@@ -14,21 +15,25 @@ import { LangfuseService } from "./LangfuseService";
 import { LLMProviderService } from "./LLMProviderService";
 import { MetricsService } from "./MetricsService";
 import { LLMProvider, MessageRole } from "../models/LLMModels";
-import { parseEvaluationResponse as parseJudgeResponse, EvaluationResult } from "../utils/evaluationResponseParser";
+import {
+  parseEvaluationResponse,
+  parseBatchEvaluationResponse,
+  EvaluationResult,
+} from "../utils/evaluationResponseParser";
 import { median } from "../utils/median";
 
 // Re-export so existing importers of EvaluationResult from this module continue to work.
 export { EvaluationResult } from "../utils/evaluationResponseParser";
 
 // ---------------------------------------------------------------------------
-// Rubric system-prompt constants (DRY — used by sampleJudge)
+// Rubric system-prompt constants (DRY — shared by the single and batched judges)
 // ---------------------------------------------------------------------------
 
-const FAITHFULNESS_SYSTEM = `You are an expert evaluator assessing how faithfully a writer followed an architect's plan.
-You must respond with ONLY a JSON object in this exact format:
-{"score": <number 0-1>, "reasoning": "<brief explanation>"}
+const JSON_ONLY = "You must respond with ONLY a JSON object in this exact format:";
+const SINGLE_RESULT_FORMAT = `{"score": <number 0-1>, "reasoning": "<brief explanation>"}`;
+const BATCH_RESULT_FORMAT = `{"results": [{"item": <item number as given>, "score": <number 0-1>, "reasoning": "<brief explanation>"}]}`;
 
-Score guidelines:
+const FAITHFULNESS_GUIDELINES = `Score guidelines:
 - 1.0: Perfect adherence to the plan
 - 0.8-0.9: Minor deviations but captures all key elements
 - 0.6-0.7: Some elements missing or changed
@@ -36,11 +41,12 @@ Score guidelines:
 - 0.2-0.3: Major elements missing or contradicted
 - 0.0-0.1: Completely ignores the plan`;
 
-const RELEVANCE_SYSTEM = `You are an expert evaluator assessing how relevant a character profile is to the user's original story idea.
-You must respond with ONLY a JSON object in this exact format:
-{"score": <number 0-1>, "reasoning": "<brief explanation>"}
+const FAITHFULNESS_CRITERIA = `1. Are all key plot points from the plan included?
+2. Are character actions consistent with the plan?
+3. Is the tone and pacing as specified?
+4. Are any important elements missing or contradicted?`;
 
-Score guidelines:
+const RELEVANCE_GUIDELINES = `Score guidelines:
 - 1.0: Character perfectly fits the story concept
 - 0.8-0.9: Character fits well with minor adjustments possible
 - 0.6-0.7: Character is relevant but could be better aligned
@@ -48,6 +54,37 @@ Score guidelines:
 - 0.2-0.3: Character barely relates to the story idea
 - 0.0-0.1: Character is completely irrelevant`;
 
+const RELEVANCE_CRITERIA = `1. Does the character fit the genre and setting?
+2. Would this character naturally exist in this story world?
+3. Does the character's background align with the story's themes?
+4. Is the character's role appropriate for the narrative?`;
+
+const FAITHFULNESS_SYSTEM = `You are an expert evaluator assessing how faithfully a writer followed an architect's plan.
+${JSON_ONLY}
+${SINGLE_RESULT_FORMAT}
+
+${FAITHFULNESS_GUIDELINES}`;
+
+const FAITHFULNESS_BATCH_SYSTEM = `You are an expert evaluator assessing how faithfully a writer followed an architect's plan in each of several numbered scenes.
+Score every item independently against its own plan.
+${JSON_ONLY}
+${BATCH_RESULT_FORMAT}
+
+${FAITHFULNESS_GUIDELINES}`;
+
+const RELEVANCE_SYSTEM = `You are an expert evaluator assessing how relevant a character profile is to the user's original story idea.
+${JSON_ONLY}
+${SINGLE_RESULT_FORMAT}
+
+${RELEVANCE_GUIDELINES}`;
+
+const RELEVANCE_BATCH_SYSTEM = `You are an expert evaluator assessing how relevant each of several numbered character profiles is to the user's original story idea.
+Score every item independently.
+${JSON_ONLY}
+${BATCH_RESULT_FORMAT}
+
+${RELEVANCE_GUIDELINES}`;
+
 /**
  * Faithfulness evaluation input
  */
@@ -58,6 +95,15 @@ export interface FaithfulnessInput {
   sceneNumber?: number;
 }
 
+/**
+ * Batched faithfulness evaluation input: several scenes, each judged against
+ * its own plan in one prompt.
+ */
+export interface FaithfulnessBatchInput {
+  runId: string;
+  scenes: { sceneNumber: number; writerOutput: string; architectPlan: string }[];
+}
+
 /**
  * Relevance evaluation input
  */
@@ -68,6 +114,16 @@ export interface RelevanceInput {
   characterName?: string;
 }
 
+/**
+ * Batched relevance evaluation input: every character of a roster judged
+ * against the same seed idea in one prompt.
+ */
+export interface RelevanceBatchInput {
+  runId: string;
+  seedIdea: string;
+  characters: { characterName: string; profilerOutput: string }[];
+}
+
 /**
  * Evaluation configuration
  */
@@ -130,19 +186,22 @@ export class EvaluationService {
   }
 
   /**
-   * Run the judge `sampleCount` times at temperature 0 and return the median-score
-   * result. Determinism (temp 0) + median reduces single-sample noise. The judge is
-   * an OBSERVABILITY signal only — it gates nothing (issue #168).
+   * Run the judge `sampleCount` times at temperature 0 and return every sample
+   * `parse` accepted (failed or unparseable samples are dropped). Determinism
+   * (temp 0) + a median over the samples reduces single-sample noise. The judge
+   * is an OBSERVABILITY signal only — it gates nothing (issue #168).
    */
-  private async sampleJudge(
+  private async sampleJudge<T>(
     systemPrompt: string,
     userPrompt: string,
     runId: string,
-    agentName: string
-  ): Promise<EvaluationResult | null> {
-    if (!this.evaluationConfig) return null;
+    agentName: string,
+    parse: (content: string, model: string, durationMs: number) => T | null,
+    maxTokens: number = 512
+  ): Promise<T[]> {
+    if (!this.evaluationConfig) return [];
     const startTime = Date.now();
-    const results: EvaluationResult[] = [];
+    const samples: T[] = [];
 
     for (let i = 0; i < this.sampleCount; i++) {
       try {
@@ -155,30 +214,49 @@ export class EvaluationService {
             { role: MessageRole.USER, content: userPrompt },
           ],
           temperature: 0,
-          maxTokens: 512,
+          maxTokens,
           runId,
           agentName,
         });
-        const parsed = this.parseEvaluationResponse(response.content, this.evaluationConfig.model, Date.now() - startTime);
-        if (parsed) results.push(parsed);
+        const parsed = parse(response.content, this.evaluationConfig.model, Date.now() - startTime);
+        if (parsed) samples.push(parsed);
       } catch (err) {
         console.warn(`[EvaluationService] judge sample ${i + 1}/${this.sampleCount} failed: ${String(err)}`);
       }
     }
+    return samples;
+  }
 
-    if (results.length === 0) return null;
-
-    const med = median(results.map(r => r.score));
-    // Pick the sample whose score is closest to the median for its reasoning.
-    const repr = results.reduce((best, r) =>
-      Math.abs(r.score - med) < Math.abs(best.score - med) ? r : best, results[0]);
+  /**
+   * Reduce judge samples to the median score, with the reasoning of the sample
+   * closest to it. Returns null when there are no samples.
+   */
+  private medianResult(samples: EvaluationResult[], durationMs: number): EvaluationResult | null {
+    if (samples.length === 0) return null;
+    const med = median(samples.map(r => r.score));
+    const repr = samples.reduce((best, r) =>
+      Math.abs(r.score - med) < Math.abs(best.score - med) ? r : best, samples[0]);
+    return { score: med, reasoning: repr.reasoning, evaluationModel: repr.evaluationModel, durationMs };
+  }
 
-    return {
-      score: med,
-      reasoning: repr.reasoning,
-      evaluationModel: this.evaluationConfig.model,
-      durationMs: Date.now() - startTime,
-    };
+  /**
+   * Judge `itemCount` numbered items in one prompt per sample and return each
+   * item's median result in item order (null where every sample omitted it).
+   */
+  private async judgeBatch(
+    systemPrompt: string,
+    userPrompt: string,
+    runId: string,
+    agentName: string,
+    itemCount: number
+  ): Promise<(EvaluationResult | null)[]> {
+    const startTime = Date.now();
+    const samples = await this.sampleJudge(
+      systemPrompt, userPrompt, runId, agentName, parseBatchEvaluationResponse, 512 * itemCount
+    );
+    const durationMs = Date.now() - startTime;
+    return Array.from({ length: itemCount }, (_, i) =>
+      this.medianResult(samples.flatMap(sample => sample.get(i + 1) ?? []), durationMs));
   }
 
   /**
@@ -198,12 +276,42 @@ export class EvaluationService {
 
     const prompt = this.buildFaithfulnessPrompt(writerOutput, architectPlan);
 
-    const result = await this.sampleJudge(FAITHFULNESS_SYSTEM, prompt, runId, "faithfulness_evaluator");
+    const samples = await this.sampleJudge(FAITHFULNESS_SYSTEM, prompt, runId, "faithfulness_evaluator", parseEvaluationResponse);
+    const result = this.medianResult(samples, Date.now() - startTime);
+
+    this.recordFaithfulness(runId, sceneNumber, result, Date.now() - startTime);
+    return result;
+  }
+
+  /**
+   * Evaluate faithfulness for several scenes in one judge prompt per sample.
+   * The rubric is sent once per batch instead of once per scene, so B scenes
+   * cost `sampleCount` judge calls rather than B × `sampleCount`. Results come
+   * back in scene order; each is the median of that scene's per-sample scores,
+   * or null (recorded as a failed evaluation) when the judge omitted it.
+   */
+  async evaluateFaithfulnessBatch(input: FaithfulnessBatchInput): Promise<(EvaluationResult | null)[]> {
+    if (!this.evaluationConfig) {
+      console.warn("EvaluationService: Faithfulness evaluation skipped - not configured");
+      return [];
+    }
+
+    const startTime = Date.now();
+    const { runId, scenes } = input;
+    const prompt = this.buildFaithfulnessBatchPrompt(scenes);
+
+    const results = await this.judgeBatch(FAITHFULNESS_BATCH_SYSTEM, prompt, runId, "faithfulness_evaluator", scenes.length);
 
     const durationMs = Date.now() - startTime;
+    scenes.forEach(({ sceneNumber }, i) => this.recordFaithfulness(runId, sceneNumber, results[i], durationMs));
+    return results;
+  }
+
+  /** Record one faithfulness score (or a failed evaluation) in Langfuse and metrics. */
+  private recordFaithfulness(runId: string, sceneNumber: number | undefined, result: EvaluationResult | null, durationMs: number): void {
     if (!result) {
       this.metricsService.recordEvaluation("faithfulness", "writer", runId, 0, durationMs, false);
-      return null;
+      return;
     }
     this.langfuseService.scoreFaithfulness(runId, result.score, "writer", result.reasoning);
     this.langfuseService.addEvent(runId, "llm_judge_faithfulness", {
@@ -212,8 +320,7 @@ export class EvaluationService {
       evaluationModel: result.evaluationModel, durationMs: result.durationMs,
     });
     this.metricsService.recordEvaluation("faithfulness", "writer", runId, result.score, durationMs, true);
-    console.log(`[EvaluationService] Faithfulness (median of ${this.sampleCount}) for run ${runId}: ${result.score}`);
-    return result;
+    console.log(`[EvaluationService] Faithfulness (median of ${this.sampleCount}) for run ${runId}${sceneNumber !== undefined ? `, scene ${sceneNumber}` : ""}: ${result.score}`);
   }
 
   /**
@@ -233,12 +340,44 @@ export class EvaluationService {
 
     const prompt = this.buildRelevancePrompt(profilerOutput, seedIdea);
 
-    const result = await this.sampleJudge(RELEVANCE_SYSTEM, prompt, runId, "relevance_evaluator");
+    const samples = await this.sampleJudge(RELEVANCE_SYSTEM, prompt, runId, "relevance_evaluator", parseEvaluationResponse);
+    const result = this.medianResult(samples, Date.now() - startTime);
+
+    this.recordRelevance(runId, characterName, result, Date.now() - startTime);
+    return result;
+  }
+
+  /**
+   * Evaluate relevance for a whole roster in one judge prompt per sample.
+   * The seed idea and rubric are sent once instead of once per character, so
+   * a cast of N costs `sampleCount` judge calls rather than N × `sampleCount`.
+   * Results come back in roster order (characters are numbered in the prompt,
+   * so duplicate names stay distinct); each is the median of that character's
+   * per-sample scores, or null (recorded as a failed evaluation) when the judge
+   * omitted it.
+   */
+  async evaluateRelevanceBatch(input: RelevanceBatchInput): Promise<(EvaluationResult | null)[]> {
+    if (!this.evaluationConfig) {
+      console.warn("EvaluationService: Relevance evaluation skipped - not configured");
+      return [];
+    }
+
+    const startTime = Date.now();
+    const { runId, seedIdea, characters } = input;
+    const prompt = this.buildRelevanceBatchPrompt(characters, seedIdea);
+
+    const results = await this.judgeBatch(RELEVANCE_BATCH_SYSTEM, prompt, runId, "relevance_evaluator", characters.length);
 
     const durationMs = Date.now() - startTime;
+    characters.forEach(({ characterName }, i) => this.recordRelevance(runId, characterName, results[i], durationMs));
+    return results;
+  }
+
+  /** Record one relevance score (or a failed evaluation) in Langfuse and metrics. */
+  private recordRelevance(runId: string, characterName: string | undefined, result: EvaluationResult | null, durationMs: number): void {
     if (!result) {
       this.metricsService.recordEvaluation("relevance", "profiler", runId, 0, durationMs, false);
-      return null;
+      return;
     }
     this.langfuseService.scoreRelevance(runId, result.score, "profiler", result.reasoning);
     this.langfuseService.addEvent(runId, "llm_judge_relevance", {
@@ -248,7 +387,6 @@ export class EvaluationService {
     });
     this.metricsService.recordEvaluation("relevance", "profiler", runId, result.score, durationMs, true);
     console.log(`[EvaluationService] Relevance (median of ${this.sampleCount}) for run ${runId}: ${result.score}`);
-    return result;
   }
 
   /**
@@ -262,10 +400,19 @@ ${architectPlan}
 ${writerOutput}
 
 Evaluate how faithfully the writer followed the architect's plan. Consider:
-1. Are all key plot points from the plan included?
-2. Are character actions consistent with the plan?
-3. Is the tone and pacing as specified?
-4. Are any important elements missing or contradicted?`;
+${FAITHFULNESS_CRITERIA}`;
+  }
+
+  /**
+   * Build batched faithfulness evaluation prompt (each numbered scene's plan, then its output)
+   */
+  private buildFaithfulnessBatchPrompt(scenes: FaithfulnessBatchInput["scenes"]): string {
+    let sections = "";
+    scenes.forEach(({ sceneNumber, writerOutput, architectPlan }, i) => {
+      sections += `## Item ${i + 1}: Scene ${sceneNumber}\n\n### Architect's Plan\n${architectPlan}\n\n### Writer's Output\n${writerOutput}\n\n`;
+    });
+    return `${sections}Evaluate how faithfully the writer followed the architect's plan in each item. Consider:
+${FAITHFULNESS_CRITERIA}`;
   }
 
   /**
@@ -279,17 +426,24 @@ ${seedIdea}
 ${profilerOutput}
 
 Evaluate how relevant this character profile is to the user's story idea. Consider:
-1. Does the character fit the genre and setting?
-2. Would this character naturally exist in this story world?
-3. Does the character's background align with the story's themes?
-4. Is the character's role appropriate for the narrative?`;
+${RELEVANCE_CRITERIA}`;
   }
 
   /**
-   * Parse LLM evaluation response
-   * Returns null if parsing fails to distinguish from actual scores
+   * Build batched relevance evaluation prompt (seed idea once, then each numbered profile)
    */
-  private parseEvaluationResponse(content: string, model: string, durationMs: number): EvaluationResult | null {
-    return parseJudgeResponse(content, model, durationMs);
+  private buildRelevanceBatchPrompt(
+    characters: { characterName: string; profilerOutput: string }[],
+    seedIdea: string
+  ): string {
+    let profiles = "";
+    characters.forEach(({ characterName, profilerOutput }, i) => {
+      profiles += `\n\n## Item ${i + 1}: ${characterName}\n${profilerOutput}`;
+    });
+    return `## User's Story Idea
+${seedIdea}${profiles}
+
+Evaluate how relevant each item's character profile is to the user's story idea. Consider:
+${RELEVANCE_CRITERIA}`;
   }
 }
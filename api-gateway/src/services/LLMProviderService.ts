@@ -235,6 +235,11 @@ const MODEL_MAX_OUTPUT_TOKENS: Record<string, number> = {
   "default": 4096,
 };
 
+// Prefix tables for dated/suffixed model ids, in declaration order (first
+// match wins), built once instead of via Object.entries on every call.
+const CONTEXT_LENGTH_PREFIXES = Object.entries(MODEL_CONTEXT_LENGTHS).filter(([key]) => key !== "default");
+const MAX_OUTPUT_TOKENS_PREFIXES = Object.entries(MODEL_MAX_OUTPUT_TOKENS).filter(([key]) => key !== "default");
+
 /**
  * Get the context length for a model, with fallback to default
  */
@@ -244,8 +249,8 @@ function getModelContextLength(model: string): number {
     return MODEL_CONTEXT_LENGTHS[model];
   }
   // Check for prefix matches (e.g., "gpt-4o-2024-05-13" matches "gpt-4o")
-  for (const [key, value] of Object.entries(MODEL_CONTEXT_LENGTHS)) {
-    if (key !== "default" && model.startsWith(key)) {
+  for (const [key, value] of CONTEXT_LENGTH_PREFIXES) {
+    if (model.startsWith(key)) {
       return value;
     }
   }
@@ -265,8 +270,8 @@ function getModelMaxOutputTokens(model: string): number {
     return MODEL_MAX_OUTPUT_TOKENS[normalizedModel];
   }
   // Check for prefix matches (e.g., "claude-3-5-haiku-20241022" matches "claude-3-5-haiku")
-  for (const [key, value] of Object.entries(MODEL_MAX_OUTPUT_TOKENS)) {
-    if (key !== "default" && normalizedModel.startsWith(key)) {
+  for (const [key, value] of MAX_OUTPUT_TOKENS_PREFIXES) {
+    if (normalizedModel.startsWith(key)) {
       return value;
     }
   }
@@ -468,6 +473,29 @@ export class LLMProviderService {
   @Inject()
   private metricsService: MetricsService;
 
+  /**
+   * SDK clients reused across calls, keyed by provider + API key. Building a
+   * new client per completion discarded its keep-alive connection pool, so
+   * every LLM call paid a fresh TCP+TLS handshake. Bounded so BYOK traffic
+   * with many distinct keys cannot grow the map without limit.
+   */
+  private clients: Map<string, unknown> = new Map();
+  private static readonly MAX_CACHED_CLIENTS = 32;
+
+  private cachedClient<T>(provider: LLMProvider, apiKey: string, create: () => T): T {
+    const key = `${provider}:${apiKey}`;
+    const existing = this.clients.get(key);
+    if (existing) return existing as T;
+    if (this.clients.size >= LLMProviderService.MAX_CACHED_CLIENTS) {
+      // Evict the oldest entry (Map preserves insertion order).
+      const oldest = this.clients.keys().next().value;
+      if (oldest !== undefined) this.clients.delete(oldest);
+    }
+    const client = create();
+    this.clients.set(key, client);
+    return client;
+  }
+
   /**
    * Create a chat completion using the specified provider
    * 
@@ -594,7 +622,9 @@ export class LLMProviderService {
 
   /** Seam for tests: build the OpenAI client. */
   private makeOpenAIClient(apiKey: string): OpenAI {
-    return new OpenAI({ apiKey, baseURL: PROVIDER_BASE_URLS.openai, timeout: 120000 });
+    return this.cachedClient(LLMProvider.OPENAI, apiKey, () =>
+      new OpenAI({ apiKey, baseURL: PROVIDER_BASE_URLS.openai, timeout: 120000 })
+    );
   }
 
   /**
@@ -678,7 +708,9 @@ export class LLMProviderService {
 
   /** Seam for tests: build the Anthropic client. */
   private makeAnthropicClient(apiKey: string): Anthropic {
-    return new Anthropic({ apiKey, timeout: 120000 });
+    return this.cachedClient(LLMProvider.ANTHROPIC, apiKey, () =>
+      new Anthropic({ apiKey, timeout: 120000 })
+    );
   }
 
   /**
@@ -773,7 +805,7 @@ export class LLMProviderService {
    */
   private async geminiCompletion(options: CompletionOptions): Promise<LLMResponse> {
     const apiKey = this.getApiKey(LLMProvider.GEMINI, options.apiKey);
-    const genAI = new GoogleGenerativeAI(apiKey);
+    const genAI = this.cachedClient(LLMProvider.GEMINI, apiKey, () => new GoogleGenerativeAI(apiKey));
     const model = genAI.getGenerativeModel({ model: options.model });
 
     // Build prompt from messages
@@ -884,7 +916,7 @@ export class LLMProviderService {
    */
   private async openRouterCompletion(options: CompletionOptions): Promise<LLMResponse> {
     const apiKey = this.getApiKey(LLMProvider.OPENROUTER, options.apiKey);
-    const client = new OpenAI({
+    const client = this.cachedClient(LLMProvider.OPENROUTER, apiKey, () => new OpenAI({
       apiKey,
       baseURL: PROVIDER_BASE_URLS.openrouter,
       timeout: 120000, // 2 minute timeout
@@ -892,7 +924,7 @@ export class LLMProviderService {
         "HTTP-Referer": "https://manoe.iliashalkin.com",
         "X-Title": "MANOE",
       },
-    });
+    }));
 
     const requestParams: OpenAI.ChatCompletionCreateParams = {
       model: options.model,
@@ -936,11 +968,11 @@ export class LLMProviderService {
    */
   private async deepSeekCompletion(options: CompletionOptions): Promise<LLMResponse> {
     const apiKey = this.getApiKey(LLMProvider.DEEPSEEK, options.apiKey);
-    const client = new OpenAI({
+    const client = this.cachedClient(LLMProvider.DEEPSEEK, apiKey, () => new OpenAI({
       apiKey,
       baseURL: PROVIDER_BASE_URLS.deepseek,
       timeout: 120000, // 2 minute timeout
-    });
+    }));
 
     const requestParams: OpenAI.ChatCompletionCreateParams = {
       model: options.model,
@@ -984,11 +1016,11 @@ export class LLMProviderService {
    */
   private async veniceCompletion(options: CompletionOptions): Promise<LLMResponse> {
     const apiKey = this.getApiKey(LLMProvider.VENICE, options.apiKey);
-    const client = new OpenAI({
+    const client = this.cachedClient(LLMProvider.VENICE, apiKey, () => new OpenAI({
       apiKey,
       baseURL: PROVIDER_BASE_URLS.venice,
       timeout: 120000, // 2 minute timeout
-    });
+    }));
 
     const requestParams: OpenAI.ChatCompletionCreateParams = {
       model: options.model,
@@ -13,6 +13,7 @@
 import { Service } from "@tsed/di";
 import { Langfuse } from "langfuse";
 import { LLMProvider, LLMResponse, GenerationPhase } from "../models/LLMModels";
+import { renderTemplate } from "../utils/promptTemplate";
 
 /**
  * Trace metadata
@@ -674,14 +675,7 @@ export class LangfuseService {
     template: string,
     variables: Record<string, string>
   ): string {
-    let compiled = template;
-
-    for (const [key, value] of Object.entries(variables)) {
-      const placeholder = new RegExp(`\\{\\{\\s*${key}\\s*\\}\\}`, "g");
-      compiled = compiled.replace(placeholder, value);
-    }
-
-    return compiled;
+    return renderTemplate(template, variables);
   }
 
   /**
@@ -691,7 +685,8 @@ export class LangfuseService {
    * 
    * @param promptName - Name of the prompt in Langfuse
    * @param variables - Variables to substitute
-   * @param options - Fetch options and fallback
+   * @param options - Fetch options and fallback (a string, or a function that
+   *   builds it lazily only when the Langfuse template is unavailable)
    * @returns Compiled prompt string
    * 
    * @example
@@ -704,15 +699,18 @@ export class LangfuseService {
   async getCompiledPrompt(
     promptName: string,
     variables: Record<string, string>,
-    options: PromptFetchOptions & { fallback?: string } = {}
+    options: PromptFetchOptions & { fallback?: string | (() => string) } = {}
   ): Promise<string> {
     const { fallback, ...fetchOptions } = options;
     const template = await this.getPrompt(promptName, fetchOptions);
 
     if (!template) {
-      if (fallback) {
+      // A function fallback is only built when actually needed — most calls hit
+      // the Langfuse template and never use it.
+      const fallbackText = typeof fallback === "function" ? fallback() : fallback;
+      if (fallbackText) {
         console.warn(`Langfuse: Using fallback for prompt "${promptName}"`);
-        return this.compilePrompt(fallback, variables);
+        return this.compilePrompt(fallbackText, variables);
       }
       throw new Error(`Prompt "${promptName}" not found and no fallback provided`);
     }
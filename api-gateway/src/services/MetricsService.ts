@@ -82,6 +82,9 @@ const MODEL_PRICING: Record<string, { input: number; output: number }> = {
   "default": { input: 0.001, output: 0.002 },
 };
 
+/** Pricing keys longest-first, so "gpt-4o-mini" is tried before "gpt-4o". Sorted once. */
+const PRICED_MODELS_LONGEST_FIRST = Object.keys(MODEL_PRICING).sort((a, b) => b.length - a.length);
+
 /**
  * Agent execution result for metrics
  */
@@ -468,8 +471,7 @@ export class MetricsService {
     }
     
     // Check prefix matches, longest first to avoid matching "gpt-4o" before "gpt-4o-mini"
-    const sortedModels = Object.keys(MODEL_PRICING).sort((a, b) => b.length - a.length);
-    for (const knownModel of sortedModels) {
+    for (const knownModel of PRICED_MODELS_LONGEST_FIRST) {
       if (withoutDate.startsWith(knownModel)) {
         return knownModel;
       }
@@ -13,7 +13,7 @@ import { Service, Inject } from "@tsed/di";
 import { QdrantClient } from "@qdrant/js-client-rest";
 import OpenAI from "openai";
 import { GoogleGenerativeAI } from "@google/generative-ai";
-import { randomUUID } from "crypto";
+import { randomUUID, createHash } from "crypto";
 import { stringifyForPrompt } from "../utils/schemaNormalizers";
 import { MetricsService } from "./MetricsService";
 
@@ -94,6 +94,10 @@ export class QdrantMemoryService {
   private currentGeminiKey?: string;
   private currentOpenaiKey?: string;
 
+  // Recent search-query embeddings, keyed by query text (see embedQuery)
+  private static readonly QUERY_EMBEDDING_CACHE_SIZE = 8;
+  private queryEmbeddings = new Map<string, Promise<number[]>>();
+
   @Inject()
   private metricsService!: MetricsService;
 
@@ -139,6 +143,8 @@ export class QdrantMemoryService {
     // Update tracked keys
     this.currentGeminiKey = geminiApiKey;
     this.currentOpenaiKey = openaiApiKey;
+    // Cached query vectors belong to the previous provider/dimension
+    this.queryEmbeddings.clear();
 
     const qdrantUrl = process.env.QDRANT_URL || "http://localhost:6333";
     const qdrantApiKey = process.env.QDRANT_API_KEY;
@@ -289,6 +295,21 @@ export class QdrantMemoryService {
     return embedding;
   }
 
+  /**
+   * Deterministic point ID for a project's scene.
+   *
+   * Qdrant point IDs must be UUIDs (or integers), so the SHA-1 of
+   * `projectId:scene:N` is laid out as a name-based (v5-style) UUID. The same
+   * scene always maps to the same point: re-drafts, revisions, regenerations
+   * and consistency repairs upsert in place instead of piling up duplicate
+   * scene vectors that crowd out continuity search results.
+   */
+  static scenePointId(projectId: string, sceneNumber: number): string {
+    const hex = createHash("sha1").update(`${projectId}:scene:${sceneNumber}`).digest("hex");
+    const variant = ((parseInt(hex[16], 16) & 0x3) | 0x8).toString(16);
+    return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-5${hex.slice(13, 16)}-${variant}${hex.slice(17, 20)}-${hex.slice(20, 32)}`;
+  }
+
   /**
    * Generate embedding for text
    */
@@ -340,6 +361,28 @@ export class QdrantMemoryService {
     }
   }
 
+  /**
+   * Embedding for a search query. A scene's context retrieval runs the
+   * character, worldbuilding and scene searches with the same query text, so
+   * they share one embedding call (including one still in flight) instead of
+   * embedding it three times. A failed embedding is evicted, not cached.
+   */
+  private embedQuery(query: string): Promise<number[]> {
+    let embedding = this.queryEmbeddings.get(query);
+    if (embedding) return embedding;
+
+    embedding = this.generateEmbedding(query);
+    if (this.queryEmbeddings.size >= QdrantMemoryService.QUERY_EMBEDDING_CACHE_SIZE) {
+      this.queryEmbeddings.delete(this.queryEmbeddings.keys().next().value as string);
+    }
+    this.queryEmbeddings.set(query, embedding);
+    const pending = embedding;
+    pending.catch(() => {
+      if (this.queryEmbeddings.get(query) === pending) this.queryEmbeddings.delete(query);
+    });
+    return embedding;
+  }
+
   /**
    * Store a character in Qdrant
    */
@@ -424,7 +467,7 @@ export class QdrantMemoryService {
     if (!this.client) return [];
 
     const startTime = Date.now();
-    const queryEmbedding = await this.generateEmbedding(query);
+    const queryEmbedding = await this.embedQuery(query);
 
     try {
       const results = await this.client.search(this.collectionCharacters, {
@@ -623,7 +666,7 @@ export class QdrantMemoryService {
     if (!this.client) return [];
 
     const startTime = Date.now();
-    const queryEmbedding = await this.generateEmbedding(query);
+    const queryEmbedding = await this.embedQuery(query);
 
     try {
       const results = await this.client.search(this.collectionWorldbuilding, {
@@ -672,7 +715,7 @@ export class QdrantMemoryService {
     const sceneText = this.sceneToText(scene);
     const embedding = await this.generateEmbedding(sceneText);
 
-    const pointId = randomUUID();
+    const pointId = QdrantMemoryService.scenePointId(projectId, sceneNumber);
     const payload: ScenePayload = {
       projectId,
       sceneNumber,
@@ -723,7 +766,7 @@ export class QdrantMemoryService {
     if (!this.client) return [];
 
     const startTime = Date.now();
-    const queryEmbedding = await this.generateEmbedding(query);
+    const queryEmbedding = await this.embedQuery(query);
 
     try {
       const results = await this.client.search(this.collectionScenes, {
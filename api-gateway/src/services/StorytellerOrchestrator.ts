@@ -43,7 +43,7 @@ import { AgentContext, SpiceConfig } from "../agents/types";
 import { safeParseWordCount } from "../utils/schemaNormalizers";
 import { createRunConfig, recordPhase, RunConfigArtifact } from "../utils/runConfig";
 import { ArchivistAgent } from "../agents/ArchivistAgent";
-import { EvaluationService } from "./EvaluationService";
+import { EvaluationService, FaithfulnessBatchInput } from "./EvaluationService";
 import { WorldBibleEmbeddingService } from "./WorldBibleEmbeddingService";
 import { assembleSceneContract } from "./StoryStateAssembler";
 import { applySpiceExtraction } from "./spiceParser";
@@ -53,6 +53,85 @@ import { extractStringValue as extractStringValueHelper } from "../utils/extract
 import { addSeedConstraints as addSeedConstraintsHelper } from "../utils/seedConstraints";
 import { wordCount } from "../utils/wordCount";
 import { shouldUseBeatsMethod, calculateBeatsParts, BEATS_THRESHOLD } from "../utils/beatsPlanning";
+import { canSkipRevision } from "../utils/revisionGate";
+import { renderTemplate } from "../utils/promptTemplate";
+import { fitToBudget } from "../utils/fitToBudget";
+import { characterNameVariants } from "../utils/characterIndex";
+import { stringifyCached } from "../utils/stringifyCache";
+import { runPhaseGraph, PhaseNode } from "../utils/phaseGraph";
+
+// Patterns that capture meaningful character actions (matchAll clones each
+// regex, so sharing the global-flag instances across calls is safe).
+const FACT_PATTERNS: readonly RegExp[] = [
+  // Character speech (most reliable - "Elena said", "Marcus whispered")
+  /([A-Z][a-z]+) (said|asked|replied|answered|whispered|shouted|muttered|spoke|exclaimed|demanded|insisted)/g,
+  // Character movement (location changes)
+  /([A-Z][a-z]+) (walked|ran|moved|entered|left|arrived|departed|stepped|approached|retreated)/g,
+  // Character discoveries/realizations
+  /([A-Z][a-z]+) (discovered|found|learned|realized|understood|noticed|recognized|remembered)/g,
+  // Character emotions/reactions
+  /([A-Z][a-z]+) (smiled|frowned|laughed|cried|sighed|nodded|shook|gasped|trembled|froze)/g,
+  // Character state changes (significant events)
+  /([A-Z][a-z]+) (died|killed|married|betrayed|escaped|collapsed|awakened|transformed|vanished)/g,
+];
+
+// Raw-fact category by (lower-cased) action; anything unlisted is 'plot'.
+const FACT_ACTION_CATEGORY: ReadonlyMap<string, 'char' | 'world' | 'plot'> = new Map<string, 'char' | 'world' | 'plot'>([
+  ...['smiled', 'frowned', 'laughed', 'cried', 'sighed', 'nodded', 'shook', 'gasped', 'trembled', 'froze']
+    .map((a) => [a, 'char'] as const),
+  ...['walked', 'ran', 'moved', 'entered', 'left', 'arrived', 'departed', 'stepped', 'approached', 'retreated']
+    .map((a) => [a, 'world'] as const),
+]);
+
+// Meta-commentary a model leaves when it truncates a polish pass instead of
+// returning the full scene. No global flag, so .test() keeps no state and the
+// shared instances are safe across calls.
+const LAZY_POLISH_PATTERNS: readonly RegExp[] = [
+  /\(note:\s*(?:the\s+)?(?:full\s+)?(?:polished\s+)?(?:scene\s+)?continues/i,
+  /\(note:\s*(?:the\s+)?rest\s+(?:is\s+)?(?:the\s+)?same/i,
+  /continues\s+with\s+(?:the\s+)?(?:exact\s+)?same\s+content/i,
+  /rest\s+(?:of\s+the\s+scene\s+)?(?:is\s+)?(?:the\s+)?same/i,
+  /\[\.\.\.(?:rest|remainder|continues)/i,
+  /i\s+won'?t\s+repeat/i,
+  /maintaining\s+the\s+[\d,]+[\s-]*word\s+count/i,
+  /as\s+(?:the\s+)?original\s+draft/i,
+];
+
+// Built-in system prompts used when Langfuse is disabled or unreachable. The
+// text is invariant, so the table is built once at module load instead of on
+// every prompt lookup.
+const FALLBACK_AGENT_PROMPTS: Record<AgentType, string> = {
+  [AgentType.ARCHITECT]: `You are the Architect, a master storyteller who designs narrative structures.
+Your role is to create compelling story frameworks with clear themes, arcs, and emotional journeys.
+{{seedIdea}}`,
+  [AgentType.PROFILER]: `You are the Profiler, an expert in character psychology and development.
+Your role is to create deep, nuanced characters with authentic motivations and arcs.
+Narrative context: {{narrative}}`,
+  [AgentType.WORLDBUILDER]: `You are the Worldbuilder, a creator of immersive settings and worlds.
+Your role is to develop rich, consistent worlds that enhance the narrative.
+Narrative: {{narrative}}
+Characters: {{characters}}`,
+  [AgentType.STRATEGIST]: `You are the Strategist, a master of narrative pacing and scene structure.
+Your role is to plan scenes that maximize dramatic impact and reader engagement.
+Narrative: {{narrative}}
+Characters: {{characters}}
+World: {{worldbuilding}}`,
+  [AgentType.WRITER]: `You are the Writer, a skilled prose craftsman.
+Your role is to transform outlines into vivid, engaging prose that brings the story to life.
+Maintain consistency with established facts.
+Key Constraints: {{keyConstraints}}`,
+  [AgentType.CRITIC]: `You are the Critic, an expert literary evaluator.
+Your role is to assess prose quality and provide constructive feedback for improvement.
+Check for constraint violations.
+Key Constraints: {{keyConstraints}}`,
+  [AgentType.ORIGINALITY]: `You are the Originality Checker, a detector of cliches and tropes.
+Your role is to identify overused elements and suggest unique alternatives.`,
+  [AgentType.IMPACT]: `You are the Impact Assessor, an expert in emotional resonance.
+Your role is to evaluate how effectively the prose engages readers emotionally.`,
+  [AgentType.ARCHIVIST]: `You are the Archivist, the keeper of story continuity.
+Your role is to track key facts and constraints, resolving conflicts to maintain consistency.
+Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp → DISCARD irrelevant → GENERATE updated list.`,
+};
 
 /**
  * LLM Configuration for generation
@@ -139,6 +218,19 @@ interface SceneDraft {
 @Service()
 export class StorytellerOrchestrator {
   private static readonly APPROVAL_THRESHOLD = 7;
+  // Opt-in fast approval (FAST_APPROVAL_ENABLED=true): a revision of a draft the
+  // Critic already scored at least this high is accepted without re-critique.
+  // Drafts at REVISION_SKIP_SCORE (8.5) and up are accepted before any revision,
+  // so a higher bar here could never fire. The Critic reports no originality
+  // score, so the critique score (with its hard-failure checks) is the signal.
+  private static readonly FAST_APPROVAL_SCORE = 8;
+  // Upper bound on state.messages. Each entry holds a full LLM response and the
+  // list is serialized into every scene checkpoint, so an unbounded log grows
+  // memory and checkpoint size with run length. Oldest entries are dropped.
+  private static readonly MAX_STATE_MESSAGES = 200;
+  // Character budget (~400 tokens at 4 chars/token) shared by all entries of
+  // the Qdrant context block injected into Writer prompts.
+  private static readonly RETRIEVED_CONTEXT_BUDGET = 1600;
 
   private activeRuns: Map<string, GenerationState> = new Map();
   private pauseCallbacks: Map<string, () => boolean> = new Map();
@@ -148,6 +240,40 @@ export class StorytellerOrchestrator {
   // This ensures consistent rate limiting across relevance and faithfulness evaluations
   private evaluationRateLimiter = createRateLimiter(3);
 
+  // Scene faithfulness checks waiting to be judged together
+  // (EVALUATION_BATCH_FAITHFULNESS=true), keyed by run, then by scene.
+  private pendingFaithfulness: Map<string, Map<number, FaithfulnessBatchInput["scenes"][number]>> = new Map();
+  private static readonly FAITHFULNESS_BATCH_SIZE = 4;
+
+  // Fire-and-forget work (evaluations) that has not settled yet. Tracked so
+  // gracefulShutdown can drain it instead of letting the process exit drop it.
+  private backgroundTasks: Set<Promise<unknown>> = new Set();
+
+  // Tail of each run's pending event publishes (EVENTS_ASYNC_PUBLISH=true).
+  private eventQueues: Map<string, Promise<void>> = new Map();
+
+  // Artifacts waiting for the next batched write (ARTIFACTS_BATCHED_SAVE=true),
+  // keyed by type (and explicit phase) so a rewrite before the flush replaces
+  // the earlier content.
+  private artifactBuffers: Map<string, {
+    projectId: string;
+    artifacts: Map<string, { artifactType: string; phase?: string; content: unknown }>;
+    timer?: NodeJS.Timeout;
+  }> = new Map();
+  // Tail of each run's queued writes (artifact batches, background
+  // checkpoints), so they land in order.
+  private artifactFlushes: Map<string, Promise<void>> = new Map();
+  private static readonly ARTIFACT_BATCH_SIZE = 32;
+  private static readonly ARTIFACT_FLUSH_MS = 250;
+
+  // With PARALLEL_KEPT_SCENE_SUMMARIES=true, at most this many kept-scene
+  // synopsis summaries of a scene-level regeneration run at once.
+  private static readonly MAX_PARALLEL_KEPT_SUMMARIES = 3;
+  // A scene-level regeneration reads kept scenes' prior prose this many scenes
+  // ahead of the drafting loop, so reads overlap drafting without holding the
+  // whole previous run in memory.
+  private static readonly PRIOR_SCENE_PREFETCH_WINDOW = 3;
+
   @Inject()
   private llmProvider: LLMProviderService;
 
@@ -232,10 +358,13 @@ export class StorytellerOrchestrator {
     void this.mirrorStatus(runId); // #157 Slice A: mirror initial state
     $log.info(`[StorytellerOrchestrator] startGeneration: state initialized and stored, runId: ${runId}`);
 
-    // Wire the per-call metadata sink onto all agent singletons (#162).
-    // Agents are cached singletons; the sink uses runId to look up the correct state.
+    // Wire the per-call metadata sink onto all agent singletons (#162), and route
+    // their events through publishEvent so they share the run's publish queue.
+    // Agents are cached singletons; the sinks use runId to look up the correct state.
     for (const agentType of Object.values(AgentType)) {
-      this.agentFactory.getAgent(agentType).onLLMCall = this.recordLLMMeta.bind(this);
+      const agent = this.agentFactory.getAgent(agentType);
+      agent.onLLMCall = this.recordLLMMeta.bind(this);
+      agent.onPublishEvent = this.publishEvent.bind(this);
     }
 
     // Embedding API Key Resolution (in priority order):
@@ -342,46 +471,60 @@ export class StorytellerOrchestrator {
       }
 
       // Phase 2: Characters
-      if (startIdx <= 1) {
+      const stopAfterCharacters = await this.runChainPhase(runId, state, 1, startIdx, async () => {
         $log.info(`[StorytellerOrchestrator] runGeneration: about to call runCharactersPhase, runId: ${runId}`);
-        state.inFlight = true;
         await this.runCharactersPhase(runId, options);
-        state.inFlight = false; // safe checkpoint
         $log.info(`[StorytellerOrchestrator] runGeneration: runCharactersPhase completed, runId: ${runId}`);
-      }
-      if (this.shouldStop(runId)) return;
-
-      // Phase 2.5: Narrator design (voice/POV) — depends on characters + narrative.
-      if (startIdx <= 2) {
-        state.inFlight = true;
-        await this.runNarratorDesignPhase(runId, options);
-        state.inFlight = false; // safe checkpoint
-      }
-      if (this.shouldStop(runId)) return;
+      });
+      if (stopAfterCharacters) return;
+
+      if (this.isParallelPlanningEnabled()) {
+        // Phases 2.5-5 as a dependency graph. Narrator design reads only the
+        // narrative and characters and only drafting reads the voice it sets,
+        // so it overlaps the worldbuilding -> outlining -> advanced planning
+        // chain instead of holding it up. Phases before startIdx were seeded
+        // from the previous run and count as already done. The run is in
+        // flight while any phase is mid agent work and safe once none is.
+        let phasesInFlight = 0;
+        const chainPhase = (id: GenerationPhase, phaseIndex: number, deps: GenerationPhase[], run: () => Promise<void>): PhaseNode => {
+          if (startIdx > phaseIndex) return { id, deps, run: async () => {} };
+          return {
+            id,
+            deps,
+            run: async () => {
+              phasesInFlight++;
+              state.inFlight = true;
+              try {
+                await run();
+              } finally {
+                if (--phasesInFlight === 0) state.inFlight = false; // safe checkpoint
+              }
+            },
+          };
+        };
+        await runPhaseGraph(
+          [
+            chainPhase(GenerationPhase.NARRATOR_DESIGN, 2, [], () => this.runNarratorDesignPhase(runId, options)),
+            chainPhase(GenerationPhase.WORLDBUILDING, 3, [], () => this.runWorldbuildingPhase(runId, options)),
+            chainPhase(GenerationPhase.OUTLINING, 4, [GenerationPhase.WORLDBUILDING], () => this.runOutliningPhase(runId, options)),
+            chainPhase(GenerationPhase.ADVANCED_PLANNING, 5, [GenerationPhase.OUTLINING], () => this.runAdvancedPlanningPhase(runId, options)),
+          ],
+          () => this.shouldStop(runId)
+        );
+        if (this.shouldStop(runId)) return;
+      } else {
+        // Phase 2.5: Narrator design (voice/POV) — depends on characters + narrative.
+        if (await this.runChainPhase(runId, state, 2, startIdx, () => this.runNarratorDesignPhase(runId, options))) return;
 
-      // Phase 3: Worldbuilding
-      if (startIdx <= 3) {
-        state.inFlight = true;
-        await this.runWorldbuildingPhase(runId, options);
-        state.inFlight = false; // safe checkpoint
-      }
-      if (this.shouldStop(runId)) return;
+        // Phase 3: Worldbuilding
+        if (await this.runChainPhase(runId, state, 3, startIdx, () => this.runWorldbuildingPhase(runId, options))) return;
 
-      // Phase 4: Outlining
-      if (startIdx <= 4) {
-        state.inFlight = true;
-        await this.runOutliningPhase(runId, options);
-        state.inFlight = false; // safe checkpoint
-      }
-      if (this.shouldStop(runId)) return;
+        // Phase 4: Outlining
+        if (await this.runChainPhase(runId, state, 4, startIdx, () => this.runOutliningPhase(runId, options))) return;
 
-      // Phase 5: Advanced Planning (optional)
-      if (startIdx <= 5) {
-        state.inFlight = true;
-        await this.runAdvancedPlanningPhase(runId, options);
-        state.inFlight = false; // safe checkpoint
+        // Phase 5: Advanced Planning (optional)
+        if (await this.runChainPhase(runId, state, 5, startIdx, () => this.runAdvancedPlanningPhase(runId, options))) return;
       }
-      if (this.shouldStop(runId)) return;
 
       // Phase 6-9: Drafting → Critique → Revision → Polish (per scene).
       // runDraftingLoop manages its own per-scene inFlight checkpoints.
@@ -393,6 +536,7 @@ export class StorytellerOrchestrator {
 
       // Persist the run_config reproducibility artifact (#162).
       await this.persistRunConfig(runId);
+      await this.flushArtifacts(runId);
 
       // Mark as completed
       state.isCompleted = true;
@@ -417,6 +561,10 @@ export class StorytellerOrchestrator {
         // The loop has unwound — this run is no longer mid agent/LLM call.
         finalState.inFlight = false;
       }
+      // Early exits (pause, cancel, error) still land their buffered artifacts
+      // and judge the scenes whose faithfulness checks are still queued.
+      this.flushFaithfulnessEvaluations(runId);
+      await this.flushArtifacts(runId);
       // Deferred cleanup for cooperatively-cancelled runs. cancelRun() leaves
       // the cancelled state in activeRuns so in-flight code reads a coherent
       // (cancelled) state and getRunStatus() stays meaningful; once the loop has
@@ -427,6 +575,27 @@ export class StorytellerOrchestrator {
     }
   }
 
+  /**
+   * Run one PHASE_CHAIN phase unless start_from_phase placed it before the
+   * start index (it was seeded from the previous run instead). The run is
+   * marked in-flight for the phase's agent work and cleared at the checkpoint
+   * after it. Returns whether the run should stop there.
+   */
+  private async runChainPhase(
+    runId: string,
+    state: GenerationState,
+    phaseIndex: number,
+    startIdx: number,
+    run: () => Promise<void>
+  ): Promise<boolean> {
+    if (startIdx <= phaseIndex) {
+      state.inFlight = true;
+      await run();
+      state.inFlight = false; // safe checkpoint
+    }
+    return this.shouldStop(runId);
+  }
+
   /**
    * Genesis Phase - Initial story concept
    */
@@ -635,23 +804,44 @@ export class StorytellerOrchestrator {
     // Uses rate limiting (max 3 concurrent) to avoid hitting LLM provider rate limits
     if (this.isEvaluationEnabled()) {
       try {
-        if (Array.isArray(state.characters)) {
+        if (Array.isArray(state.characters) && state.characters.length > 1 && this.isBatchRelevanceEnabled()) {
+          // One judge prompt per sample for the whole cast: the seed idea and rubric
+          // are sent once instead of once per character.
+          const characters = state.characters.map((character) => ({
+            characterName: String(character.name || "Unknown"),
+            profilerOutput: stringifyCached(character),
+          }));
+          this.trackBackground(
+            this.evaluationRateLimiter(() =>
+              this.evaluationService.evaluateRelevanceBatch({
+                runId,
+                seedIdea: options.seedIdea,
+                characters,
+              })
+            ).catch((err) => {
+              $log.warn(`[StorytellerOrchestrator] Batched relevance evaluation failed: ${err.message}`);
+            })
+          );
+          $log.info(`[StorytellerOrchestrator] runCharactersPhase: triggered batched relevance evaluation for ${characters.length} characters, runId: ${runId}`);
+        } else if (Array.isArray(state.characters)) {
           for (const character of state.characters) {
             const characterName = String(character.name || "Unknown");
-            const profilerOutput = JSON.stringify(character, null, 2);
+            const profilerOutput = stringifyCached(character);
             
             // Fire and forget with rate limiting - don't await to avoid blocking generation
             // Uses shared class-level rate limiter (max 3 concurrent) for all evaluation calls
-            this.evaluationRateLimiter(() => 
-              this.evaluationService.evaluateRelevance({
-                runId,
-                profilerOutput,
-                seedIdea: options.seedIdea,
-                characterName,
+            this.trackBackground(
+              this.evaluationRateLimiter(() => 
+                this.evaluationService.evaluateRelevance({
+                  runId,
+                  profilerOutput,
+                  seedIdea: options.seedIdea,
+                  characterName,
+                })
+              ).catch((err) => {
+                $log.warn(`[StorytellerOrchestrator] Relevance evaluation failed for ${characterName}: ${err.message}`);
               })
-            ).catch((err) => {
-              $log.warn(`[StorytellerOrchestrator] Relevance evaluation failed for ${characterName}: ${err.message}`);
-            });
+            );
           }
           $log.info(`[StorytellerOrchestrator] runCharactersPhase: triggered relevance evaluations for ${state.characters.length} characters (rate limited to 3 concurrent), runId: ${runId}`);
         }
@@ -694,11 +884,20 @@ export class StorytellerOrchestrator {
     const state = this.activeRuns.get(runId);
     if (!state) return;
 
-    state.phase = GenerationPhase.NARRATOR_DESIGN;
+    // With PARALLEL_PLANNING_ENABLED this phase runs beside the worldbuilding
+    // -> outlining -> advanced planning chain, which owns state.phase.
+    if (!this.isParallelPlanningEnabled()) {
+      state.phase = GenerationPhase.NARRATOR_DESIGN;
+    }
     await this.publishPhaseStart(runId, GenerationPhase.NARRATOR_DESIGN);
 
     const agent = this.agentFactory.getAgent(AgentType.PROFILER);
-    const context: AgentContext = { runId, state, projectId: options.projectId };
+    // The Profiler picks its prompt from state.phase, so pin it on the context.
+    const context: AgentContext = {
+      runId,
+      state: { ...state, phase: GenerationPhase.NARRATOR_DESIGN },
+      projectId: options.projectId,
+    };
 
     const output = await agent.execute(context, options);
     state.narratorVoice = output.content as Record<string, unknown> as unknown as NarratorVoice;
@@ -900,9 +1099,54 @@ export class StorytellerOrchestrator {
 
     // Scene-level regeneration (Decision 3): compute per-scene plan once before the loop.
     const scenePlan = this.scenesToRun(scenes.length, options.scenesToRegenerate);
+    let pendingArchivist: Promise<void> | undefined;
+
+    // Kept scenes' prior prose does not depend on the scenes drafted around it,
+    // so it is requested a sliding window ahead of the loop instead of one
+    // lookup pair per kept scene in turn.
+    const priorScenes = new Map<number, Promise<{ content: unknown } | null>>();
+    // Each kept scene's synopsis entry needs only that scene's prose, so with
+    // PARALLEL_KEPT_SCENE_SUMMARIES the summaries are produced as the prose
+    // arrives (bounded) and each is appended in scene order when the loop
+    // reaches the scene.
+    const priorSummaries = new Map<number, Promise<string>>();
+    const summaryLimiter = this.isParallelKeptSummariesEnabled()
+      ? createRateLimiter(StorytellerOrchestrator.MAX_PARALLEL_KEPT_SUMMARIES)
+      : undefined;
+    let prefetchedThrough = 0;
+    const prefetchPriorScenes = (previousRunId: string, fromScene: number) => {
+      const until = Math.min(scenes.length, fromScene + StorytellerOrchestrator.PRIOR_SCENE_PREFETCH_WINDOW - 1);
+      while (prefetchedThrough < until) {
+        const sceneNum = ++prefetchedThrough;
+        if (scenePlan[sceneNum - 1].regenerate) continue;
+        const prior = this.fetchPriorScene(previousRunId, sceneNum);
+        void prior.catch(() => {}); // rethrown where the scene awaits it
+        priorScenes.set(sceneNum, prior);
+        if (summaryLimiter) {
+          const summary = summaryLimiter(async () => {
+            const row = await prior;
+            const text = String((row?.content as Record<string, unknown> | undefined)?.content ?? "");
+            return this.shouldStop(runId) ? "" : this.summarizeSceneText(runId, options, sceneNum, text);
+          });
+          void summary.catch(() => {}); // logged where the scene awaits it
+          priorSummaries.set(sceneNum, summary);
+        }
+      }
+    };
 
     for (let sceneNum = 0; sceneNum < scenes.length; sceneNum++) {
+      // A background Archivist pass must land before this scene's Writer reads
+      // keyConstraints / worldState (failures surface here, as if awaited inline).
+      // It is drained before the stop check too, so a paused or cancelled run
+      // never returns with the pass still writing into its state.
+      if (pendingArchivist) {
+        const archivist = pendingArchivist;
+        pendingArchivist = undefined;
+        await archivist;
+      }
+
       if (this.shouldStop(runId)) return;
+      if (options.previousRunId) prefetchPriorScenes(options.previousRunId, sceneNum + 1);
 
       // Mark in-flight for the duration of this scene's agent/LLM work; cleared
       // at the end of the scene (a safe boundary) so gracefulShutdown can wait.
@@ -912,14 +1156,15 @@ export class StorytellerOrchestrator {
       // Scene-level regeneration: reuse prior prose for scenes not in scenesToRegenerate,
       // instead of re-running the full draft→polish work.
       if (!scenePlan[sceneNum].regenerate && options.previousRunId) {
-        const reused = await this.reuseSceneFromPreviousRun(runId, options, sceneNum + 1);
+        const prior = priorScenes.get(sceneNum + 1);
+        const priorSummary = priorSummaries.get(sceneNum + 1);
+        priorScenes.delete(sceneNum + 1);
+        priorSummaries.delete(sceneNum + 1);
+        const reused = await this.reuseSceneFromPreviousRun(runId, options, sceneNum + 1, prior, priorSummary);
         if (reused) {
-          // Mirror the normal scene-boundary bookkeeping so a reused scene is as
-          // crash-recoverable and status-durable as a freshly drafted one.
-          state.currentSceneOutline = undefined;
-          state.inFlight = false;
-          await this.checkpointScene(runId, sceneNum + 1);
-          void this.mirrorStatus(runId);
+          // Same scene-boundary bookkeeping as a drafted scene, so a reused scene
+          // is as crash-recoverable and status-durable as a fresh one.
+          await this.completeSceneBoundary(runId, sceneNum + 1);
           continue;
         }
         // If no prior artifact existed, fall through and draft this scene normally.
@@ -985,16 +1230,49 @@ export class StorytellerOrchestrator {
           break;
         }
 
+        // A strong draft (score >= 8.5, no hard failure) is not worth a full
+        // Writer round-trip over minor notes — accept it as approved.
+        if (canSkipRevision(critique)) {
+          sceneApproved = true;
+          approvedCritiqueScore = critique.score as number;
+          console.log(`[Orchestrator] Scene ${sceneNum + 1} scored ${approvedCritiqueScore}, skipping revision`);
+          await this.publishEvent(runId, "scene_revision_skipped", { sceneNum: sceneNum + 1, score: approvedCritiqueScore });
+          break;
+        }
+
         // Revise
         await this.reviseScene(runId, options, sceneNum + 1, critique);
         revisionCount++;
         state.revisionCount.set(sceneNum + 1, revisionCount);
+
+        // Fast approval: the revision addressed minor notes on an already strong
+        // draft, so another Critic round-trip is unlikely to reject it.
+        // The revised text itself is unscored, so approvedCritiqueScore stays
+        // unset and the scene still gets its polish pass.
+        if (this.isFastApprovalEnabled() && canSkipRevision(critique, StorytellerOrchestrator.FAST_APPROVAL_SCORE)) {
+          sceneApproved = true;
+          const revisedFromScore = critique.score as number;
+          console.log(`[Orchestrator] Scene ${sceneNum + 1} revised from score ${revisedFromScore}, fast-approving without re-critique`);
+          await this.publishEvent(runId, "scene_approved", { sceneNum: sceneNum + 1, reason: "fast_approval", score: revisedFromScore });
+          break;
+        }
       }
 
       // Run Archivist every 3 scenes
       if ((sceneNum + 1) % 3 === 0 && sceneNum + 1 > state.lastArchivistScene) {
-        await this.runArchivistCheck(runId, options, sceneNum + 1);
-        state.lastArchivistScene = sceneNum + 1;
+        const archivistScene = sceneNum + 1;
+        if (this.isBackgroundArchivistEnabled()) {
+          // Consolidate while this scene is polished, summarized and checkpointed.
+          // That tail may see the constraints from before this pass, exactly as
+          // the scene's own draft and critiques did.
+          pendingArchivist = this.runArchivistCheck(runId, options, archivistScene).then(() => {
+            state.lastArchivistScene = archivistScene;
+          });
+          this.trackBackground(pendingArchivist.catch(() => {}));
+        } else {
+          await this.runArchivistCheck(runId, options, archivistScene);
+          state.lastArchivistScene = archivistScene;
+        }
       }
 
       // Polish the scene ONLY if it was approved AND score < 8
@@ -1007,7 +1285,16 @@ export class StorytellerOrchestrator {
       // correct entry charge into scene N+1 instead of the stale pre-revision critique.
       let finalValueShift: number | undefined;
       const shouldSkipPolish = typeof approvedCritiqueScore === "number" && approvedCritiqueScore >= 8;
+      let polishedSceneSummary: Promise<string> | undefined;
       if (sceneApproved && !shouldSkipPolish) {
+        if (this.isParallelPolishSynopsisEnabled()) {
+          // Polish is a line edit validated to keep the scene's length and
+          // ending, so the synopsis entry can summarize the approved text
+          // while the polish call runs.
+          const approved = state.drafts.get(sceneNum + 1) as Record<string, unknown> | undefined;
+          polishedSceneSummary = this.summarizeSceneText(runId, options, sceneNum + 1, String(approved?.content ?? ""));
+          void polishedSceneSummary.catch(() => {}); // rethrown where appendSceneSynopsis awaits it
+        }
         await this.polishScene(runId, options, sceneNum + 1);
       } else if (sceneApproved && shouldSkipPolish) {
         // CRITICAL: Emit scene_polish_complete even when skipping Polish
@@ -1032,13 +1319,6 @@ export class StorytellerOrchestrator {
         await this.emitSceneFinal(runId, options.projectId, sceneNum + 1, "flagged_subthreshold", finalScore);
       }
 
-      // Slice 2: terminal spice pass — runs after the scene is finalized in SOFT
-      // form (all gates passed on clean text). Inert unless spiceConfig is set and
-      // the scene produced spice regions. Never fails the scene.
-      if (!this.shouldStop(runId)) {
-        await this.applySpicePass(runId, options, sceneNum + 1);
-      }
-
       // Slice 2: thread the achieved value-shift (scene N exit → N+1 entry) and
       // append a rolling-synopsis entry for the finalized scene.
       // For sub-threshold scenes, prefer valueShiftDelivered from the final score-only
@@ -1052,29 +1332,22 @@ export class StorytellerOrchestrator {
           : 0);
       state.valueShifts.set(sceneNum + 1, achievedShift);
 
-      try {
-        const finalDraft = state.drafts.get(sceneNum + 1) as Record<string, unknown> | undefined;
-        const finalText = String(finalDraft?.content ?? "");
-        if (finalText.trim().length > 0) {
-          const archivist = this.agentFactory.getAgent(AgentType.ARCHIVIST) as ArchivistAgent;
-          const summary = await archivist.summarizeScene(runId, options, sceneNum + 1, finalText);
-          if (summary) state.rollingSynopsis.push({ sceneNumber: sceneNum + 1, summary });
-        }
-      } catch (synopsisError) {
-        $log.warn(`[StorytellerOrchestrator] runDraftingLoop: synopsis generation failed for scene ${sceneNum + 1}, continuing anyway, runId: ${runId}`, synopsisError);
-      }
-
-      // CRITICAL: Clear currentSceneOutline at the end of each scene to prevent state contamination
-      // Without this, Scene 2 would use Scene 1's outline data due to stale state
-      state.currentSceneOutline = undefined;
+      // Slice 2: terminal spice pass — runs after the scene is finalized in SOFT
+      // form (all gates passed on clean text). Inert unless spiceConfig is set and
+      // the scene produced spice regions. Never fails the scene.
+      // It only writes spicedContent while the synopsis summarizes the soft text,
+      // so the two LLM passes run side by side.
+      const finalDraft = state.drafts.get(sceneNum + 1) as Record<string, unknown> | undefined;
+      await Promise.all([
+        this.shouldStop(runId) ? undefined : this.applySpicePass(runId, options, sceneNum + 1),
+        this.appendSceneSynopsis(runId, options, sceneNum + 1, String(finalDraft?.content ?? ""), "runDraftingLoop", polishedSceneSummary),
+      ]);
 
-      // Safe checkpoint between scenes: gracefulShutdown may snapshot here.
-      state.inFlight = false;
-      // #157 Slice A: persist crash-recovery checkpoint and mirror status at scene boundary.
-      await this.checkpointScene(runId, sceneNum + 1);
-      void this.mirrorStatus(runId);
+      await this.completeSceneBoundary(runId, sceneNum + 1);
     }
 
+    if (pendingArchivist) await pendingArchivist;
+
     // Final Archivist flush: the per-scene trigger only fires on multiples of 3,
     // so when the scene count isn't divisible by 3 the trailing scenes' raw facts
     // were never consolidated. Run a final pass over any unprocessed scenes.
@@ -1099,13 +1372,16 @@ export class StorytellerOrchestrator {
     state.phase = GenerationPhase.DRAFTING;
     state.currentScene = sceneNum;
     
+    // Retrieve relevant context from Qdrant for hallucination prevention
+    // This provides the Writer with semantic memory of characters, worldbuilding, and previous scenes
+    // The searches only read the outline, so they start before the start event is published.
+    const pendingContext = this.getRelevantContext(options.projectId, sceneOutline);
+    void pendingContext.catch(() => {}); // rethrown where it is awaited below
+
     await this.publishEvent(runId, "scene_draft_start", { sceneNum });
 
     const sceneTitle = String(sceneOutline.title ?? `Scene ${sceneNum}`);
-
-    // Retrieve relevant context from Qdrant for hallucination prevention
-    // This provides the Writer with semantic memory of characters, worldbuilding, and previous scenes
-    const relevantContext = await this.getRelevantContext(options.projectId, sceneOutline);
+    const relevantContext = await pendingContext;
     
     // CRITICAL: Set currentSceneOutline at the start of each scene
     // This ensures WriterAgent always has the correct outline for this scene
@@ -1173,44 +1449,7 @@ export class StorytellerOrchestrator {
     await this.extractRawFacts(runId, sceneNum, response, AgentType.WRITER);
 
     // Store scene in Qdrant and Supabase
-    try {
-      const qdrantId = await this.qdrantMemory.storeScene(options.projectId, sceneNum, draft);
-
-      // Store in Supabase with qdrant_id reference and runId for Langfuse tracing
-      try {
-        await this.supabase.saveDraft(options.projectId, draft as Partial<Draft>, qdrantId, runId);
-      } catch (supabaseError) {
-        $log.error(
-          `[StorytellerOrchestrator] draftScene: Supabase storage failed for scene ${sceneNum} (continuing anyway), runId: ${runId}`,
-          supabaseError
-        );
-      }
-    } catch (qdrantError) {
-      $log.error(
-        `[StorytellerOrchestrator] draftScene: Qdrant storage failed for scene ${sceneNum} (continuing anyway), runId: ${runId}`,
-        qdrantError
-      );
-    }
-
-    await this.saveArtifact(runId, options.projectId, `draft_scene_${sceneNum}`, draft);
-
-    // Phase 5: Save draft to normalized Supabase table
-    try {
-      await this.supabase.upsertDraft({
-        projectId: options.projectId,
-        runId,
-        sceneNumber: sceneNum,
-        content: response,
-        wordCount: draft.wordCount,
-        status: "draft",
-        revisionCount: 0,
-        semanticCheckError: draft.semanticCheckError,
-        contradictionScore: draft.contradictionScore,
-      });
-      $log.info(`[StorytellerOrchestrator] draftScene: saved draft to Supabase, scene ${sceneNum}, runId: ${runId}`);
-    } catch (supabaseError) {
-      $log.error(`[StorytellerOrchestrator] draftScene: Supabase upsertDraft failed, continuing anyway, runId: ${runId}`, supabaseError);
-    }
+    await this.persistSceneDraft(runId, options, draft, "draftScene");
 
     await this.publishEvent(runId, "scene_draft_complete", { 
       sceneNum, 
@@ -1224,20 +1463,26 @@ export class StorytellerOrchestrator {
     // Uses shared rate limiter (max 3 concurrent) to avoid hitting LLM provider rate limits
     if (this.isEvaluationEnabled()) {
       try {
-        const architectPlan = JSON.stringify(sceneOutline, null, 2);
+        const architectPlan = stringifyCached(sceneOutline);
         
-        // Fire and forget with rate limiting - don't await to avoid blocking generation
-        // Uses shared class-level rate limiter (max 3 concurrent) for all evaluation calls
-        this.evaluationRateLimiter(() =>
-          this.evaluationService.evaluateFaithfulness({
-            runId,
-            writerOutput: response,
-            architectPlan,
-            sceneNumber: sceneNum,
-          })
-        ).catch((err) => {
-          $log.warn(`[StorytellerOrchestrator] Faithfulness evaluation failed for scene ${sceneNum}: ${err.message}`);
-        });
+        if (this.isBatchFaithfulnessEnabled()) {
+          this.queueFaithfulnessEvaluation(runId, { sceneNumber: sceneNum, writerOutput: response, architectPlan });
+        } else {
+          // Fire and forget with rate limiting - don't await to avoid blocking generation
+          // Uses shared class-level rate limiter (max 3 concurrent) for all evaluation calls
+          this.trackBackground(
+            this.evaluationRateLimiter(() =>
+              this.evaluationService.evaluateFaithfulness({
+                runId,
+                writerOutput: response,
+                architectPlan,
+                sceneNumber: sceneNum,
+              })
+            ).catch((err) => {
+              $log.warn(`[StorytellerOrchestrator] Faithfulness evaluation failed for scene ${sceneNum}: ${err.message}`);
+            })
+          );
+        }
         
         $log.info(`[StorytellerOrchestrator] draftScene: triggered faithfulness evaluation for scene ${sceneNum} (rate limited), runId: ${runId}`);
       } catch (evalError) {
@@ -1246,6 +1491,67 @@ export class StorytellerOrchestrator {
     }
   }
 
+  /**
+   * Persist a fresh scene draft: Qdrant memory (then the Supabase draft row that
+   * references its point id), the run artifact, and the normalized drafts table.
+   * The three writes are independent, so they run concurrently; each failure is
+   * logged and never fails the scene.
+   */
+  private async persistSceneDraft(
+    runId: string,
+    options: GenerationOptions,
+    draft: SceneDraft,
+    caller: string
+  ): Promise<void> {
+    const sceneNum = draft.sceneNum;
+    const storeMemory = async (): Promise<void> => {
+      try {
+        const qdrantId = await this.qdrantMemory.storeScene(options.projectId, sceneNum, draft);
+
+        // Store in Supabase with qdrant_id reference and runId for Langfuse tracing
+        try {
+          await this.supabase.saveDraft(options.projectId, draft as Partial<Draft>, qdrantId, runId);
+        } catch (supabaseError) {
+          $log.error(
+            `[StorytellerOrchestrator] ${caller}: Supabase storage failed for scene ${sceneNum} (continuing anyway), runId: ${runId}`,
+            supabaseError
+          );
+        }
+      } catch (qdrantError) {
+        $log.error(
+          `[StorytellerOrchestrator] ${caller}: Qdrant storage failed for scene ${sceneNum} (continuing anyway), runId: ${runId}`,
+          qdrantError
+        );
+      }
+    };
+
+    // Phase 5: Save draft to normalized Supabase table
+    const upsertDraftRow = async (): Promise<void> => {
+      try {
+        await this.supabase.upsertDraft({
+          projectId: options.projectId,
+          runId,
+          sceneNumber: sceneNum,
+          content: draft.content,
+          wordCount: draft.wordCount,
+          status: "draft",
+          revisionCount: 0,
+          semanticCheckError: draft.semanticCheckError,
+          contradictionScore: draft.contradictionScore,
+        });
+        $log.info(`[StorytellerOrchestrator] ${caller}: saved draft to Supabase, scene ${sceneNum}, runId: ${runId}`);
+      } catch (supabaseError) {
+        $log.error(`[StorytellerOrchestrator] ${caller}: Supabase upsertDraft failed, continuing anyway, runId: ${runId}`, supabaseError);
+      }
+    };
+
+    await Promise.all([
+      storeMemory(),
+      this.saveArtifact(runId, options.projectId, `draft_scene_${sceneNum}`, draft),
+      upsertDraftRow(),
+    ]);
+  }
+
   /**
    * Draft a scene using the Proactive Beats Method
    * Splits the scene into 3-4 parts and generates each sequentially
@@ -1266,6 +1572,11 @@ export class StorytellerOrchestrator {
     state.phase = GenerationPhase.DRAFTING;
     state.currentScene = sceneNum;
     
+    // Retrieve relevant context from Qdrant for hallucination prevention; started
+    // before the start event is published since the searches only read the outline.
+    const pendingContext = this.getRelevantContext(options.projectId, sceneOutline);
+    void pendingContext.catch(() => {}); // rethrown where it is awaited below
+
     await this.publishEvent(runId, "scene_draft_start", { sceneNum, method: "beats" });
 
     const sceneTitle = String(sceneOutline.title ?? `Scene ${sceneNum}`);
@@ -1277,8 +1588,21 @@ export class StorytellerOrchestrator {
 
     console.log(`[Orchestrator] Scene ${sceneNum} Beats Method: ${partsTotal} parts, ~${partTargetWords} words each`);
 
-    // Retrieve relevant context from Qdrant for hallucination prevention
-    const relevantContext = await this.getRelevantContext(options.projectId, sceneOutline);
+    const relevantContext = await pendingContext;
+    // Built once per scene: every part attempt layers its beat fields on top, and
+    // the scene is restored to it once all parts are assembled.
+    const outlineWithContext: Record<string, unknown> = {
+      ...sceneOutline,
+      retrievedContext: relevantContext,
+    };
+
+    // Use WriterAgent through AgentFactory
+    const agent = this.agentFactory.getAgent(AgentType.WRITER);
+    const context: AgentContext = {
+      runId,
+      state,
+      projectId: options.projectId,
+    };
 
     let combinedContent = "";
     const maxRetriesPerPart = 3;
@@ -1294,6 +1618,8 @@ export class StorytellerOrchestrator {
       });
 
       let partContent = "";
+      // Count of the latest attempt, reused below instead of re-splitting the part.
+      let partWordCount = 0;
       let retryCount = 0;
       const minPartWords = Math.floor(partTargetWords * 0.5); // 50% threshold per part
 
@@ -1301,8 +1627,7 @@ export class StorytellerOrchestrator {
       while (retryCount < maxRetriesPerPart) {
         // Set currentSceneOutline with beat-specific instructions
         state.currentSceneOutline = {
-          ...sceneOutline,
-          retrievedContext: relevantContext,
+          ...outlineWithContext,
           beatsMode: true,
           partIndex,
           partsTotal,
@@ -1312,14 +1637,6 @@ export class StorytellerOrchestrator {
           isFinalPart: partIndex === partsTotal,
         };
 
-        // Use WriterAgent through AgentFactory
-        const agent = this.agentFactory.getAgent(AgentType.WRITER);
-        const context: AgentContext = {
-          runId,
-          state,
-          projectId: options.projectId,
-        };
-
         const output = await agent.execute(context, options);
         partContent = this.stripFakeWordCount(output.content as string);
 
@@ -1336,7 +1653,7 @@ export class StorytellerOrchestrator {
           }
         }
 
-        const partWordCount = wordCount(partContent);
+        partWordCount = wordCount(partContent);
         
         if (partWordCount >= minPartWords) {
           console.log(`[Orchestrator] Scene ${sceneNum} Part ${partIndex}/${partsTotal}: ${partWordCount} words (target: ${partTargetWords})`);
@@ -1348,7 +1665,7 @@ export class StorytellerOrchestrator {
       }
 
       // FAIL-FAST: Check if we exhausted retries without meeting minimum word count
-      const finalPartWordCount = wordCount(partContent);
+      const finalPartWordCount = partWordCount;
       if (retryCount >= maxRetriesPerPart && finalPartWordCount < minPartWords) {
         await this.publishEvent(runId, "scene_beat_error", {
           sceneNum,
@@ -1375,7 +1692,7 @@ export class StorytellerOrchestrator {
         sceneNum, 
         partIndex, 
         partsTotal,
-        partWordCount: wordCount(partContent),
+        partWordCount,
         totalWordCount: wordCount(combinedContent)
       });
     }
@@ -1424,49 +1741,10 @@ export class StorytellerOrchestrator {
     await this.extractRawFacts(runId, sceneNum, combinedContent, AgentType.WRITER);
 
     // Store scene in Qdrant and Supabase (same as draftScene)
-    try {
-      const qdrantId = await this.qdrantMemory.storeScene(options.projectId, sceneNum, draft);
-
-      try {
-        await this.supabase.saveDraft(options.projectId, draft as Partial<Draft>, qdrantId, runId);
-      } catch (supabaseError) {
-        $log.error(
-          `[StorytellerOrchestrator] draftSceneWithBeats: Supabase storage failed for scene ${sceneNum} (continuing anyway), runId: ${runId}`,
-          supabaseError
-        );
-      }
-    } catch (qdrantError) {
-      $log.error(
-        `[StorytellerOrchestrator] draftSceneWithBeats: Qdrant storage failed for scene ${sceneNum} (continuing anyway), runId: ${runId}`,
-        qdrantError
-      );
-    }
-
-    await this.saveArtifact(runId, options.projectId, `draft_scene_${sceneNum}`, draft);
-
-    // Save draft to normalized Supabase table
-    try {
-      await this.supabase.upsertDraft({
-        projectId: options.projectId,
-        runId,
-        sceneNumber: sceneNum,
-        content: combinedContent,
-        wordCount: draft.wordCount,
-        status: "draft",
-        revisionCount: 0,
-        semanticCheckError: draft.semanticCheckError,
-        contradictionScore: draft.contradictionScore,
-      });
-      $log.info(`[StorytellerOrchestrator] draftSceneWithBeats: saved draft to Supabase, scene ${sceneNum}, runId: ${runId}`);
-    } catch (supabaseError) {
-      $log.error(`[StorytellerOrchestrator] draftSceneWithBeats: Supabase upsertDraft failed, continuing anyway, runId: ${runId}`, supabaseError);
-    }
+    await this.persistSceneDraft(runId, options, draft, "draftSceneWithBeats");
 
     // Restore the original scene outline (without beats mode)
-    state.currentSceneOutline = {
-      ...sceneOutline,
-      retrievedContext: relevantContext,
-    };
+    state.currentSceneOutline = outlineWithContext;
 
     await this.publishEvent(runId, "scene_draft_complete", { 
       sceneNum, 
@@ -1480,18 +1758,24 @@ export class StorytellerOrchestrator {
     // LLM-as-a-Judge evaluation (same as draftScene)
     if (this.isEvaluationEnabled()) {
       try {
-        const architectPlan = JSON.stringify(sceneOutline, null, 2);
+        const architectPlan = stringifyCached(sceneOutline);
         
-        this.evaluationRateLimiter(() =>
-          this.evaluationService.evaluateFaithfulness({
-            runId,
-            writerOutput: combinedContent,
-            architectPlan,
-            sceneNumber: sceneNum,
-          })
-        ).catch((err) => {
-          $log.warn(`[StorytellerOrchestrator] Faithfulness evaluation failed for scene ${sceneNum}: ${err.message}`);
-        });
+        if (this.isBatchFaithfulnessEnabled()) {
+          this.queueFaithfulnessEvaluation(runId, { sceneNumber: sceneNum, writerOutput: combinedContent, architectPlan });
+        } else {
+          this.trackBackground(
+            this.evaluationRateLimiter(() =>
+              this.evaluationService.evaluateFaithfulness({
+                runId,
+                writerOutput: combinedContent,
+                architectPlan,
+                sceneNumber: sceneNum,
+              })
+            ).catch((err) => {
+              $log.warn(`[StorytellerOrchestrator] Faithfulness evaluation failed for scene ${sceneNum}: ${err.message}`);
+            })
+          );
+        }
         
         $log.info(`[StorytellerOrchestrator] draftSceneWithBeats: triggered faithfulness evaluation for scene ${sceneNum} (rate limited), runId: ${runId}`);
       } catch (evalError) {
@@ -1535,22 +1819,28 @@ export class StorytellerOrchestrator {
     state.critiques.get(sceneNum)!.push(critique);
     state.updatedAt = new Date().toISOString();
 
-    await this.saveArtifact(runId, options.projectId, `critique_scene_${sceneNum}`, critique);
-
     // Phase 5: Save critique to normalized Supabase table
-    try {
-      const revisionCount = state.revisionCount.get(sceneNum) || 0;
-      await this.supabase.saveCritique({
-        projectId: options.projectId,
-        runId,
-        sceneNumber: sceneNum,
-        critique,
-        revisionNumber: revisionCount,
-      });
-      $log.info(`[StorytellerOrchestrator] critiqueScene: saved critique to Supabase, scene ${sceneNum}, runId: ${runId}`);
-    } catch (supabaseError) {
-      $log.error(`[StorytellerOrchestrator] critiqueScene: Supabase saveCritique failed, continuing anyway, runId: ${runId}`, supabaseError);
-    }
+    const saveCritiqueRow = async (): Promise<void> => {
+      try {
+        const revisionCount = state.revisionCount.get(sceneNum) || 0;
+        await this.supabase.saveCritique({
+          projectId: options.projectId,
+          runId,
+          sceneNumber: sceneNum,
+          critique,
+          revisionNumber: revisionCount,
+        });
+        $log.info(`[StorytellerOrchestrator] critiqueScene: saved critique to Supabase, scene ${sceneNum}, runId: ${runId}`);
+      } catch (supabaseError) {
+        $log.error(`[StorytellerOrchestrator] critiqueScene: Supabase saveCritique failed, continuing anyway, runId: ${runId}`, supabaseError);
+      }
+    };
+
+    // The run artifact and the normalized critique row are independent writes.
+    await Promise.all([
+      this.saveArtifact(runId, options.projectId, `critique_scene_${sceneNum}`, critique),
+      saveCritiqueRow(),
+    ]);
 
     await this.publishEvent(runId, "scene_critique_complete", { sceneNum, critique });
 
@@ -2025,21 +2315,10 @@ export class StorytellerOrchestrator {
     polishedWordCount: number
   ): boolean {
     // CRITICAL: Detect "lazy polish" notes where LLM truncates output with meta-commentary
-    // These patterns indicate the model didn't actually polish the full text
-    const lazyPolishPatterns = [
-      /\(note:\s*(?:the\s+)?(?:full\s+)?(?:polished\s+)?(?:scene\s+)?continues/i,
-      /\(note:\s*(?:the\s+)?rest\s+(?:is\s+)?(?:the\s+)?same/i,
-      /continues\s+with\s+(?:the\s+)?(?:exact\s+)?same\s+content/i,
-      /rest\s+(?:of\s+the\s+scene\s+)?(?:is\s+)?(?:the\s+)?same/i,
-      /\[\.\.\.(?:rest|remainder|continues)/i,
-      /i\s+won'?t\s+repeat/i,
-      /maintaining\s+the\s+[\d,]+[\s-]*word\s+count/i,
-      /as\s+(?:the\s+)?original\s+draft/i,
-    ];
-    
+    // (LAZY_POLISH_PATTERNS) - the model didn't actually polish the full text
     // Check the last 500 characters for lazy polish patterns (they usually appear at the end)
     const endingToCheck = polishedContent.slice(-500);
-    for (const pattern of lazyPolishPatterns) {
+    for (const pattern of LAZY_POLISH_PATTERNS) {
       if (pattern.test(endingToCheck)) {
         console.log(`[Orchestrator] Polish validation failed: detected lazy polish note (pattern: ${pattern.source})`);
         return false;
@@ -2082,14 +2361,24 @@ export class StorytellerOrchestrator {
     const state = this.activeRuns.get(runId);
     if (!state) return;
 
-    await this.publishEvent(runId, "archivist_start", { upToScene });
-
     // Get raw facts since last archivist run
     const newFacts = state.rawFactsLog.filter(
       (f) => f.sceneNumber > state.lastArchivistScene && f.sceneNumber <= upToScene
     );
 
-    if (newFacts.length === 0) return;
+    // Nothing to resolve: skip the LLM round-trip. Callers still advance
+    // lastArchivistScene past these scenes, which loses nothing: raw facts are
+    // extracted while each scene is drafted, so none can arrive for them later.
+    if (newFacts.length === 0) {
+      await this.publishEvent(runId, "archivist_complete", {
+        upToScene,
+        constraintCount: state.keyConstraints.length,
+        skipped: true,
+      });
+      return;
+    }
+
+    await this.publishEvent(runId, "archivist_start", { upToScene });
 
     state.currentScene = upToScene;
 
@@ -2109,10 +2398,32 @@ export class StorytellerOrchestrator {
       const newConstraints = result.constraints as KeyConstraint[];
       // Merge with existing, resolving conflicts by timestamp
       // IMPORTANT: Never overwrite immutable constraints (seed constraints from Genesis)
-      for (const newConstraint of newConstraints) {
-        const existingIndex = state.keyConstraints.findIndex(c => c.key === newConstraint.key);
+      // Index existing constraints by key once so each merge is O(1) instead of
+      // a linear scan of the (growing) constraint list. First entry per key wins,
+      // matching findIndex. The merge works on a copy (copy-on-write) so the
+      // constraints block, cached per array, is re-rendered only after a pass.
+      // The Archivist schema carries no per-constraint timestamp, so everything
+      // merged in one pass is stamped with a single pass time (computed once).
+      const passTimestamp = new Date().toISOString();
+      const merged = state.keyConstraints.slice();
+      const indexByKey = new Map<string, number>();
+      merged.forEach((c, i) => {
+        if (!indexByKey.has(c.key)) indexByKey.set(c.key, i);
+      });
+      for (const incoming of newConstraints) {
+        // Store one fixed shape of the KeyConstraint fields: the list lives for
+        // the whole run and is checkpointed every scene, and the per-constraint
+        // LLM reasoning (often longer than the value) is never read back.
+        const newConstraint: KeyConstraint = {
+          key: incoming.key,
+          value: incoming.value,
+          source: incoming.source,
+          sceneNumber: incoming.sceneNumber,
+          timestamp: incoming.timestamp ?? passTimestamp,
+        };
+        const existingIndex = indexByKey.get(newConstraint.key) ?? -1;
         if (existingIndex >= 0) {
-          const existing = state.keyConstraints[existingIndex];
+          const existing = merged[existingIndex];
           // CRITICAL: Never overwrite immutable constraints
           // These are seed constraints (genre, premise, tone, etc.) that prevent context drift
           if (existing.immutable === true) {
@@ -2121,12 +2432,14 @@ export class StorytellerOrchestrator {
           }
           // Replace if new constraint is more recent
           if (new Date(newConstraint.timestamp) > new Date(existing.timestamp)) {
-            state.keyConstraints[existingIndex] = newConstraint;
+            merged[existingIndex] = newConstraint;
           }
         } else {
-          state.keyConstraints.push(newConstraint);
+          indexByKey.set(newConstraint.key, merged.length);
+          merged.push(newConstraint);
         }
       }
+      state.keyConstraints = merged;
     }
 
     // Phase 4: Apply world state diff from Archivist output
@@ -2168,45 +2481,23 @@ export class StorytellerOrchestrator {
 
     console.log(`[extractRawFacts] Called for scene ${sceneNum}, content length: ${content.length}`);
 
-    // Build allowlist of canonical character names from state.characters
-    const canonicalNames = new Set<string>();
-    if (state.characters && Array.isArray(state.characters)) {
-      for (const char of state.characters) {
-        const charObj = char as Record<string, unknown>;
-        const name = charObj.name as string;
-        if (name) {
-          // Add full name and first name
-          canonicalNames.add(name.toLowerCase());
-          const firstName = name.split(' ')[0];
-          if (firstName) canonicalNames.add(firstName.toLowerCase());
-          // Add last name if present
-          const parts = name.split(' ');
-          if (parts.length > 1) {
-            canonicalNames.add(parts[parts.length - 1].toLowerCase());
-          }
-        }
-      }
+    // Allowlist of canonical character names (full, first and last), cached
+    // per roster array since the cast is stable across scenes.
+    const canonicalNames = Array.isArray(state.characters)
+      ? characterNameVariants(state.characters)
+      : new Set<string>();
+    // Listing the whole roster is debug output; skip building it in production.
+    if (process.env.NODE_ENV !== 'production') {
+      console.log(`[extractRawFacts] Canonical names: ${Array.from(canonicalNames).join(', ')}`);
     }
-    console.log(`[extractRawFacts] Canonical names: ${Array.from(canonicalNames).join(', ')}`);
-
-    // Patterns that capture meaningful character actions
-    const factPatterns = [
-      // Character speech (most reliable - "Elena said", "Marcus whispered")
-      /([A-Z][a-z]+) (said|asked|replied|answered|whispered|shouted|muttered|spoke|exclaimed|demanded|insisted)/g,
-      // Character movement (location changes)
-      /([A-Z][a-z]+) (walked|ran|moved|entered|left|arrived|departed|stepped|approached|retreated)/g,
-      // Character discoveries/realizations
-      /([A-Z][a-z]+) (discovered|found|learned|realized|understood|noticed|recognized|remembered)/g,
-      // Character emotions/reactions
-      /([A-Z][a-z]+) (smiled|frowned|laughed|cried|sighed|nodded|shook|gasped|trembled|froze)/g,
-      // Character state changes (significant events)
-      /([A-Z][a-z]+) (died|killed|married|betrayed|escaped|collapsed|awakened|transformed|vanished)/g,
-    ];
 
     const newFacts: Array<{ subject: string; change: string; category: 'char' | 'world' | 'plot' }> = [];
     const seenFacts = new Set<string>(); // Deduplicate facts
+    // One timestamp for the whole extraction pass: every fact comes from the
+    // same scene text, so per-fact Date formatting adds nothing.
+    const extractedAt = new Date().toISOString();
 
-    for (const pattern of factPatterns) {
+    for (const pattern of FACT_PATTERNS) {
       const matches = content.matchAll(pattern);
       for (const match of matches) {
         const subject = match[1] || "";
@@ -2223,24 +2514,13 @@ export class StorytellerOrchestrator {
         seenFacts.add(factKey);
         
         // Determine category based on action type
-        let category: 'char' | 'world' | 'plot' = 'plot';
-        const charActions = ['smiled', 'frowned', 'laughed', 'cried', 'sighed', 'nodded', 'shook', 'gasped', 'trembled', 'froze'];
-        const worldActions = ['walked', 'ran', 'moved', 'entered', 'left', 'arrived', 'departed', 'stepped', 'approached', 'retreated'];
-        const plotActions = ['died', 'killed', 'married', 'betrayed', 'escaped', 'collapsed', 'awakened', 'transformed', 'vanished', 'discovered', 'found', 'learned', 'realized'];
-        
-        if (charActions.includes(action.toLowerCase())) {
-          category = 'char';
-        } else if (worldActions.includes(action.toLowerCase())) {
-          category = 'world';
-        } else if (plotActions.includes(action.toLowerCase())) {
-          category = 'plot';
-        }
+        const category = FACT_ACTION_CATEGORY.get(action.toLowerCase()) ?? 'plot';
 
         state.rawFactsLog.push({
           fact: `${subject} ${action}`,
           source,
           sceneNumber: sceneNum,
-          timestamp: new Date().toISOString(),
+          timestamp: extractedAt,
         });
 
         newFacts.push({
@@ -2263,19 +2543,6 @@ export class StorytellerOrchestrator {
     }
   }
 
-  /**
-   * Build constraints block for prompts
-   */
-  private buildConstraintsBlock(constraints: KeyConstraint[]): string {
-    if (constraints.length === 0) {
-      return "No constraints established yet.";
-    }
-
-    return constraints
-      .map((c) => `- ${c.key}: ${c.value} (Scene ${c.sceneNumber})`)
-      .join("\n");
-  }
-
   /**
    * Retrieve relevant context from Qdrant for hallucination prevention
    * 
@@ -2305,60 +2572,73 @@ export class StorytellerOrchestrator {
       return "";
     }
 
-    try {
-      // Search for relevant characters
-      const relevantCharacters = await this.qdrantMemory.searchCharacters(projectId, searchQuery, 3);
-      if (relevantCharacters.length > 0) {
-        const charContext = relevantCharacters
+    // Entry bodies from every section share one budget (see fitToBudget): short
+    // entries stay whole and the long ones (usually previous-scene prose) split
+    // what is left, instead of a fixed 200-char cut per scene.
+    const sections: Array<{ heading: string; entries: Array<{ prefix: string; body: string }> }> = [];
+
+    // The three searches are independent, so run them concurrently; a failed
+    // search only drops its own section.
+    const [characterHits, worldHits, sceneHits] = await Promise.allSettled([
+      this.qdrantMemory.searchCharacters(projectId, searchQuery, 3),
+      this.qdrantMemory.searchWorldbuilding(projectId, searchQuery, 3),
+      this.qdrantMemory.searchScenes(projectId, searchQuery, 2),
+    ]);
+    for (const hits of [characterHits, worldHits, sceneHits]) {
+      if (hits.status === "rejected") {
+        // Log error but don't fail the generation
+        console.warn(`[Orchestrator] Failed to retrieve Qdrant context: ${hits.reason}`);
+      }
+    }
+
+    // Relevant characters
+    if (characterHits.status === "fulfilled") {
+      sections.push({
+        heading: "RELEVANT CHARACTERS",
+        entries: characterHits.value
           .filter(r => r.score > 0.5)  // Only include high-relevance matches
           .map(r => {
             const char = r.payload.character;
-            return `- ${r.payload.name}: ${char.role ?? ""} ${char.coreMotivation ?? ""}`.trim();
-          })
-          .join("\n");
-        
-        if (charContext) {
-          contextParts.push(`RELEVANT CHARACTERS:\n${charContext}`);
-        }
-      }
+            return { prefix: `- ${r.payload.name}: `, body: `${char.role ?? ""} ${char.coreMotivation ?? ""}`.trim() };
+          }),
+      });
+    }
 
-      // Search for relevant worldbuilding elements
-      const relevantWorld = await this.qdrantMemory.searchWorldbuilding(projectId, searchQuery, 3);
-      if (relevantWorld.length > 0) {
-        const worldContext = relevantWorld
+    // Relevant worldbuilding elements
+    if (worldHits.status === "fulfilled") {
+      sections.push({
+        heading: "RELEVANT WORLDBUILDING",
+        entries: worldHits.value
           .filter(r => r.score > 0.5)
           .map(r => {
             const elem = r.payload.element;
-            return `- ${r.payload.elementType}: ${elem.name ?? ""} - ${elem.description ?? ""}`.trim();
-          })
-          .join("\n");
-        
-        if (worldContext) {
-          contextParts.push(`RELEVANT WORLDBUILDING:\n${worldContext}`);
-        }
-      }
+            return { prefix: `- ${r.payload.elementType}: `, body: `${elem.name ?? ""} - ${elem.description ?? ""}`.trim() };
+          }),
+      });
+    }
 
-      // Search for relevant previous scenes (for continuity)
-      const relevantScenes = await this.qdrantMemory.searchScenes(projectId, searchQuery, 2);
-      if (relevantScenes.length > 0) {
-        const sceneContext = relevantScenes
+    // Relevant previous scenes (for continuity)
+    if (sceneHits.status === "fulfilled") {
+      sections.push({
+        heading: "PREVIOUS SCENES (for continuity)",
+        entries: sceneHits.value
           .filter(r => r.score > 0.5)
           .map(r => {
             const scene = r.payload.scene as Record<string, unknown>;
-            const content = String(scene.content ?? "");
-            // Include only a summary (first 200 chars) to avoid context bloat
-            const summary = content.length > 200 ? content.substring(0, 200) + "..." : content;
-            return `- Scene ${r.payload.sceneNumber} "${scene.title ?? ""}": ${summary}`;
-          })
-          .join("\n");
-        
-        if (sceneContext) {
-          contextParts.push(`PREVIOUS SCENES (for continuity):\n${sceneContext}`);
-        }
-      }
-    } catch (error) {
-      // Log error but don't fail the generation
-      console.warn(`[Orchestrator] Failed to retrieve Qdrant context: ${error}`);
+            return { prefix: `- Scene ${r.payload.sceneNumber} "${scene.title ?? ""}": `, body: String(scene.content ?? "") };
+          }),
+      });
+    }
+
+    const bodies = fitToBudget(
+      sections.flatMap(section => section.entries.map(entry => entry.body)),
+      StorytellerOrchestrator.RETRIEVED_CONTEXT_BUDGET
+    );
+    let next = 0;
+    for (const section of sections) {
+      if (section.entries.length === 0) continue;
+      const lines = section.entries.map(entry => `${entry.prefix}${bodies[next++]}`.trim()).join("\n");
+      contextParts.push(`${section.heading}:\n${lines}`);
     }
 
     if (contextParts.length === 0) {
@@ -2412,6 +2692,8 @@ export class StorytellerOrchestrator {
           content: response.content,
           timestamp: new Date().toISOString(),
         });
+        const overflow = state.messages.length - StorytellerOrchestrator.MAX_STATE_MESSAGES;
+        if (overflow > 0) state.messages.splice(0, overflow);
       }
 
       return response.content;
@@ -2435,7 +2717,7 @@ export class StorytellerOrchestrator {
         const prompt = await this.langfuse.getCompiledPrompt(
           promptName,
           variables,
-          { fallback: this.getFallbackPrompt(agent) }
+          { fallback: () => this.getFallbackPrompt(agent) }
         );
         return prompt;
       } catch (error) {
@@ -2450,40 +2732,7 @@ export class StorytellerOrchestrator {
    * Get fallback prompt for agent
    */
   private getFallbackPrompt(agent: AgentType): string {
-    const prompts: Record<AgentType, string> = {
-      [AgentType.ARCHITECT]: `You are the Architect, a master storyteller who designs narrative structures.
-Your role is to create compelling story frameworks with clear themes, arcs, and emotional journeys.
-{{seedIdea}}`,
-      [AgentType.PROFILER]: `You are the Profiler, an expert in character psychology and development.
-Your role is to create deep, nuanced characters with authentic motivations and arcs.
-Narrative context: {{narrative}}`,
-      [AgentType.WORLDBUILDER]: `You are the Worldbuilder, a creator of immersive settings and worlds.
-Your role is to develop rich, consistent worlds that enhance the narrative.
-Narrative: {{narrative}}
-Characters: {{characters}}`,
-      [AgentType.STRATEGIST]: `You are the Strategist, a master of narrative pacing and scene structure.
-Your role is to plan scenes that maximize dramatic impact and reader engagement.
-Narrative: {{narrative}}
-Characters: {{characters}}
-World: {{worldbuilding}}`,
-      [AgentType.WRITER]: `You are the Writer, a skilled prose craftsman.
-Your role is to transform outlines into vivid, engaging prose that brings the story to life.
-Maintain consistency with established facts.
-Key Constraints: {{keyConstraints}}`,
-      [AgentType.CRITIC]: `You are the Critic, an expert literary evaluator.
-Your role is to assess prose quality and provide constructive feedback for improvement.
-Check for constraint violations.
-Key Constraints: {{keyConstraints}}`,
-      [AgentType.ORIGINALITY]: `You are the Originality Checker, a detector of cliches and tropes.
-Your role is to identify overused elements and suggest unique alternatives.`,
-      [AgentType.IMPACT]: `You are the Impact Assessor, an expert in emotional resonance.
-Your role is to evaluate how effectively the prose engages readers emotionally.`,
-      [AgentType.ARCHIVIST]: `You are the Archivist, the keeper of story continuity.
-Your role is to track key facts and constraints, resolving conflicts to maintain consistency.
-Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp → DISCARD irrelevant → GENERATE updated list.`,
-    };
-
-    return prompts[agent] ?? "You are a helpful assistant.";
+    return FALLBACK_AGENT_PROMPTS[agent] ?? "You are a helpful assistant.";
   }
 
   /**
@@ -2493,13 +2742,7 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
     agent: AgentType,
     variables: Record<string, string>
   ): string {
-    let prompt = this.getFallbackPrompt(agent);
-    
-    for (const [key, value] of Object.entries(variables)) {
-      prompt = prompt.replace(new RegExp(`\\{\\{${key}\\}\\}`, "g"), value);
-    }
-
-    return prompt;
+    return renderTemplate(this.getFallbackPrompt(agent), variables);
   }
 
   /**
@@ -2519,6 +2762,92 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
     return false;
   }
 
+  /** Skipping the post-revision re-critique is default-OFF; set FAST_APPROVAL_ENABLED=true to enable. */
+  private isFastApprovalEnabled(): boolean {
+    return process.env.FAST_APPROVAL_ENABLED === "true";
+  }
+
+  /** Summarizing a regeneration's kept scenes up front is default-OFF; set PARALLEL_KEPT_SCENE_SUMMARIES=true to enable. */
+  private isParallelKeptSummariesEnabled(): boolean {
+    return process.env.PARALLEL_KEPT_SCENE_SUMMARIES === "true";
+  }
+
+  /** Summarizing a scene while it is polished is default-OFF; set PARALLEL_POLISH_SYNOPSIS=true to enable. */
+  private isParallelPolishSynopsisEnabled(): boolean {
+    return process.env.PARALLEL_POLISH_SYNOPSIS === "true";
+  }
+
+  /** Running the periodic Archivist pass alongside the scene tail is default-OFF; set ARCHIVIST_BACKGROUND=true to enable. */
+  private isBackgroundArchivistEnabled(): boolean {
+    return process.env.ARCHIVIST_BACKGROUND === "true";
+  }
+
+  /** Overlapping narrator design with the worldbuilding-to-planning chain is default-OFF; set PARALLEL_PLANNING_ENABLED=true to enable. */
+  private isParallelPlanningEnabled(): boolean {
+    return process.env.PARALLEL_PLANNING_ENABLED === "true";
+  }
+
+  /** Publishing events off the hot path is default-OFF; set EVENTS_ASYNC_PUBLISH=true to enable. */
+  private isAsyncEventsEnabled(): boolean {
+    return process.env.EVENTS_ASYNC_PUBLISH === "true";
+  }
+
+  /** Batched artifact writes are default-OFF; set ARTIFACTS_BATCHED_SAVE=true to enable. */
+  private isBatchedArtifactsEnabled(): boolean {
+    return process.env.ARTIFACTS_BATCHED_SAVE === "true";
+  }
+
+  /** Per-scene draft deltas in scene checkpoints are default-OFF; set CHECKPOINT_DRAFT_DELTAS=true to enable. */
+  private isCheckpointDraftDeltasEnabled(): boolean {
+    return process.env.CHECKPOINT_DRAFT_DELTAS === "true";
+  }
+
+  /** Writing scene checkpoints off the drafting path is default-OFF; set CHECKPOINTS_BACKGROUND_SAVE=true to enable. */
+  private isBackgroundCheckpointsEnabled(): boolean {
+    return process.env.CHECKPOINTS_BACKGROUND_SAVE === "true";
+  }
+
+  /** Judging the whole cast in one relevance prompt is default-OFF; set EVALUATION_BATCH_RELEVANCE=true to enable. */
+  private isBatchRelevanceEnabled(): boolean {
+    return process.env.EVALUATION_BATCH_RELEVANCE === "true";
+  }
+
+  /** Judging several scenes in one faithfulness prompt is default-OFF; set EVALUATION_BATCH_FAITHFULNESS=true to enable. */
+  private isBatchFaithfulnessEnabled(): boolean {
+    return process.env.EVALUATION_BATCH_FAITHFULNESS === "true";
+  }
+
+  /**
+   * Queue a scene's faithfulness check for the run's next batched judge call.
+   * A redrafted scene replaces its earlier entry; a full batch is sent right away.
+   */
+  private queueFaithfulnessEvaluation(runId: string, scene: FaithfulnessBatchInput["scenes"][number]): void {
+    let pending = this.pendingFaithfulness.get(runId);
+    if (!pending) {
+      pending = new Map();
+      this.pendingFaithfulness.set(runId, pending);
+    }
+    pending.set(scene.sceneNumber, scene);
+    if (pending.size >= StorytellerOrchestrator.FAITHFULNESS_BATCH_SIZE) {
+      this.flushFaithfulnessEvaluations(runId);
+    }
+  }
+
+  /** Send the run's queued faithfulness checks as one batched evaluation. No-op when none are queued. */
+  private flushFaithfulnessEvaluations(runId: string): void {
+    const pending = this.pendingFaithfulness.get(runId);
+    if (!pending) return;
+    this.pendingFaithfulness.delete(runId);
+    const scenes = Array.from(pending.values());
+    this.trackBackground(
+      this.evaluationRateLimiter(() =>
+        this.evaluationService.evaluateFaithfulnessBatch({ runId, scenes })
+      ).catch((err) => {
+        $log.warn(`[StorytellerOrchestrator] Batched faithfulness evaluation failed for scenes ${Array.from(pending.keys()).join(", ")}: ${err.message}`);
+      })
+    );
+  }
+
   /** Judge is observability-only and default-ON; set EVALUATION_ENABLED=false to disable. */
   private isEvaluationEnabled(): boolean {
     return process.env.EVALUATION_ENABLED !== "false" && this.evaluationService.isEnabled;
@@ -2542,7 +2871,27 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
         wordCount: data.wordCount,
       });
     }
-    await this.redisStreams.publishEvent(runId, eventType, data);
+    if (!this.isAsyncEventsEnabled()) {
+      await this.redisStreams.publishEvent(runId, eventType, data);
+      return;
+    }
+
+    // Queue behind this run's previous event so stream order is preserved, and
+    // return without waiting on the Redis round trips.
+    const previous = this.eventQueues.get(runId) ?? Promise.resolve();
+    const queued = previous
+      .then(() => this.redisStreams.publishEvent(runId, eventType, data))
+      .then(
+        () => undefined,
+        (err: Error) => {
+          $log.warn(`[StorytellerOrchestrator] Failed to publish ${eventType} for run ${runId}: ${err?.message}`);
+        }
+      );
+    this.eventQueues.set(runId, queued);
+    void queued.then(() => {
+      if (this.eventQueues.get(runId) === queued) this.eventQueues.delete(runId);
+    });
+    this.trackBackground(queued);
   }
 
   /**
@@ -2606,6 +2955,10 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
     artifactType: string,
     content: unknown
   ): Promise<void> {
+    if (this.isBatchedArtifactsEnabled()) {
+      this.bufferArtifact(runId, projectId, artifactType, content);
+      return;
+    }
     try {
       await this.supabase.saveRunArtifact({
         runId,
@@ -2618,6 +2971,68 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
     }
   }
 
+  /**
+   * Queue an artifact for the run's next batched write. A full batch is
+   * flushed right away, otherwise the first buffered artifact arms the timer.
+   * The content is snapshotted here: callers pass live state objects that the
+   * run keeps mutating in place until the batch is written.
+   */
+  private bufferArtifact(runId: string, projectId: string, artifactType: string, content: unknown, phase?: string): void {
+    let buffer = this.artifactBuffers.get(runId);
+    if (!buffer) {
+      buffer = { projectId, artifacts: new Map() };
+      this.artifactBuffers.set(runId, buffer);
+    }
+    buffer.artifacts.set(phase ? `${artifactType}@${phase}` : artifactType, { artifactType, phase, content: structuredClone(content) });
+    if (buffer.artifacts.size >= StorytellerOrchestrator.ARTIFACT_BATCH_SIZE) {
+      void this.flushArtifacts(runId);
+    } else if (!buffer.timer) {
+      buffer.timer = setTimeout(() => void this.flushArtifacts(runId), StorytellerOrchestrator.ARTIFACT_FLUSH_MS);
+    }
+  }
+
+  /**
+   * Write the run's buffered artifacts in one upsert (queued behind its earlier
+   * batches) and wait until everything buffered so far is persisted. Failures
+   * are logged, as with unbatched saves. No-op when nothing is pending.
+   */
+  private async flushArtifacts(runId: string): Promise<void> {
+    const buffer = this.artifactBuffers.get(runId);
+    if (buffer) {
+      this.artifactBuffers.delete(runId);
+      if (buffer.timer) clearTimeout(buffer.timer);
+      const batch = Array.from(buffer.artifacts.values(), ({ artifactType, phase, content }) => ({
+        runId,
+        projectId: buffer.projectId,
+        artifactType,
+        ...(phase ? { phase } : {}),
+        content,
+      }));
+      this.queueRunWrite(runId, async () => {
+        try {
+          await this.supabase.saveRunArtifacts(batch);
+        } catch (error) {
+          console.error(`Failed to save ${batch.length} artifacts for run ${runId}:`, error);
+        }
+      });
+    }
+    await this.artifactFlushes.get(runId);
+  }
+
+  /**
+   * Chain a write behind the run's earlier queued writes so they land in
+   * order; flushArtifacts waits for the tail. `write` must not reject.
+   */
+  private queueRunWrite(runId: string, write: () => Promise<void>): void {
+    const previous = this.artifactFlushes.get(runId) ?? Promise.resolve();
+    const queued = previous.then(write);
+    this.artifactFlushes.set(runId, queued);
+    void queued.then(() => {
+      if (this.artifactFlushes.get(runId) === queued) this.artifactFlushes.delete(runId);
+    });
+    this.trackBackground(queued);
+  }
+
   // ==================== REGENERATION HELPERS ====================
 
   /**
@@ -2636,6 +3051,11 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
     GenerationPhase.DRAFTING,
   ];
 
+  /** PHASE_CHAIN positions keyed by phase, so resolving a start phase is a map hit. */
+  private static readonly PHASE_CHAIN_INDEX: ReadonlyMap<GenerationPhase, number> = new Map(
+    StorytellerOrchestrator.PHASE_CHAIN.map((phase, index) => [phase, index])
+  );
+
   /**
    * Per-phase artifact-type + state-field seeding map, in chain order. The artifact
    * type strings are the REAL save-site keys (StorytellerOrchestrator saveArtifact
@@ -2657,10 +3077,10 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
    */
   private resolveStartPhaseIndex(startFromPhase?: GenerationPhase): number {
     if (!startFromPhase) return 0;
-    const idx = StorytellerOrchestrator.PHASE_CHAIN.indexOf(startFromPhase);
-    if (idx >= 0) return idx;
+    const idx = StorytellerOrchestrator.PHASE_CHAIN_INDEX.get(startFromPhase);
+    if (idx !== undefined) return idx;
     // In-loop phases not listed in PHASE_CHAIN -> drafting loop owns them.
-    return StorytellerOrchestrator.PHASE_CHAIN.indexOf(GenerationPhase.DRAFTING);
+    return StorytellerOrchestrator.PHASE_CHAIN_INDEX.get(GenerationPhase.DRAFTING)!;
   }
 
   /**
@@ -2672,8 +3092,9 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
     scenesToRegenerate?: number[]
   ): { sceneNum: number; regenerate: boolean }[] {
     const out: { sceneNum: number; regenerate: boolean }[] = [];
+    const selected = scenesToRegenerate ? new Set(scenesToRegenerate) : undefined;
     for (let i = 1; i <= sceneCount; i++) {
-      const regenerate = !scenesToRegenerate || scenesToRegenerate.includes(i);
+      const regenerate = !selected || selected.has(i);
       out.push({ sceneNum: i, regenerate });
     }
     return out;
@@ -2690,46 +3111,42 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
     previousRunId: string,
     uptoPhaseIndex: number
   ): Promise<void> {
-    for (let i = 0; i < uptoPhaseIndex && i < StorytellerOrchestrator.SEED_MAP.length; i++) {
-      const { artifactType, field } = StorytellerOrchestrator.SEED_MAP[i];
-      const row = (await this.supabase.getRunArtifact(previousRunId, artifactType)) as
-        | { content: unknown }
-        | null;
+    // The reads are independent: issue them together, then seed in phase order.
+    const seeds = StorytellerOrchestrator.SEED_MAP.slice(0, Math.max(0, uptoPhaseIndex));
+    const rows = await Promise.all(
+      seeds.map(({ artifactType }) => this.supabase.getRunArtifact(previousRunId, artifactType))
+    );
+    seeds.forEach(({ artifactType, field }, i) => {
+      const row = rows[i] as { content: unknown } | null;
       if (!row || row.content == null) {
         console.warn(
           `[Orchestrator] seedStateFromPreviousRun: no '${artifactType}' artifact on run ${previousRunId}; skipping`
         );
-        continue;
+        return;
       }
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
       (state as any)[field] = row.content;
-    }
+    });
   }
 
   /**
    * Scene-level regeneration: load a kept scene's prior prose from previousRunId and
    * place it into state.drafts. Prefers final_scene_N (polished terminal output),
    * falls back to draft_scene_N. Returns true if a prior artifact was found.
+   * `prior` is the row already requested by runDraftingLoop's prefetch, if any,
+   * and `priorSummary` its synopsis summary when that was produced up front.
    */
   private async reuseSceneFromPreviousRun(
     runId: string,
     options: GenerationOptions,
-    sceneNum: number
+    sceneNum: number,
+    prior?: Promise<{ content: unknown } | null>,
+    priorSummary?: Promise<string>
   ): Promise<boolean> {
     const state = this.activeRuns.get(runId);
     if (!state || !options.previousRunId) return false;
 
-    let row = (await this.supabase.getRunArtifact(
-      options.previousRunId,
-      `final_scene_${sceneNum}`
-    )) as { content: unknown } | null;
-
-    if (!row || row.content == null) {
-      row = (await this.supabase.getRunArtifact(
-        options.previousRunId,
-        `draft_scene_${sceneNum}`
-      )) as { content: unknown } | null;
-    }
+    const row = await (prior ?? this.fetchPriorScene(options.previousRunId, sceneNum));
 
     if (!row || row.content == null) {
       console.warn(
@@ -2745,21 +3162,79 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
     // no fresh critique, so record a neutral (0) value-shift and summarize the
     // reused prose into the rolling synopsis (best-effort; never fails the run).
     state.valueShifts.set(sceneNum, 0);
+    const reusedText = String((row.content as Record<string, unknown>)?.content ?? "");
+    await this.appendSceneSynopsis(runId, options, sceneNum, reusedText, "reuseSceneFromPreviousRun", priorSummary);
+
+    return true;
+  }
+
+  /**
+   * Append a rolling-synopsis entry for a finished scene (drafted or reused).
+   * Best-effort: blank text is skipped and a failed summary is only logged.
+   * `summary` is used instead of a fresh call when it was requested earlier.
+   */
+  private async appendSceneSynopsis(
+    runId: string,
+    options: GenerationOptions,
+    sceneNum: number,
+    sceneText: string,
+    caller: string,
+    summary?: Promise<string>
+  ): Promise<void> {
+    const state = this.activeRuns.get(runId);
+    if (!state || sceneText.trim().length === 0) return;
     try {
-      const reusedText = String((row.content as Record<string, unknown>)?.content ?? "");
-      if (reusedText.trim().length > 0) {
-        const archivist = this.agentFactory.getAgent(AgentType.ARCHIVIST) as ArchivistAgent;
-        const summary = await archivist.summarizeScene(runId, options, sceneNum, reusedText);
-        if (summary) state.rollingSynopsis.push({ sceneNumber: sceneNum, summary });
-      }
+      const text = await (summary ?? this.summarizeSceneText(runId, options, sceneNum, sceneText));
+      if (text) state.rollingSynopsis.push({ sceneNumber: sceneNum, summary: text });
     } catch (synopsisError) {
       $log.warn(
-        `[StorytellerOrchestrator] reuseSceneFromPreviousRun: synopsis generation failed for scene ${sceneNum}, continuing anyway, runId: ${runId}`,
+        `[StorytellerOrchestrator] ${caller}: synopsis generation failed for scene ${sceneNum}, continuing anyway, runId: ${runId}`,
         synopsisError
       );
     }
+  }
 
-    return true;
+  /** The Archivist's synopsis summary of a scene's text ("" for blank text). */
+  private async summarizeSceneText(
+    runId: string,
+    options: GenerationOptions,
+    sceneNum: number,
+    sceneText: string
+  ): Promise<string> {
+    if (sceneText.trim().length === 0) return "";
+    const archivist = this.agentFactory.getAgent(AgentType.ARCHIVIST) as ArchivistAgent;
+    return archivist.summarizeScene(runId, options, sceneNum, sceneText);
+  }
+
+  /**
+   * Scene-boundary bookkeeping shared by drafted and reused scenes: clear the
+   * per-scene outline, mark a safe checkpoint, persist it and mirror status.
+   */
+  private async completeSceneBoundary(runId: string, sceneNum: number): Promise<void> {
+    const state = this.activeRuns.get(runId);
+    if (!state) return;
+    // CRITICAL: Clear currentSceneOutline at the end of each scene to prevent state contamination
+    // Without this, Scene 2 would use Scene 1's outline data due to stale state
+    state.currentSceneOutline = undefined;
+
+    // Safe checkpoint between scenes: gracefulShutdown may snapshot here.
+    state.inFlight = false;
+    // #157 Slice A: persist crash-recovery checkpoint and mirror status at scene boundary.
+    await this.checkpointScene(runId, sceneNum);
+    void this.mirrorStatus(runId);
+  }
+
+  /** A kept scene's prior-run row: final_scene_N if it has content, else draft_scene_N. */
+  private async fetchPriorScene(previousRunId: string, sceneNum: number): Promise<{ content: unknown } | null> {
+    const row = (await this.supabase.getRunArtifact(
+      previousRunId,
+      `final_scene_${sceneNum}`
+    )) as { content: unknown } | null;
+    if (row && row.content != null) return row;
+    return (await this.supabase.getRunArtifact(
+      previousRunId,
+      `draft_scene_${sceneNum}`
+    )) as { content: unknown } | null;
   }
 
   /**
@@ -2906,6 +3381,9 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
       // Default to [] for snapshots saved before rollingSynopsis existed,
       // so the .push() in runDraftingLoop does not throw on restore.
       rollingSynopsis: (savedState.rollingSynopsis as SynopsisEntry[]) ?? [],
+      // Snapshots written before the live cap existed can carry an unbounded
+      // log; restore only the newest MAX_STATE_MESSAGES entries.
+      messages: ((savedState.messages as GenerationState["messages"]) ?? []).slice(-StorytellerOrchestrator.MAX_STATE_MESSAGES),
       isPaused: true, // Keep paused until explicitly resumed
     };
   }
@@ -2918,17 +3396,42 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
   private async checkpointScene(runId: string, sceneNumber: number): Promise<void> {
     const state = this.activeRuns.get(runId);
     if (!state) return;
-    try {
-      await this.supabase.saveRunArtifact({
-        runId: state.runId,
-        projectId: state.projectId,
-        artifactType: "run_state_checkpoint",
-        phase: `checkpoint_scene_${sceneNumber}`,
-        content: this.serializeState(state),
-      });
-    } catch (err) {
-      console.warn(`[Orchestrator] checkpointScene failed for ${runId} scene ${sceneNumber}: ${String(err)}`);
+    const content = this.serializeState(state);
+    if (this.isCheckpointDraftDeltasEnabled()) {
+      // Earlier scenes' drafts are already in their own checkpoints (restore
+      // joins them), so each checkpoint carries only its scene's draft instead
+      // of every draft so far.
+      const draft = state.drafts.get(sceneNumber);
+      content.drafts = draft ? { [sceneNumber]: draft } : {};
+    }
+    const write = async (payload: Record<string, unknown>) => {
+      try {
+        await this.supabase.saveRunArtifact({
+          runId: state.runId,
+          projectId: state.projectId,
+          artifactType: "run_state_checkpoint",
+          phase: `checkpoint_scene_${sceneNumber}`,
+          content: payload,
+        });
+      } catch (err) {
+        console.warn(`[Orchestrator] checkpointScene failed for ${runId} scene ${sceneNumber}: ${String(err)}`);
+      }
+    };
+    const batched = this.isBatchedArtifactsEnabled();
+    if (batched) {
+      // Ride along with the scene's other artifacts in the next batch
+      // (bufferArtifact snapshots the payload).
+      this.bufferArtifact(runId, state.projectId, "run_state_checkpoint", content, `checkpoint_scene_${sceneNumber}`);
+      return;
+    }
+    if (this.isBackgroundCheckpointsEnabled()) {
+      // The next scene mutates state in place while the write is pending (log
+      // appends, Archivist world-state diffs), so queue a snapshot of it.
+      const snapshot = structuredClone(content);
+      this.queueRunWrite(runId, () => write(snapshot));
+      return;
     }
+    await write(content);
   }
 
   // ==================== REDIS STATUS MIRROR (issue #157, Slice A) ====================
@@ -3091,6 +3594,24 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
 
   // ==================== GRACEFUL SHUTDOWN ====================
 
+  /** Track a fire-and-forget promise until it settles (callers attach their own .catch). */
+  private trackBackground(task: Promise<unknown>): void {
+    this.backgroundTasks.add(task);
+    void task.finally(() => this.backgroundTasks.delete(task));
+  }
+
+  /** Wait for tracked background work to settle, bounded by timeoutMs. */
+  private async drainBackgroundTasks(timeoutMs: number): Promise<void> {
+    if (this.backgroundTasks.size === 0) return;
+    console.log(`Orchestrator: Waiting for ${this.backgroundTasks.size} background tasks...`);
+    let timer: NodeJS.Timeout | undefined;
+    await Promise.race([
+      Promise.allSettled(Array.from(this.backgroundTasks)),
+      new Promise((resolve) => { timer = setTimeout(resolve, timeoutMs); }),
+    ]);
+    if (timer) clearTimeout(timer);
+  }
+
   /**
    * Initiate graceful shutdown
    * 
@@ -3108,6 +3629,7 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
     
     if (activeRuns.length === 0) {
       console.log("Orchestrator: No active runs to save");
+      await this.drainBackgroundTasks(timeoutMs);
       return 0;
     }
 
@@ -3167,6 +3689,14 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
       }
     }
 
+    // Hand any buffered artifacts to their batch writes before draining.
+    for (const runId of Array.from(this.artifactBuffers.keys())) {
+      void this.flushArtifacts(runId);
+    }
+
+    // Let pending evaluations finish so their Langfuse scores are included in the flush.
+    await this.drainBackgroundTasks(Math.max(0, timeoutMs - (Date.now() - startTime)));
+
     // Flush Langfuse events
     await this.langfuse.flush();
 
@@ -3209,7 +3739,15 @@ Use Chain of Thought reasoning: IDENTIFY conflicts → RESOLVE by timestamp →
             const numB = parseInt(b.phase!.replace("checkpoint_scene_", ""), 10) || 0;
             return numA - numB;
           });
-          artifact = checkpoints[checkpoints.length - 1] as unknown;
+          // Join the drafts of every checkpoint in scene order: with
+          // CHECKPOINT_DRAFT_DELTAS each one only carries its own scene's draft
+          // (full checkpoints just overwrite with the same drafts).
+          const latest = checkpoints[checkpoints.length - 1];
+          const drafts: Record<string, unknown> = {};
+          for (const checkpoint of checkpoints) {
+            Object.assign(drafts, (checkpoint.content as Record<string, unknown> | null)?.drafts ?? {});
+          }
+          artifact = { ...latest, content: { ...(latest.content as Record<string, unknown>), drafts } } as unknown;
           console.log(`Orchestrator: No snapshot for run ${runId}; restoring from latest scene checkpoint (${checkpoints[checkpoints.length - 1].phase})`);
         }
       }
@@ -10,6 +10,24 @@ import {
 import { normalizeCharacterForStorage } from "../utils/schemaNormalizers";
 import { camelToSnakeCase } from "../utils/stringUtils";
 
+/** Phase for each whole-run artifact type. */
+const ARTIFACT_PHASES = new Map<string, string>([
+  ["narrative", "genesis"],
+  ["characters", "characters"],
+  ["worldbuilding", "worldbuilding"],
+  ["outline", "outlining"],
+  ["advanced_plan", "advanced_planning"],
+  ["run_state_snapshot", "snapshot"],
+]);
+
+/** Phase for per-scene artifact types (`<kind>_scene_<N>`), keyed by kind. */
+const SCENE_ARTIFACT_PHASES = new Map<string, string>([
+  ["draft", "drafting"],
+  ["critique", "drafting"],
+  ["revision", "drafting"],
+  ["final", "polish"],
+]);
+
 interface Project {
   id: string;
   user_id?: string;
@@ -367,7 +385,10 @@ export class SupabaseService {
     // Use validated data (with unknown fields stripped)
     const validatedData = validationResult.data;
 
-    console.log('[SupabaseService] Attempting to save character:', JSON.stringify(validatedData, null, 2));
+    // Pretty-printing the whole profile is debug output; skip it in production.
+    if (process.env.NODE_ENV !== 'production') {
+      console.log('[SupabaseService] Attempting to save character:', JSON.stringify(validatedData, null, 2));
+    }
 
     const { data, error, status, statusText } = await client
       .from("characters")
@@ -1025,21 +1046,47 @@ export class SupabaseService {
       throw new Error(`Failed to save run artifact: ${error.message}`);
     }
   }
-  
+
+  /**
+   * Save several run artifacts in one upsert round trip.
+   * Rows must not repeat a (run, phase, artifact type) key within one call.
+   */
+  async saveRunArtifacts(artifacts: Array<{
+    runId: string;
+    projectId: string;
+    artifactType: string;
+    content: unknown;
+    phase?: string;
+  }>): Promise<void> {
+    if (artifacts.length === 0) return;
+    const client = this.getClient();
+    const createdAt = new Date().toISOString();
+
+    const { error } = await client.from("run_artifacts").upsert(
+      artifacts.map((params) => ({
+        run_id: params.runId,
+        project_id: params.projectId,
+        artifact_type: params.artifactType,
+        phase: params.phase || this.derivePhaseFromArtifactType(params.artifactType),
+        content: params.content,
+        created_at: createdAt,
+      })),
+      { onConflict: "run_id,phase,artifact_type" }
+    );
+
+    if (error) {
+      throw new Error(`Failed to save run artifacts: ${error.message}`);
+    }
+  }
+
   /**
    * Derive phase from artifact type
    */
   private derivePhaseFromArtifactType(artifactType: string): string {
-    if (artifactType === "narrative") return "genesis";
-    if (artifactType === "characters") return "characters";
-    if (artifactType === "worldbuilding") return "worldbuilding";
-    if (artifactType === "outline") return "outlining";
-    if (artifactType === "advanced_plan") return "advanced_planning";
-    if (artifactType.startsWith("draft_scene_")) return "drafting";
-    if (artifactType.startsWith("critique_scene_")) return "drafting";
-    if (artifactType.startsWith("revision_scene_")) return "drafting";
-    if (artifactType.startsWith("final_scene_")) return "polish";
-    if (artifactType === "run_state_snapshot") return "snapshot";
+    const phase = ARTIFACT_PHASES.get(artifactType);
+    if (phase) return phase;
+    const sceneSep = artifactType.indexOf("_scene_");
+    if (sceneSep > 0) return SCENE_ARTIFACT_PHASES.get(artifactType.slice(0, sceneSep)) ?? "unknown";
     return "unknown";
   }
 
@@ -503,20 +503,23 @@ export class WorldBibleEmbeddingService {
   ): Promise<ConsistencyCheckResult> {
     const similarSections = await this.searchSimilar(projectId, newContent, 10);
 
-    const conflictingSections = similarSections.filter(
-      (section) => section.score >= threshold
-    );
+    // One pass collects the matches, their top score and their categories.
+    const conflictingSections: typeof similarSections = [];
+    const sectionTypes = new Set<WorldBibleSectionType>();
+    let maxScore = 0;
+    for (const section of similarSections) {
+      if (section.score < threshold) continue;
+      conflictingSections.push(section);
+      sectionTypes.add(section.payload.sectionType);
+      if (conflictingSections.length === 1 || section.score > maxScore) maxScore = section.score;
+    }
 
     const hasContradiction = conflictingSections.length > 0;
-    const maxScore = conflictingSections.length > 0
-      ? Math.max(...conflictingSections.map((s) => s.score))
-      : 0;
 
     let explanation: string | undefined;
     if (hasContradiction) {
-      const sectionTypes = [...new Set(conflictingSections.map((s) => s.payload.sectionType))];
       explanation = `Found ${conflictingSections.length} related World Bible section(s) ` +
-        `in categories: ${sectionTypes.join(", ")}. ` +
+        `in categories: ${[...sectionTypes].join(", ")}. ` +
         `Highest similarity score: ${(maxScore * 100).toFixed(1)}%. ` +
         `Review these sections to ensure consistency with the new content.`;
     }
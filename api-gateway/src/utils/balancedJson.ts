@@ -0,0 +1,75 @@
+/**
+ * Locate the first balanced JSON object/array embedded in free text, e.g. an
+ * LLM reply like `Sure! {"score": 8} Hope this helps.` that has no code fence.
+ * Forward scan tracking bracket depth; brackets inside string literals
+ * (including escaped quotes) are ignored. An opener whose span never closes
+ * (e.g. a stray `{` ahead of the payload) is skipped and the scan retried from
+ * the next `{`/`[`. Returns the candidate substring, or null if no opener
+ * yields a balanced span. The caller still JSON.parses the result — this only
+ * finds the span. Pure.
+ */
+export function findBalancedJSON(text: string): string | null {
+  for (let start = nextOpener(text, 0); start !== -1; start = nextOpener(text, start + 1)) {
+    const span = balancedSpanAt(text, start);
+    if (span !== null) return span;
+  }
+  return null;
+}
+
+/**
+ * Like findBalancedJSON, but also JSON.parses each balanced span and returns
+ * the first one that parses to a plain object, together with its value. Spans
+ * that do not parse (`{placeholder}`) are skipped, and so are arrays ahead of
+ * the payload: a citation like `[1]` in `Per the rubric [1], here is my score:
+ * {"score": 8}` is valid JSON but not the answer. The first array that parses
+ * is only returned when no object follows it outside its own span, so a reply
+ * like `Here: [{"a": 1}]` still yields the whole array. Null if nothing parses.
+ * Pure.
+ */
+export function parseEmbeddedJSON(text: string): { json: string; value: unknown } | null {
+  let firstArray: { json: string; value: unknown } | null = null;
+  let start = nextOpener(text, 0);
+  while (start !== -1) {
+    const span = balancedSpanAt(text, start);
+    let next = start + 1;
+    if (span !== null) {
+      try {
+        const value: unknown = JSON.parse(span);
+        if (!Array.isArray(value)) return { json: span, value };
+        firstArray ??= { json: span, value };
+        // Objects inside a parsed array are its elements, not the payload.
+        next = start + span.length;
+      } catch {
+        // try the next opener
+      }
+    }
+    start = nextOpener(text, next);
+  }
+  return firstArray;
+}
+
+function nextOpener(text: string, from: number): number {
+  const obj = text.indexOf("{", from);
+  const arr = text.indexOf("[", from);
+  return obj === -1 ? arr : arr === -1 ? obj : Math.min(obj, arr);
+}
+
+function balancedSpanAt(text: string, start: number): string | null {
+  let depth = 0;
+  let inString = false;
+  for (let i = start; i < text.length; i++) {
+    const ch = text[i];
+    if (inString) {
+      if (ch === "\\") i++;
+      else if (ch === "\"") inString = false;
+      continue;
+    }
+    if (ch === "\"") inString = true;
+    else if (ch === "{" || ch === "[") depth++;
+    else if (ch === "}" || ch === "]") {
+      depth--;
+      if (depth === 0) return text.slice(start, i + 1);
+    }
+  }
+  return null;
+}
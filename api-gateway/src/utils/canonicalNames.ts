@@ -8,7 +8,9 @@ export function buildCanonicalNamesBlock(characters: unknown): string {
     return "No characters established yet.";
   }
 
-  const names: string[] = [];
+  // Build the "- name" lines directly instead of collecting names and then
+  // mapping + joining them.
+  let block = "";
   for (const char of characters) {
     if (typeof char === "object" && char !== null) {
       const charObj = char as Record<string, unknown>;
@@ -18,14 +20,10 @@ export function buildCanonicalNamesBlock(characters: unknown): string {
         (v): v is string => typeof v === "string" && v.trim().length > 0
       );
       if (candidate) {
-        names.push(candidate.trim());
+        block += block ? `\n- ${candidate.trim()}` : `- ${candidate.trim()}`;
       }
     }
   }
 
-  if (names.length === 0) {
-    return "No named characters established yet.";
-  }
-
-  return names.map((name) => `- ${name}`).join("\n");
+  return block || "No named characters established yet.";
 }
@@ -0,0 +1,88 @@
+/**
+ * Name → profile index over the character roster, built once per roster array
+ * and reused by every prompt builder that narrows the cast to the characters
+ * present in a scene. Replaces per-call O(N) scans over the whole cast with
+ * O(P) lookups (P = present characters). Keys are trimmed + lower-cased, the
+ * same normalization the prompt builders already apply to `charactersPresent`.
+ *
+ * Cached in a WeakMap keyed by the roster array: phases replace
+ * `state.characters` wholesale (never mutate it in place), so a new roster
+ * gets a fresh index and an old one is garbage-collected with its array. Pure.
+ */
+const indexCache = new WeakMap<object, Map<string, Record<string, unknown>>>();
+const blockCache = new WeakMap<object, Map<string, string>>();
+const variantsCache = new WeakMap<object, Set<string>>();
+
+export function normalizeCharacterName(name: string): string {
+  return name.trim().toLowerCase();
+}
+
+export function characterIndex(characters: readonly unknown[]): Map<string, Record<string, unknown>> {
+  const cached = indexCache.get(characters);
+  if (cached) return cached;
+  const index = new Map<string, Record<string, unknown>>();
+  for (const char of characters) {
+    if (typeof char !== "object" || char === null) continue;
+    const rec = char as Record<string, unknown>;
+    if (typeof rec.name !== "string" || !rec.name.trim()) continue;
+    const key = normalizeCharacterName(rec.name);
+    // First profile wins on duplicate names, matching a front-to-back scan.
+    if (!index.has(key)) index.set(key, rec);
+  }
+  indexCache.set(characters, index);
+  return index;
+}
+
+/** Profiles for the given names, in the order given; unknown names and repeats are skipped. */
+export function selectCharactersByName(characters: readonly unknown[], names: readonly string[]): Record<string, unknown>[] {
+  const index = characterIndex(characters);
+  const selected: Record<string, unknown>[] = [];
+  const seen = new Set<string>();
+  for (const name of names) {
+    const key = normalizeCharacterName(name);
+    if (seen.has(key)) continue;
+    seen.add(key);
+    const rec = index.get(key);
+    if (rec) selected.push(rec);
+  }
+  return selected;
+}
+
+/**
+ * Lower-cased full, first and last names of every character, the allowlist raw
+ * fact extraction matches subjects against. Built once per roster array.
+ */
+export function characterNameVariants(characters: readonly unknown[]): ReadonlySet<string> {
+  const cached = variantsCache.get(characters);
+  if (cached) return cached;
+  const variants = new Set<string>();
+  for (const char of characters) {
+    const name = (char as Record<string, unknown> | null)?.name;
+    if (typeof name !== "string" || !name) continue;
+    variants.add(name.toLowerCase());
+    const parts = name.split(" ");
+    if (parts[0]) variants.add(parts[0].toLowerCase());
+    if (parts.length > 1) variants.add(parts[parts.length - 1].toLowerCase());
+  }
+  variantsCache.set(characters, variants);
+  return variants;
+}
+
+/**
+ * Memoize a prompt block derived from the roster. `key` must capture every
+ * other input of `build` (e.g. the present-character list); the cache lives
+ * and dies with the roster array, like the index above.
+ */
+export function memoizeRosterBlock(characters: readonly unknown[], key: string, build: () => string): string {
+  let blocks = blockCache.get(characters);
+  if (!blocks) {
+    blocks = new Map();
+    blockCache.set(characters, blocks);
+  }
+  let block = blocks.get(key);
+  if (block === undefined) {
+    block = build();
+    blocks.set(key, block);
+  }
+  return block;
+}
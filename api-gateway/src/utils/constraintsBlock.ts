@@ -1,15 +1,30 @@
 /**
  * Render key constraints into the prompt block, extracted from BaseAgent so
  * agents and tests share one definition. REAL format: `- key: value (Scene N)`,
- * empty list -> "No constraints established yet.". Pure.
+ * empty list -> "No constraints established yet.".
+ *
+ * The block goes into every Writer/Critic call but the list only changes on an
+ * Archivist pass, so the rendered text is cached per array (WeakMap). The
+ * Archivist merge replaces `state.keyConstraints` with a new array; the seed
+ * constraints are only ever appended, which the cached length catches. Pure.
  */
+const blockCache = new WeakMap<object, { length: number; block: string }>();
+
 export function buildConstraintsBlock(
   constraints: { key: string; value: string; sceneNumber: number }[]
 ): string {
   if (constraints.length === 0) {
     return "No constraints established yet.";
   }
-  return constraints
-    .map((c) => `- ${c.key}: ${c.value} (Scene ${c.sceneNumber})`)
-    .join("\n");
+  const cached = blockCache.get(constraints);
+  if (cached && cached.length === constraints.length) return cached.block;
+  // The constraint list only grows over a run and this block is rendered on
+  // every Writer/Critic call, so append lines directly instead of map + join.
+  let block = "";
+  for (const c of constraints) {
+    if (block) block += "\n";
+    block += `- ${c.key}: ${c.value} (Scene ${c.sceneNumber})`;
+  }
+  blockCache.set(constraints, { length: constraints.length, block });
+  return block;
 }
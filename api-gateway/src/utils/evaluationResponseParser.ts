@@ -1,3 +1,5 @@
+import { parseEmbeddedJSON } from "./balancedJson";
+
 /**
  * Result of an LLM-judge evaluation. Score is on a 0..1 scale.
  * (Moved here from EvaluationService for issue #165 so the parser is testable
@@ -36,3 +38,60 @@ export function parseEvaluationResponse(
     return null;
   }
 }
+
+/** `3`, `"3"`, `"#3"` and `"Item 3"` (any case/spacing) all name item 3. */
+const BATCH_ITEM_LABEL = /^(?:item\s*)?#?\s*(\d+)$/i;
+
+/**
+ * Normalize a batched judge's item reference to its 1-based item number, or
+ * null when it does not name one. Judges echo labels loosely, so matching is
+ * case- and whitespace-insensitive rather than exact.
+ */
+export function normalizeBatchItem(ref: unknown): number | null {
+  if (typeof ref === "number") return Number.isInteger(ref) && ref > 0 ? ref : null;
+  if (typeof ref !== "string") return null;
+  const match = ref.trim().match(BATCH_ITEM_LABEL);
+  const item = match ? Number(match[1]) : 0;
+  return item > 0 ? item : null;
+}
+
+/**
+ * Parse a batched judge response of the form
+ * `{"results": [{"item": 1, "score": 0.8, "reasoning": "..."}]}` into one
+ * result per numbered item. Items are keyed by number rather than by name so
+ * two characters sharing a name (or a judge that re-cases a label) cannot
+ * collapse or miss entries. Entries without a usable item number are skipped;
+ * the first entry for an item wins; scores are clamped like the single-item
+ * parser. Returns an empty map when no JSON is found.
+ */
+export function parseBatchEvaluationResponse(
+  content: string,
+  model: string,
+  durationMs: number
+): Map<number, EvaluationResult> {
+  const results = new Map<number, EvaluationResult>();
+  const extracted = parseEmbeddedJSON(content);
+  if (!extracted) {
+    console.warn(`[EvaluationService] Failed to parse batch evaluation response: ${content}`);
+    return results;
+  }
+  const parsed = extracted.value;
+  const items = Array.isArray(parsed)
+    ? parsed
+    : (parsed && typeof parsed === "object" && Array.isArray((parsed as Record<string, unknown>).results))
+      ? (parsed as Record<string, unknown>).results as unknown[]
+      : [];
+  for (const entry of items) {
+    if (!entry || typeof entry !== "object") continue;
+    const rec = entry as Record<string, unknown>;
+    const item = normalizeBatchItem(rec.item);
+    if (item === null || results.has(item)) continue;
+    results.set(item, {
+      score: Math.max(0, Math.min(1, Number(rec.score) || 0)),
+      reasoning: String(rec.reasoning || "No reasoning provided"),
+      evaluationModel: model,
+      durationMs,
+    });
+  }
+  return results;
+}
@@ -0,0 +1,30 @@
+/**
+ * Fit a set of prompt components into a shared character budget by trimming
+ * only the longest ones: find the largest threshold T such that
+ * sum(min(len, T)) <= budget, then cut every component longer than T down to
+ * T (marked with "..."). Short components are kept whole and their unused
+ * share goes to the long ones, instead of a fixed per-item cut that is too
+ * tight for a few long items and too loose for many. Returns the inputs
+ * unchanged when they already fit. Pure.
+ */
+export function fitToBudget(components: string[], budget: number): string[] {
+  let total = 0;
+  for (const c of components) total += c.length;
+  if (total <= budget) return components;
+
+  const lengths = components.map((c) => c.length).sort((a, b) => a - b);
+  let remaining = Math.max(0, budget);
+  let threshold = 0;
+  for (let i = 0; i < lengths.length; i++) {
+    const share = Math.floor(remaining / (lengths.length - i));
+    if (lengths[i] > share) {
+      threshold = share;
+      break;
+    }
+    remaining -= lengths[i];
+  }
+
+  return components.map((c) =>
+    c.length <= threshold ? c : `${c.substring(0, Math.max(0, threshold - 3))}...`
+  );
+}
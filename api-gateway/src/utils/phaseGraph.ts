@@ -0,0 +1,83 @@
+/**
+ * Dependency-ordered phase runner. No `this`, no services.
+ *
+ * Each node starts as soon as every node it depends on has finished, so
+ * independent branches overlap instead of running one after another. Before a
+ * node is started `shouldStop` is consulted; once it returns true no further
+ * node starts (in-flight ones are awaited) and the promise resolves to true.
+ * A failing node stops new starts the same way and its error is rethrown once
+ * the in-flight nodes have settled.
+ */
+export interface PhaseNode {
+  id: string;
+  deps: string[];
+  run: () => Promise<void>;
+}
+
+export function runPhaseGraph(
+  nodes: PhaseNode[],
+  shouldStop: () => boolean = () => false
+): Promise<boolean> {
+  const remaining = new Map<string, number>();
+  const dependents = new Map<string, PhaseNode[]>();
+  for (const node of nodes) {
+    remaining.set(node.id, node.deps.length);
+  }
+  for (const node of nodes) {
+    for (const dep of node.deps) {
+      if (!remaining.has(dep)) {
+        throw new Error(`Phase "${node.id}" depends on unknown phase "${dep}"`);
+      }
+      const list = dependents.get(dep);
+      if (list) list.push(node);
+      else dependents.set(dep, [node]);
+    }
+  }
+
+  return new Promise<boolean>((resolve, reject) => {
+    const ready = nodes.filter((node) => node.deps.length === 0);
+    let running = 0;
+    let finished = 0;
+    let stopped = false;
+    let failure: { error: unknown } | undefined;
+
+    const pump = () => {
+      while (!failure && !stopped && ready.length > 0) {
+        if (shouldStop()) {
+          stopped = true;
+          break;
+        }
+        const node = ready.shift()!;
+        running++;
+        // Promise.resolve().then so a synchronous throw from run() still settles the node.
+        Promise.resolve()
+          .then(node.run)
+          .then(
+            () => {
+              finished++;
+              for (const dependent of dependents.get(node.id) ?? []) {
+                const left = remaining.get(dependent.id)! - 1;
+                remaining.set(dependent.id, left);
+                if (left === 0) ready.push(dependent);
+              }
+            },
+            (error) => {
+              if (!failure) failure = { error };
+            }
+          )
+          .then(() => {
+            running--;
+            pump();
+          });
+      }
+
+      if (running > 0) return;
+      if (failure) reject(failure.error);
+      else if (stopped) resolve(true);
+      else if (finished < nodes.length) reject(new Error("Phase graph has a dependency cycle"));
+      else resolve(false);
+    };
+
+    pump();
+  });
+}
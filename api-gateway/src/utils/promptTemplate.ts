@@ -0,0 +1,54 @@
+/**
+ * `{{variable}}` prompt templates, split once into literal chunks and named
+ * slots so rendering is a single concatenation pass instead of one regex
+ * replace per variable. Placeholders with no matching variable are left
+ * verbatim; values are inserted as-is (no `$&`-style replacement patterns).
+ * Compiled templates are cached by source text; text without any `{{` is
+ * passed through uncached. Pure.
+ */
+
+const PLACEHOLDER = /\{\{\s*([\w.-]+)\s*\}\}/g;
+const MAX_COMPILED_TEMPLATES = 128;
+
+/** Even indexes are literal text, odd indexes are [name, original placeholder]. */
+export type CompiledTemplate = Array<string | [string, string]>;
+
+const compiledCache = new Map<string, CompiledTemplate>();
+
+/** Split a template into literal/slot parts (cached by template text). */
+export function compileTemplate(template: string): CompiledTemplate {
+  // Already-interpolated text (most fallback prompts) has no slots; don't let
+  // those one-off strings evict real templates from the cache.
+  if (!template.includes("{{")) return [template];
+  const cached = compiledCache.get(template);
+  if (cached) return cached;
+
+  const parts: CompiledTemplate = [];
+  let last = 0;
+  for (const match of template.matchAll(PLACEHOLDER)) {
+    parts.push(template.slice(last, match.index), [match[1], match[0]]);
+    last = match.index! + match[0].length;
+  }
+  parts.push(template.slice(last));
+
+  if (compiledCache.size >= MAX_COMPILED_TEMPLATES) {
+    compiledCache.delete(compiledCache.keys().next().value as string);
+  }
+  compiledCache.set(template, parts);
+  return parts;
+}
+
+/** Render a template with `variables` in one pass over its precompiled parts. */
+export function renderTemplate(template: string, variables: Record<string, string>): string {
+  let out = "";
+  for (const part of compileTemplate(template)) {
+    if (typeof part === "string") {
+      out += part;
+    } else {
+      // Own keys only: `{{constructor}}` must not render Object.prototype members.
+      const value = Object.hasOwn(variables, part[0]) ? variables[part[0]] : undefined;
+      out += value === undefined ? part[1] : value;
+    }
+  }
+  return out;
+}
@@ -44,3 +44,25 @@ export function calculateWordCountCompliance(
   const ratio = actualWordCount / targetWordCount;
   return { compliant: ratio >= 0.7, ratio };
 }
+
+/** Score at which a critique clears the bar outright, even with minor notes. */
+export const REVISION_SKIP_SCORE = 8.5;
+
+/**
+ * Whether a Writer revision round-trip can be skipped for a strong draft.
+ * A score >= REVISION_SKIP_SCORE with no hard failure (word count, scope, or an
+ * explicit veto) means the minor issues the Critic listed are not worth a full
+ * revision call — the scene is treated as approved. `minScore` lets callers
+ * apply the same hard-failure checks at a different bar.
+ */
+export function canSkipRevision(
+  critique: Record<string, unknown>,
+  minScore: number = REVISION_SKIP_SCORE
+): boolean {
+  const score = typeof critique.score === "number" && !isNaN(critique.score) ? critique.score : null;
+  if (score === null || score < minScore) return false;
+  if (critique.wordCountCompliance === false) return false;
+  if (critique.scopeAdherence === false) return false;
+  if (critique.approved === false) return false;
+  return true;
+}
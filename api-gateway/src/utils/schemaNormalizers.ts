@@ -87,6 +87,18 @@ export function normalizeCharacters(raw: unknown): Record<string, unknown>[] {
   return [];
 }
 
+/** Free-form role names mapped to the canonical character roles. */
+const CHARACTER_ROLE_ALIASES: ReadonlyMap<string, string> = new Map([
+  ["hero", "protagonist"],
+  ["villain", "antagonist"],
+  ["main", "protagonist"],
+  ["main character", "protagonist"],
+  ["secondary", "supporting"],
+  ["side", "supporting"],
+  ["side character", "supporting"],
+  ["minor", "supporting"],
+]);
+
 /**
  * Normalize a single character object
  * Handles field name variations and type conversions
@@ -105,18 +117,8 @@ function normalizeCharacter(char: Record<string, unknown>): Record<string, unkno
   }
 
   if (normalized.role && typeof normalized.role === "string") {
-    const roleMap: Record<string, string> = {
-      hero: "protagonist",
-      villain: "antagonist",
-      main: "protagonist",
-      "main character": "protagonist",
-      secondary: "supporting",
-      side: "supporting",
-      "side character": "supporting",
-      minor: "supporting",
-    };
     const lowerRole = normalized.role.toLowerCase();
-    normalized.role = roleMap[lowerRole] || lowerRole;
+    normalized.role = CHARACTER_ROLE_ALIASES.get(lowerRole) ?? lowerRole;
   }
 
   if (!normalized.psychology && normalized.Psychology) {
@@ -0,0 +1,43 @@
+/**
+ * JSON.stringify for the large, phase-owned state blobs (narrative, characters,
+ * worldbuilding, outline) that every agent call re-serializes into its system
+ * prompt. The Writer alone is called several times per scene (beat parts,
+ * expansions, revisions, polish), each time re-serializing the same objects.
+ *
+ * Cached in a WeakMap keyed by the object itself: phases replace these state
+ * fields wholesale (never mutate them in place), so a new value is serialized
+ * afresh and an old one's string is garbage-collected with it. Non-object
+ * values are not cached. Pure.
+ */
+const jsonCache = new WeakMap<object, string>();
+
+export function stringifyCached(value: unknown): string {
+  if (typeof value !== "object" || value === null) return JSON.stringify(value);
+  let json = jsonCache.get(value);
+  if (json === undefined) {
+    json = JSON.stringify(value);
+    jsonCache.set(value, json);
+  }
+  return json;
+}
+
+/**
+ * JSON.parse for those same serialized blobs when a prompt builder needs a
+ * field back out of a prompt variable (e.g. the Worldbuilder's genre). The
+ * variable is usually the exact string stringifyCached returned, so repeated
+ * calls with an unchanged blob parse it once. Bounded to the most recent
+ * PARSE_CACHE_SIZE strings. The returned value is shared: read it, never
+ * mutate it. Throws like JSON.parse on invalid input (failures are not cached).
+ */
+const PARSE_CACHE_SIZE = 16;
+const parseCache = new Map<string, unknown>();
+
+export function parseCached(json: string): unknown {
+  if (parseCache.has(json)) return parseCache.get(json);
+  const value = JSON.parse(json);
+  if (parseCache.size >= PARSE_CACHE_SIZE) {
+    parseCache.delete(parseCache.keys().next().value as string);
+  }
+  parseCache.set(json, value);
+  return value;
+}
@@ -8,3 +8,25 @@
 export function wordCount(text: string): number {
   return text.split(/\s+/).length;
 }
+
+const WHITESPACE = /\s/;
+
+/**
+ * Last `n` whitespace-separated words of `text`, joined by single spaces — the same
+ * result as `text.trim().split(/\s+/).slice(-n).join(" ")` for n >= 1, but found by
+ * scanning backwards from the end so a long scene is not split into a full word array
+ * just to read its tail.
+ */
+export function lastWords(text: string, n: number): string {
+  const words: string[] = [];
+  let end = text.length;
+  while (words.length < n) {
+    while (end > 0 && WHITESPACE.test(text[end - 1])) end--;
+    if (end === 0) break;
+    let start = end;
+    while (start > 0 && !WHITESPACE.test(text[start - 1])) start--;
+    words.push(text.slice(start, end));
+    end = start;
+  }
+  return words.reverse().join(" ");
+}
@@ -2,6 +2,7 @@
  * AgentCard - Individual agent display card with status, content, and editing capabilities
  */
 
+import { useMemo } from 'react';
 import { MarkdownContent } from './MarkdownContent';
 import { FeedbackButtons } from '../FeedbackButtons';
 import {
@@ -67,9 +68,21 @@ export function AgentCard({
   const description = AGENT_DESCRIPTIONS[agent];
   const isActive = activeAgent === agent && !isCancelled;
   const displayMessage = getDisplayMessage(state);
-  const formattedContent = displayMessage ? formatAgentContent(displayMessage.content) : '';
+  const agentContent = getAgentContent(agent);
+  // Every streamed event re-renders all cards; only re-parse content that changed.
+  const displayContent = displayMessage?.content;
+  const formattedContent = useMemo(
+    () => (displayContent ? formatAgentContent(displayContent) : ''),
+    [displayContent]
+  );
+  const fallbackContent = useMemo(
+    () => (formattedContent || !agentContent
+      ? ''
+      : agent === 'Strategist' ? formatStrategistContent(agentContent) : formatAgentContent(agentContent)),
+    [formattedContent, agent, agentContent]
+  );
   const isEditing = editState?.agent === agent;
-  const hasContent = displayMessage || getAgentContent(agent);
+  const hasContent = displayMessage || agentContent;
 
   return (
     <div 
@@ -193,7 +206,7 @@ export function AgentCard({
               </button>
             </div>
           </div>
-        ) : !displayMessage && !getAgentContent(agent) ? (
+        ) : !displayMessage && !agentContent ? (
           <div className="flex items-center justify-center h-full">
             <p className="text-sm text-slate-500 italic">
               {isCancelled ? 'Cancelled' : state.status === 'thinking' ? 'Processing...' : 'Awaiting turn...'}
@@ -201,7 +214,7 @@ export function AgentCard({
           </div>
         ) : (
           <MarkdownContent 
-            content={formattedContent || (agent === 'Strategist' ? formatStrategistContent(getAgentContent(agent)) : formatAgentContent(getAgentContent(agent)))} 
+            content={formattedContent || fallbackContent} 
             className="text-sm" 
           />
         )}
@@ -37,6 +37,11 @@ export function EditConfirmModal({
   onConfirm,
   onCancel,
 }: EditConfirmModalProps) {
+  // Membership sets built once per render so the per-agent rows below don't
+  // rescan the dependency and regenerate lists for every agent.
+  const affectedAgents = new Set<string>(AGENT_DEPENDENCIES[pendingEdit.agent as AgentName] ?? []);
+  const regenerateAgents = new Set(agentsToRegenerate);
+
   return (
     <div className="fixed inset-0 bg-black/70 flex items-center justify-center z-50 p-4">
       <div className="bg-slate-800 border border-slate-700 rounded-xl max-w-2xl w-full max-h-[90vh] overflow-y-auto">
@@ -85,9 +90,9 @@ export function EditConfirmModal({
               <div className="flex items-center justify-center gap-2 flex-wrap">
                 {AGENTS.map((agent, idx) => {
                   const isEdited = agent === pendingEdit.agent;
-                  const isAffected = AGENT_DEPENDENCIES[pendingEdit.agent as AgentName]?.includes(agent as AgentName);
+                  const isAffected = affectedAgents.has(agent);
                   const isLocked = lockedAgents[agent];
-                  const willRegenerate = agentsToRegenerate.includes(agent);
+                  const willRegenerate = regenerateAgents.has(agent);
                   
                   return (
                     <div key={agent} className="flex items-center gap-2">
@@ -143,9 +148,9 @@ export function EditConfirmModal({
             </label>
             <div className="space-y-2">
               {AGENTS.filter(agent => agent !== pendingEdit.agent).map(agent => {
-                const isAffected = AGENT_DEPENDENCIES[pendingEdit.agent as AgentName]?.includes(agent as AgentName);
+                const isAffected = affectedAgents.has(agent);
                 const isLocked = lockedAgents[agent];
-                const willRegenerate = agentsToRegenerate.includes(agent);
+                const willRegenerate = regenerateAgents.has(agent);
                 
                 return (
                   <div 
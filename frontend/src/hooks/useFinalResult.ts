@@ -9,98 +9,72 @@ import type { AgentMessage } from '../types/chat';
 
 export function useFinalResult(messages: AgentMessage[]): string {
   return useMemo(() => {
-    // Helper to deduplicate events by sceneNum, keeping the latest one per scene
-    const dedupeBySceneNum = <T extends { data: { sceneNum?: number } }>(events: T[]): T[] => {
-      const sceneMap = new Map<number, T>();
-      events.forEach(event => {
-        const sceneNum = event.data.sceneNum ?? 0;
-        sceneMap.set(sceneNum, event); // Later events overwrite earlier ones
-      });
-      return Array.from(sceneMap.values());
-    };
+    // Recomputed on every SSE event, so bucket the whole log in ONE pass instead
+    // of re-filtering it once per priority below. Scene-keyed buckets keep the
+    // latest event per scene (later events overwrite earlier ones).
+    const polishCompleteByScene = new Map<number, AgentMessage>();
+    const expandCompleteByScene = new Map<number, AgentMessage>();
+    const polishMessages: AgentMessage[] = [];
+    const writerMessages: AgentMessage[] = [];
+    let completeEvent: AgentMessage | undefined;
+    let lastStoryMessage: AgentMessage | undefined;
 
-    // PRIORITY 1: Use scene_polish_complete events with finalContent (canonical source of truth)
-    const polishCompleteEvents = messages.filter(
-      m => m.type === 'scene_polish_complete' && m.data.finalContent
-    );
-    if (polishCompleteEvents.length > 0) {
-      // Deduplicate by scene number, then sort and join
-      const dedupedEvents = dedupeBySceneNum(polishCompleteEvents);
-      const sortedScenes = dedupedEvents
-        .sort((a, b) => (a.data.sceneNum || 0) - (b.data.sceneNum || 0))
-        .map(m => m.data.finalContent as string)
-        .filter(text => text?.trim());
-      
-      if (sortedScenes.length > 0) {
-        return sortedScenes.join('\n\n---\n\n');
+    for (const m of messages) {
+      if (m.type === 'agent_message') {
+        if ((m.data.agent === 'Polish' || m.data.agent === 'Writer') && m.data.content?.trim()) {
+          (m.data.agent === 'Polish' ? polishMessages : writerMessages).push(m);
+          lastStoryMessage = m;
+        }
+      } else if (m.type === 'scene_polish_complete') {
+        if (m.data.finalContent) polishCompleteByScene.set(m.data.sceneNum ?? 0, m);
+      } else if (m.type === 'scene_expand_complete') {
+        if (m.data.assembledContent) expandCompleteByScene.set(m.data.sceneNum ?? 0, m);
+      } else if (m.type === 'generation_complete' && !completeEvent) {
+        completeEvent = m;
       }
     }
 
-    // PRIORITY 2: Use scene_expand_complete events with assembledContent (for scenes without polish)
-    const expandCompleteEvents = messages.filter(
-      m => m.type === 'scene_expand_complete' && m.data.assembledContent
-    );
-    if (expandCompleteEvents.length > 0) {
-      // Deduplicate by scene number, then sort and join
-      const dedupedEvents = dedupeBySceneNum(expandCompleteEvents);
-      const sortedScenes = dedupedEvents
+    // Sort scene-keyed events and join the non-empty texts
+    const joinScenes = (events: Map<number, AgentMessage>, field: 'finalContent' | 'assembledContent'): string =>
+      Array.from(events.values())
         .sort((a, b) => (a.data.sceneNum || 0) - (b.data.sceneNum || 0))
-        .map(m => m.data.assembledContent as string)
-        .filter(text => text?.trim());
-      
-      if (sortedScenes.length > 0) {
-        return sortedScenes.join('\n\n---\n\n');
-      }
-    }
+        .map(m => m.data[field] as string)
+        .filter(text => text?.trim())
+        .join('\n\n---\n\n');
 
-    // PRIORITY 3: Collect Polish agent messages, deduplicate by sceneNum
-    const polishMessages = messages.filter(
-      m => m.type === 'agent_message' && m.data.agent === 'Polish' && m.data.content?.trim()
-    );
-    if (polishMessages.length > 0) {
-      // Deduplicate by sceneNum - keep only the latest Polish message per scene
+    // Keep only the latest extracted agent text per scene, in scene order
+    const joinAgentScenes = (agentMessages: AgentMessage[], agent: 'Polish' | 'Writer'): string => {
       const sceneMap = new Map<number, string>();
-      polishMessages.forEach(m => {
+      agentMessages.forEach(m => {
         const sceneNum = m.data.sceneNum ?? 0;
-        const text = extractStoryText(m.data.content || '', 'Polish');
+        const text = extractStoryText(m.data.content || '', agent);
         if (text.trim()) {
           sceneMap.set(sceneNum, text);
         }
       });
-      
-      if (sceneMap.size > 0) {
-        const sortedScenes = Array.from(sceneMap.entries())
-          .sort((a, b) => a[0] - b[0])
-          .map(([, text]) => text);
-        return sortedScenes.join('\n\n---\n\n');
-      }
-    }
-    
+      return Array.from(sceneMap.entries())
+        .sort((a, b) => a[0] - b[0])
+        .map(([, text]) => text)
+        .join('\n\n---\n\n');
+    };
+
+    // PRIORITY 1: Use scene_polish_complete events with finalContent (canonical source of truth)
+    const polished = joinScenes(polishCompleteByScene, 'finalContent');
+    if (polished) return polished;
+
+    // PRIORITY 2: Use scene_expand_complete events with assembledContent (for scenes without polish)
+    const expanded = joinScenes(expandCompleteByScene, 'assembledContent');
+    if (expanded) return expanded;
+
+    // PRIORITY 3: Collect Polish agent messages, deduplicate by sceneNum
+    const polishText = joinAgentScenes(polishMessages, 'Polish');
+    if (polishText) return polishText;
+
     // PRIORITY 4: Fall back to Writer's messages, deduplicate by sceneNum
-    const writerMessages = messages.filter(
-      m => m.type === 'agent_message' && m.data.agent === 'Writer' && m.data.content?.trim()
-    );
-    if (writerMessages.length > 0) {
-      // Deduplicate by sceneNum - keep only the latest Writer message per scene
-      const sceneMap = new Map<number, string>();
-      writerMessages.forEach(m => {
-        const sceneNum = m.data.sceneNum ?? 0;
-        const text = extractStoryText(m.data.content || '', 'Writer');
-        if (text.trim()) {
-          sceneMap.set(sceneNum, text);
-        }
-      });
-      
-      if (sceneMap.size > 0) {
-        const sortedScenes = Array.from(sceneMap.entries())
-          .sort((a, b) => a[0] - b[0])
-          .map(([, text]) => text);
-        return sortedScenes.join('\n\n---\n\n');
-      }
-    }
-    
+    const writerText = joinAgentScenes(writerMessages, 'Writer');
+    if (writerText) return writerText;
+
     // PRIORITY 5: Try generation_complete result_summary as fallback
-    const completeEvent = messages.find(m => m.type === 'generation_complete');
     if (completeEvent?.data.result_summary) {
       // Try to extract story text from result_summary too
       const extracted = extractStoryText(
@@ -114,22 +88,14 @@ export function useFinalResult(messages: AgentMessage[]): string {
         ? completeEvent.data.result_summary
         : JSON.stringify(completeEvent.data.result_summary, null, 2);
     }
-    
+
     // PRIORITY 6: Fall back to last substantial STORY agent message only (Writer or Polish)
-    const storyAgentMessages = messages.filter(
-      m => m.type === 'agent_message' && 
-           (m.data.agent === 'Writer' || m.data.agent === 'Polish') &&
-           m.data.content?.trim()
-    );
-    if (storyAgentMessages.length > 0) {
-      const lastMsg = storyAgentMessages[storyAgentMessages.length - 1];
-      if (lastMsg) {
-        const extracted = extractStoryText(lastMsg.data.content ?? '', 'other');
-        if (extracted) return extracted;
-        return lastMsg.data.content ?? '';
-      }
+    if (lastStoryMessage) {
+      const extracted = extractStoryText(lastStoryMessage.data.content ?? '', 'other');
+      if (extracted) return extracted;
+      return lastStoryMessage.data.content ?? '';
     }
-    
+
     return '';
   }, [messages]);
 }
@@ -100,6 +100,8 @@ export const AGENTS = ['Architect', 'Profiler', 'Worldbuilder', 'Narrator', 'Str
 
 export type AgentName = typeof AGENTS[number];
 
+const AGENT_SET: ReadonlySet<string> = new Set(AGENTS);
+
 export const AGENT_DEPENDENCIES: Record<AgentName, AgentName[]> = {
   Architect: ['Profiler', 'Worldbuilder', 'Narrator', 'Strategist', 'Writer', 'Critic', 'Polish', 'Archivist'],
   Profiler: ['Worldbuilder', 'Narrator', 'Strategist', 'Writer', 'Critic', 'Polish', 'Archivist'],
@@ -212,7 +214,7 @@ export interface AgentState {
 export function normalizeAgentName(name: string | undefined): string | undefined {
   if (!name) return undefined;
   const normalized = name.charAt(0).toUpperCase() + name.slice(1).toLowerCase();
-  if (AGENTS.includes(normalized as AgentName)) {
+  if (AGENT_SET.has(normalized)) {
     return normalized;
   }
   return name;